@@ -0,0 +1,362 @@
+"""
+Benchmark: data-layer hot paths at 1x / 10x / 100x of the datasource
+
+Seeds a SQLite file per scale (benchmarks.seed) and times each rest.api
+entry point in its own spawned process, so peak RSS is per case:
+
+- wall time per call (min / median / mean over the iterations),
+- peak RSS of the process and its growth over the post-import baseline,
+- SQL statements executed per call (engine cursor events).
+
+Results are written as JSON with stable key order, so a saved baseline
+can be diffed or compared against a new run:
+
+    python -m benchmarks.bench_api --save benchmarks/baseline.json
+    python -m benchmarks.bench_api --compare benchmarks/baseline.json
+
+--compare exits non-zero when a case's median slows down by more than
+--threshold percent or it issues more statements than the baseline.
+--url benchmarks an already-loaded database (e.g. the Docker MySQL)
+instead of seeding SQLite; it is reported under the scale "url".
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+SCALES = [1, 10, 100]
+DEFAULT_DATA_DIR = Path(tempfile.gettempdir()) / "edgewater_bench"
+DEFAULT_THRESHOLD = 25.0
+
+# case name -> (factory name, iterations). Factories run in the child
+# process and return (call, teardown); teardown undoes benchmark writes.
+CASES: Dict[str, Tuple[str, int]] = {
+    "load_table[T_Items]": ("_case_load_items", 5),
+    "load_table[v_orders_full]": ("_case_load_orders_view", 3),
+    "get_all[T_OrderItems]": ("_case_get_all_order_items", 3),
+    "get_all[T_Plantings by item]": ("_case_get_all_filtered", 5),
+    "get_table_sorted[v_orders_full]": ("_case_sorted_orders", 3),
+    "get_table_sorted[v_plantings_full]": ("_case_sorted_plantings", 3),
+    "get_orders_summary[cold]": ("_case_summary_cold", 3),
+    "get_orders_summary[warm]": ("_case_summary_warm", 10),
+    "create[T_Pitch]": ("_case_create_pitch", 50),
+    "generic_update[T_Inventory]": ("_case_update_inventory", 50),
+    "get_next_id[T_Pitch]": ("_case_next_id", 500),
+}
+
+
+# ================================================================
+# Cases (imported lazily: the parent process never loads rest.api)
+# ================================================================
+
+
+def _case_load_items(api):
+    from models import Item
+    from rest.api import _load_table
+
+    return lambda: len(_load_table(Item, "items")), None
+
+
+def _case_load_orders_view(api):
+    from models import OrdersFullView
+    from rest.api import LOADER_STREAM, _load_table
+
+    return (
+        lambda: len(_load_table(OrdersFullView, "orders view", loader=LOADER_STREAM)),
+        None,
+    )
+
+
+def _case_get_all_order_items(api):
+    from models import OrderItem
+
+    return lambda: len(api._get_all(OrderItem)), None
+
+
+def _case_get_all_filtered(api):
+    from sqlalchemy import select
+
+    from database import get_db_session
+    from models import Planting
+
+    with get_db_session() as session:
+        item_id = session.execute(select(Planting.ItemID).limit(1)).scalar()
+
+    return lambda: len(api._get_all(Planting, filters={"ItemID": item_id})), None
+
+
+def _case_sorted_orders(api):
+    return lambda: len(api.get_orders_view_full()), None
+
+
+def _case_sorted_plantings(api):
+    return lambda: len(api.get_plantings_view_full()), None
+
+
+def _case_summary_cold(api):
+    from rest.api import _VIEW_STORE
+
+    def call():
+        _VIEW_STORE.invalidate("_order_summary_view")
+        return len(api.get_orders_summary())
+
+    return call, None
+
+
+def _case_summary_warm(api):
+    return lambda: len(api.get_orders_summary()), None
+
+
+def _case_create_pitch(api):
+    from sqlalchemy import delete, select
+
+    from database import get_db_session
+    from models import Pitch
+
+    with get_db_session() as session:
+        template = dict(
+            session.execute(select(Pitch.__table__).limit(1)).mappings().one()
+        )
+    template.pop("PitchID")
+    created = []
+
+    # IDs come from the allocator first, as _table_add does
+    def call():
+        record = {**template, "PitchID": api._get_next_id(Pitch, "PitchID")}
+        created.append(api._create(Pitch, record)["PitchID"])
+        return 1
+
+    def teardown():
+        with get_db_session() as session:
+            session.execute(delete(Pitch).where(Pitch.PitchID.in_(created)))
+
+    return call, teardown
+
+
+def _case_update_inventory(api):
+    from sqlalchemy import select
+
+    from database import get_db_session
+    from models import Inventory
+
+    with get_db_session() as session:
+        inventory_id, units = session.execute(
+            select(Inventory.InventoryID, Inventory.NumberOfUnits).limit(1)
+        ).one()
+
+    # Writes the current value back: the UPDATE still runs, the data is unchanged
+    def call():
+        api.generic_update(
+            Inventory, "InventoryID", inventory_id, {"NumberOfUnits": units}
+        )
+        return 1
+
+    return call, None
+
+
+def _case_next_id(api):
+    from models import Pitch
+
+    def call():
+        api._get_next_id(Pitch, "PitchID")
+        return 1
+
+    return call, None
+
+
+# ================================================================
+# Runner
+# ================================================================
+
+
+def _rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_case(url: str, case: str) -> dict:
+    """Child-process entry point: time one case against `url`."""
+    from sqlalchemy import create_engine, event
+
+    from streamlit.logger import set_log_level
+
+    # No Streamlit runtime here: silence the cache "No runtime found" warnings
+    set_log_level("error")
+    logger.remove()
+    import database
+    from rest.api import EdgewaterAPI
+
+    engine = create_engine(url)
+    database.Session.remove()
+    database.Session.configure(bind=engine)
+    statements = [0]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements[0] += 1
+
+    api = EdgewaterAPI()
+    factory, iterations = CASES[case]
+    call, teardown = globals()[factory](api)
+    baseline_rss = _rss_mb()
+
+    rows = call()  # warm-up: connection pool, statement caches
+    timings = []
+    statements[0] = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    executed = statements[0]
+    peak_rss = _rss_mb()
+    if teardown is not None:
+        teardown()
+    engine.dispose()
+
+    return {
+        "iterations": iterations,
+        "rows": rows,
+        "wall_ms": {
+            "min": round(min(timings), 3),
+            "median": round(statistics.median(timings), 3),
+            "mean": round(statistics.fmean(timings), 3),
+        },
+        "statements_per_call": round(executed / iterations, 2),
+        "peak_rss_mb": round(peak_rss, 1),
+        "rss_growth_mb": round(peak_rss - baseline_rss, 1),
+    }
+
+
+def _run_isolated(url: str, case: str) -> dict:
+    # A fresh spawned process per case keeps ru_maxrss specific to that case
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_run_case, url, case).result()
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_suite(
+    scales, cases, data_dir: Path, reseed: bool, url: Optional[str]
+) -> dict:
+    targets = {"url": url} if url else {}
+    if not url:
+        from benchmarks.seed import seed_sqlite
+
+        for scale in scales:
+            path = Path(data_dir) / f"edgewater_{scale}x.sqlite"
+            if reseed or not path.exists():
+                seed_sqlite(path, scale=scale).dispose()
+            targets[f"{scale}x"] = f"sqlite:///{path}"
+
+    results = {}
+    for label, target in targets.items():
+        results[label] = {}
+        for case in cases:
+            result = _run_isolated(target, case)
+            results[label][case] = result
+            print(
+                f"{label:>5}  {case:<36} {result['wall_ms']['median']:>10.2f} ms"
+                f"  {result['statements_per_call']:>6} stmts"
+                f"  {result['peak_rss_mb']:>8.1f} MiB"
+            )
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": "url" if url else "sqlite",
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    """Print per-case changes against `baseline`; True if any regressed."""
+    regressed = False
+    print(
+        f"\n{'scale':>5}  {'case':<36} {'base ms':>10} {'now ms':>10} "
+        f"{'change':>8}  stmts"
+    )
+    for label, cases in current["results"].items():
+        for case, now in cases.items():
+            before = baseline.get("results", {}).get(label, {}).get(case)
+            if before is None:
+                print(f"{label:>5}  {case:<36} {'(new)':>10}")
+                continue
+            base_ms = before["wall_ms"]["median"]
+            now_ms = now["wall_ms"]["median"]
+            change = (now_ms - base_ms) / base_ms * 100 if base_ms else 0.0
+            more_statements = (
+                now["statements_per_call"] > before["statements_per_call"]
+            )
+            flag = ""
+            if change > threshold or more_statements:
+                regressed = True
+                flag = "  REGRESSION"
+            print(
+                f"{label:>5}  {case:<36} {base_ms:>10.2f} {now_ms:>10.2f} "
+                f"{change:>+7.1f}%  {before['statements_per_call']}"
+                f" -> {now['statements_per_call']}{flag}"
+            )
+    return regressed
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Edgewater data-layer benchmarks")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    parser.add_argument(
+        "--cases", nargs="+", help="Only cases containing one of these substrings"
+    )
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    parser.add_argument("--reseed", action="store_true")
+    parser.add_argument("--url", help="Benchmark an existing database instead")
+    parser.add_argument("--save", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    cases = [
+        case
+        for case in CASES
+        if not args.cases or any(part in case for part in args.cases)
+    ]
+    report = run_suite(args.scales, cases, args.data_dir, args.reseed, args.url)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(f"\nSaved {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(baseline, report, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,84 @@
+"""
+Benchmark: ID allocation cost as tables grow
+
+Compares the old `_get_next_id` (load the whole table into a DataFrame and
+take max + 1) with the T_IdSequences allocator, on T_OrderItems sized like
+today's data and 10x / 100x of it. Runs against an in-memory SQLite copy of
+the schema, so no MySQL container is needed.
+
+Usage (from the project root):
+    python -m benchmarks.bench_id_allocation
+"""
+
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine, insert
+from sqlalchemy.pool import StaticPool
+
+import database
+from models import IdSequence, OrderItem
+from rest.id_allocator import IdAllocator
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+ALLOCATIONS = 200
+
+
+def _legacy_next_id(model_class, id_column: str) -> int:
+    """Pre-allocator implementation: full table -> DataFrame -> max + 1."""
+    with database.get_db_session() as session:
+        rows = session.query(model_class).all()
+        df = pd.DataFrame(
+            [
+                {k: v for k, v in r.__dict__.items() if k != "_sa_instance_state"}
+                for r in rows
+            ]
+        )
+    return 1 if df.empty else int(df[id_column].max()) + 1
+
+
+def _time_per_call(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def run():
+    print(f"{'rows':>8}  {'legacy ms/id':>13}  {'allocator ms/id':>16}")
+    for n_rows in ROW_COUNTS:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        database.Session.remove()
+        database.Session.configure(bind=engine)
+        database.Base.metadata.create_all(
+            engine, tables=[OrderItem.__table__, IdSequence.__table__]
+        )
+        with engine.begin() as conn:
+            conn.execute(
+                insert(OrderItem.__table__),
+                [
+                    {"OrderItemID": i, "ItemCode": f"IC{i}", "NumberOfUnits": "1"}
+                    for i in range(1, n_rows + 1)
+                ],
+            )
+
+        # The legacy path is slow enough that a few calls give a stable mean
+        legacy_ms = _time_per_call(
+            lambda: _legacy_next_id(OrderItem, "OrderItemID"),
+            calls=max(3, ALLOCATIONS // (n_rows // 1_000)),
+        )
+        allocator = IdAllocator(block_size=1)
+        allocator.allocate(OrderItem, "OrderItemID")  # seed the counter row
+        allocator_ms = _time_per_call(
+            lambda: allocator.allocate(OrderItem, "OrderItemID"), ALLOCATIONS
+        )
+        print(f"{n_rows:>8}  {legacy_ms:>13.2f}  {allocator_ms:>16.3f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,93 @@
+"""
+Benchmark: ORM vs. columnar vs. streamed result loading
+
+Loads v_orders_full-shaped data (every column of OrdersFullView) through
+each loader mode of rest.api._load_table and reports wall time and peak
+Python memory (tracemalloc). The view is materialized as a plain table in
+an in-memory SQLite database, so no MySQL container is needed.
+
+Usage (from the project root):
+    python -m benchmarks.bench_loaders
+"""
+
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from loguru import logger
+from sqlalchemy import Boolean, DateTime, Float, Integer, create_engine, insert
+from sqlalchemy.pool import StaticPool
+
+import database
+from models import OrdersFullView
+from rest.api import LOADER_COLUMNAR, LOADER_ORM, LOADER_STREAM, _load_table
+
+ROW_COUNTS = [10_000, 40_000]
+LOADERS = [LOADER_ORM, LOADER_COLUMNAR, LOADER_STREAM]
+
+
+def _fake_value(column, i: int):
+    if column.primary_key:
+        return i
+    if isinstance(column.type, Boolean):
+        return i % 2 == 0
+    if isinstance(column.type, Integer):
+        return i % 500
+    if isinstance(column.type, Float):
+        return (i % 1000) / 10
+    if isinstance(column.type, DateTime):
+        return datetime(2020, 1, 1) + timedelta(days=i % 2000)
+    return f"{column.key} {i % 3000}"
+
+
+def _seed(engine, n_rows: int) -> None:
+    table = OrdersFullView.__table__
+    database.Base.metadata.create_all(engine, tables=[table])
+    columns = list(table.columns)
+    with engine.begin() as conn:
+        for start in range(1, n_rows + 1, 5_000):
+            conn.execute(
+                insert(table),
+                [
+                    {c.key: _fake_value(c, i) for c in columns}
+                    for i in range(start, min(start + 5_000, n_rows + 1))
+                ],
+            )
+
+
+def _measure(loader: str):
+    # Timed and traced separately: tracemalloc slows allocation-heavy paths
+    start = time.perf_counter()
+    df = _load_table(OrdersFullView, "orders view", loader=loader)
+    elapsed = time.perf_counter() - start
+    rows = len(df)
+    del df
+
+    tracemalloc.start()
+    _load_table(OrdersFullView, "orders view", loader=loader)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed * 1000, peak / 1024 / 1024
+
+
+def run():
+    logger.remove()
+    print(f"{'rows':>8}  {'loader':<9}  {'ms':>9}  {'peak MiB':>9}")
+    for n_rows in ROW_COUNTS:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        database.Session.remove()
+        database.Session.configure(bind=engine)
+        _seed(engine, n_rows)
+        for loader in LOADERS:
+            rows, ms, peak = _measure(loader)
+            assert rows == n_rows, f"{loader} returned {rows} rows"
+            print(f"{n_rows:>8}  {loader:<9}  {ms:>9.1f}  {peak:>9.1f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,246 @@
+"""
+Seed a local benchmark database from database/datasource/*.csv
+
+Builds the schema from models.py (plus T_PlantingDestinations, the journal
+and the views from database/views.sql) in a SQLite file, then loads the
+shipped CSVs with the same column mapping as LoadData.sql: empty strings
+become NULL, True/TRUE/1 flags become booleans and M/D/YY or ISO dates are
+both accepted.
+
+`scale` multiplies the transactional history (orders, order items and
+their destinations, plantings, inventory counts, pitches). Each extra copy
+gets its primary keys and OrderID/OrderItemID references offset past the
+previous copy, so foreign keys stay valid. Lookup tables and the item
+catalog are loaded once: the catalog does not grow with years of history.
+
+Usage (from the project root):
+    python -m benchmarks.seed --scale 10 --path /tmp/edgewater_10x.sqlite
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric, text
+from sqlalchemy import create_engine, insert
+
+import database
+from models import (
+    Broker,
+    GrowingSeason,
+    Inventory,
+    Item,
+    ItemType,
+    Location,
+    Order,
+    OrderItem,
+    OrderItemDestination,
+    OrderItemType,
+    OrderNote,
+    Pitch,
+    Planting,
+    Price,
+    Shipper,
+    Supplier,
+    Unit,
+    UnitCategory,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATASOURCE_DIR = PROJECT_ROOT / "database" / "datasource"
+VIEWS_SQL = PROJECT_ROOT / "database" / "views.sql"
+
+INSERT_CHUNK_SIZE = 20_000
+_TRUE_VALUES = {"True", "TRUE", "true", "1"}
+
+# CSV -> (model, CSV column order). None means the model's column order,
+# which LoadData.sql uses for every file except OrderItemDestination.
+DATASOURCE_TABLES: Dict[str, Tuple[type, Optional[List[str]]]] = {
+    "ItemType.csv": (ItemType, None),
+    "UnitCategory.csv": (UnitCategory, None),
+    "Units.csv": (Unit, None),
+    "Brokers.csv": (Broker, None),
+    "Shippers.csv": (Shipper, None),
+    "Suppliers.csv": (Supplier, None),
+    "GrowingSeason.csv": (GrowingSeason, None),
+    "OrderItemTypes.csv": (OrderItemType, None),
+    "OrderNotes.csv": (OrderNote, None),
+    "Locations.csv": (Location, None),
+    "Items.csv": (Item, None),
+    "Prices.csv": (Price, None),
+    "Plantings.csv": (Planting, None),
+    "Inventory.csv": (Inventory, None),
+    "Pitch.csv": (Pitch, None),
+    "Orders.csv": (Order, None),
+    "OrderItems.csv": (OrderItem, None),
+    "OrderItemDestination.csv": (
+        OrderItemDestination,
+        ["OrderItemID", "Count", "UnitID", "LocationID"],
+    ),
+}
+
+# Tables replicated by `scale`: primary key plus {fk column: referenced table}
+SCALED_TABLES: Dict[str, Tuple[Optional[str], Dict[str, str]]] = {
+    "T_Orders": ("OrderID", {}),
+    "T_OrderItems": ("OrderItemID", {"OrderID": "T_Orders"}),
+    "T_OrderItemDestination": (None, {"OrderItemID": "T_OrderItems"}),
+    "T_Plantings": ("PlantingID", {}),
+    "T_Inventory": ("InventoryID", {}),
+    "T_Pitch": ("PitchID", {}),
+}
+
+# Not modeled (or managed by triggers in MySQL) but needed by the views
+_EXTRA_DDL = [
+    "CREATE TABLE T_PlantingDestinations (PlantingDestinationID INTEGER "
+    "PRIMARY KEY, PlantingID INTEGER, LocationID INTEGER, UnitsDestined TEXT, "
+    "PurposeComments TEXT)",
+    "CREATE TABLE T_ChangeJournal (ChangeID INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "TableName VARCHAR(64) NOT NULL, RowID INTEGER NOT NULL, "
+    "Operation VARCHAR(1) NOT NULL, ChangedAt DATETIME NOT NULL)",
+]
+_SKIPPED_TABLES = {"T_Users", "T_Passwords", "T_ChangeJournal"}
+_VIEW_PATTERN = re.compile(r"CREATE VIEW `(\w+)` AS(.*?);", re.S)
+
+
+def read_datasource(
+    source_dir: Path = DATASOURCE_DIR,
+) -> Dict[str, pd.DataFrame]:
+    """Read every mapped CSV into a typed DataFrame keyed by table name."""
+    frames = {}
+    for filename, (model_class, csv_columns) in DATASOURCE_TABLES.items():
+        path = Path(source_dir) / filename
+        if not path.exists():
+            logger.warning(f"Skipping missing datasource file {path}")
+            continue
+        table = model_class.__table__
+        columns = csv_columns or [c.name for c in table.columns]
+        # Positional like LOAD DATA: some headers carry a BOM or are mangled
+        raw = pd.read_csv(
+            path,
+            header=None,
+            skiprows=1,
+            names=columns,
+            usecols=range(len(columns)),
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8-sig",
+        )
+        frames[table.name] = _coerce(raw, table)
+    return frames
+
+
+def _coerce(raw: pd.DataFrame, table) -> pd.DataFrame:
+    df = pd.DataFrame(index=raw.index)
+    for name in raw.columns:
+        column_type = table.columns[name].type
+        values = raw[name].str.strip().replace("", None)
+        if isinstance(column_type, Boolean):
+            df[name] = values.isin(_TRUE_VALUES)
+        elif isinstance(column_type, (DateTime, Date)):
+            df[name] = pd.to_datetime(values, format="mixed", errors="coerce")
+        elif isinstance(column_type, Integer):
+            numbers = pd.to_numeric(values, errors="coerce")
+            df[name] = numbers.round().astype("Int64")
+        elif isinstance(column_type, (Float, Numeric)):
+            df[name] = pd.to_numeric(values, errors="coerce")
+        else:
+            df[name] = values
+    return df
+
+
+def scaled_copies(
+    frames: Dict[str, pd.DataFrame], table_name: str, scale: int
+) -> Iterator[pd.DataFrame]:
+    """Yield `scale` copies of a table with keys offset per copy."""
+    base = frames[table_name]
+    if table_name not in SCALED_TABLES:
+        yield base
+        return
+    pk, references = SCALED_TABLES[table_name]
+    strides = {
+        column: int(frames[target][SCALED_TABLES[target][0]].max()) + 1
+        for column, target in references.items()
+        if target in frames and not frames[target].empty
+    }
+    pk_stride = int(base[pk].max()) + 1 if pk and not base.empty else 0
+    for copy in range(scale):
+        if copy == 0:
+            yield base
+            continue
+        df = base.copy()
+        if pk:
+            df[pk] = df[pk] + copy * pk_stride
+        for column, stride in strides.items():
+            df[column] = df[column] + copy * stride
+        yield df
+
+
+def create_schema(engine) -> None:
+    """Create tables from the models plus the SQLite-compatible views."""
+    tables = [
+        t
+        for name, t in database.Base.metadata.tables.items()
+        if not name.startswith("v_") and name not in _SKIPPED_TABLES
+    ]
+    database.Base.metadata.create_all(engine, tables=tables)
+    with engine.begin() as conn:
+        for ddl in _EXTRA_DDL:
+            conn.execute(text(ddl))
+        for match in _VIEW_PATTERN.finditer(VIEWS_SQL.read_text()):
+            conn.execute(text(f"CREATE VIEW {match.group(1)} AS {match.group(2)}"))
+
+
+def _records(df: pd.DataFrame) -> List[dict]:
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def seed_database(
+    engine, scale: int = 1, source_dir: Path = DATASOURCE_DIR
+) -> Dict[str, int]:
+    """Create the schema in `engine` and load the datasource at `scale`x."""
+    create_schema(engine)
+    frames = read_datasource(source_dir)
+    counts = {}
+    with engine.begin() as conn:
+        for table_name in frames:
+            table = database.Base.metadata.tables[table_name]
+            total = 0
+            for df in scaled_copies(frames, table_name, scale):
+                for start in range(0, len(df), INSERT_CHUNK_SIZE):
+                    chunk = df.iloc[start : start + INSERT_CHUNK_SIZE]
+                    conn.execute(insert(table), _records(chunk))
+                total += len(df)
+            counts[table_name] = total
+    return counts
+
+
+def seed_sqlite(path: Path, scale: int = 1, source_dir: Path = DATASOURCE_DIR):
+    """Seed a fresh SQLite file at `path` and return its engine."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    engine = create_engine(f"sqlite:///{path}")
+    start = time.perf_counter()
+    counts = seed_database(engine, scale=scale, source_dir=source_dir)
+    logger.info(
+        f"Seeded {path.name} at {scale}x: {sum(counts.values())} rows in "
+        f"{time.perf_counter() - start:.1f}s"
+    )
+    return engine
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--path", type=Path, required=True)
+    parser.add_argument("--source", type=Path, default=DATASOURCE_DIR)
+    args = parser.parse_args()
+    seed_sqlite(args.path, scale=args.scale, source_dir=args.source)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,400 @@
+"""
+Synthetic datasource generator: N-times-larger copies of database/datasource
+
+Learns a profile from the shipped CSVs and writes a new datasource
+directory with the same files and column layout, so the output loads
+through LoadData.sql (mount it as /var/lib/mysql-files) or through
+benchmarks.seed --source.
+
+- Every non-key column is sampled from its empirical distribution
+  (value frequencies, NULL rate included), one column at a time.
+- Parent/child tables follow the source fan-outs: each generated order
+  draws its number of order items from the observed items-per-order
+  histogram (likewise destinations per order item, prices per item).
+- Other foreign keys (Relationships.sql) are sampled from the values the
+  source actually uses, so popular items stay popular; source orphans
+  are treated as NULL, so the output has none.
+
+History (orders, plantings, inventory counts, pitches) grows by --scale.
+The catalog (items with their prices, suppliers) grows by --catalog-scale:
+block 0 is the shipped catalog (orphans nulled or dropped), block k repeats
+its IDs offset by k * (max ID + 1) with sampled values. Lookup tables are
+copied as is.
+
+Rows are generated and appended in chunks with vectorized numpy sampling,
+so memory stays flat and 10M order items is a few minutes of work:
+
+    python -m benchmarks.synth --scale 260 --out /tmp/edgewater_260x
+    python -m benchmarks.seed --source /tmp/edgewater_260x --path /tmp/260x.sqlite
+"""
+
+import argparse
+import re
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sqlalchemy import Boolean
+
+import database
+from benchmarks.seed import DATASOURCE_DIR, DATASOURCE_TABLES, read_datasource
+
+RELATIONSHIPS_SQL = DATASOURCE_DIR.parent / "Relationships.sql"
+CHUNK_ROWS = 500_000  # target generated rows held in memory at once
+
+HISTORY_TABLES = ["T_Orders", "T_Plantings", "T_Inventory", "T_Pitch"]
+CATALOG_TABLES = ["T_Items", "T_Suppliers"]
+# child -> (fk column, parent): generated per parent row from the fan-out
+FANOUT_CHILDREN: Dict[str, Tuple[str, str]] = {
+    "T_OrderItems": ("OrderID", "T_Orders"),
+    "T_OrderItemDestination": ("OrderItemID", "T_OrderItems"),
+    "T_Prices": ("ItemID", "T_Items"),
+}
+
+_FK_PATTERN = re.compile(
+    r"ALTER TABLE `(\w+)`\s+ADD CONSTRAINT `\w+`\s+"
+    r"FOREIGN KEY \(`(\w+)`\) REFERENCES `(\w+)`\(`(\w+)`\)"
+)
+_CSV_FILES = {
+    model.__tablename__: name for name, (model, _) in DATASOURCE_TABLES.items()
+}
+
+
+def read_foreign_keys(
+    path: Path = RELATIONSHIPS_SQL,
+) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """(table, column) -> (parent table, parent column) from Relationships.sql."""
+    return {
+        (table, column): (parent, parent_column)
+        for table, column, parent, parent_column in _FK_PATTERN.findall(
+            Path(path).read_text()
+        )
+    }
+
+
+# ================================================================
+# Profile
+# ================================================================
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    """Empirical distribution of one column (NULL is one of the values)."""
+
+    values: pd.Series
+    weights: np.ndarray
+
+    @classmethod
+    def learn(cls, column: pd.Series) -> "ColumnProfile":
+        counts = column.value_counts(dropna=False)
+        if counts.empty:
+            counts = pd.Series([1], index=pd.Index([None], dtype=column.dtype))
+        return cls(
+            values=pd.Series(counts.index, dtype=column.dtype),
+            weights=(counts / counts.sum()).to_numpy(dtype=float),
+        )
+
+    def sample(self, rng: np.random.Generator, n: int) -> pd.Series:
+        picks = rng.choice(len(self.values), size=n, p=self.weights)
+        return self.values.take(picks).reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class FanoutProfile:
+    """Children-per-parent histogram, zero included."""
+
+    counts: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def learn(cls, child_keys: pd.Series, parent_keys: pd.Series) -> "FanoutProfile":
+        per_parent = child_keys.value_counts().reindex(parent_keys, fill_value=0)
+        histogram = per_parent.value_counts(normalize=True)
+        return cls(
+            counts=histogram.index.to_numpy(dtype=np.int64),
+            weights=histogram.to_numpy(dtype=float),
+        )
+
+    @property
+    def mean(self) -> float:
+        return float((self.counts * self.weights).sum())
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.choice(self.counts, size=n, p=self.weights)
+
+
+@dataclass(frozen=True)
+class TableProfile:
+    table: str
+    pk: Optional[str]
+    columns: List[str]  # CSV order
+    rows: int
+    max_id: int
+    values: Dict[str, ColumnProfile]
+    references: Dict[str, str]  # fk column -> parent table (non fan-out)
+
+
+def learn_profiles(
+    frames: Dict[str, pd.DataFrame],
+    foreign_keys: Dict[Tuple[str, str], Tuple[str, str]],
+) -> Tuple[Dict[str, TableProfile], Dict[str, FanoutProfile]]:
+    """Per-table column distributions plus the fan-out of each child table."""
+    profiles = {}
+    for name, df in frames.items():
+        pk = _primary_key(name)
+        fanout_fk = FANOUT_CHILDREN.get(name, (None,))[0]
+        values, references = {}, {}
+        for column in df.columns:
+            if column in (pk, fanout_fk):
+                continue
+            series = df[column]
+            parent = foreign_keys.get((name, column))
+            if parent is not None and parent[0] in frames:
+                parent_ids = frames[parent[0]][parent[1]]
+                series = series.where(series.isin(parent_ids))
+                references[column] = parent[0]
+            values[column] = ColumnProfile.learn(series)
+        profiles[name] = TableProfile(
+            table=name,
+            pk=pk,
+            columns=list(df.columns),
+            rows=len(df),
+            max_id=int(df[pk].max()) if pk and not df.empty else 0,
+            values=values,
+            references=references,
+        )
+    fanouts = {
+        child: FanoutProfile.learn(
+            frames[child][fk], frames[parent][profiles[parent].pk]
+        )
+        for child, (fk, parent) in FANOUT_CHILDREN.items()
+        if child in frames and parent in frames
+    }
+    return profiles, fanouts
+
+
+def _primary_key(table_name: str) -> Optional[str]:
+    csv_columns = DATASOURCE_TABLES[_CSV_FILES[table_name]][1]
+    pk = database.Base.metadata.tables[table_name].primary_key.columns
+    names = [c.name for c in pk]
+    if not names or (csv_columns is not None and names[0] not in csv_columns):
+        return None  # AUTO_INCREMENT key the CSV does not carry
+    return names[0]
+
+
+# ================================================================
+# Generation
+# ================================================================
+
+
+class DatasetGenerator:
+    """Writes a scaled datasource directory from a learned profile."""
+
+    def __init__(
+        self,
+        source_dir: Path = DATASOURCE_DIR,
+        scale: int = 10,
+        catalog_scale: int = 1,
+        seed: int = 0,
+        chunk_rows: int = CHUNK_ROWS,
+    ):
+        self.source_dir = Path(source_dir)
+        self.scale = scale
+        self.catalog_scale = catalog_scale
+        self.chunk_rows = chunk_rows
+        self.rng = np.random.default_rng(seed)
+        self.frames = read_datasource(self.source_dir)
+        self.profiles, self.fanouts = learn_profiles(
+            self.frames, read_foreign_keys()
+        )
+        self._next_id: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+
+    def write(self, out_dir: Path) -> Dict[str, int]:
+        """Generate every table into `out_dir`; returns rows written per table."""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        generated = set(HISTORY_TABLES) | set(CATALOG_TABLES) | set(FANOUT_CHILDREN)
+        for path in self.source_dir.glob("*.csv"):
+            table = next((t for t, f in _CSV_FILES.items() if f == path.name), None)
+            if table not in generated:
+                shutil.copy(path, out_dir / path.name)
+
+        self.out_dir = out_dir
+        for table in generated & set(self.profiles):
+            self._start_file(table)
+        for table in CATALOG_TABLES:
+            self._write_catalog(table)
+        for table in HISTORY_TABLES:
+            self._write_history(table)
+        return dict(self._counts)
+
+    # -- tables --
+
+    def _write_catalog(self, table: str) -> None:
+        profile = self.profiles[table]
+        source = self.frames[table]
+        stride = profile.max_id + 1
+        for block in range(self.catalog_scale):
+            if block == 0:
+                df = self._without_orphans(table, source)
+            else:
+                df = self._sample_rows(table, len(source))
+                df[profile.pk] = source[profile.pk].to_numpy() + block * stride
+            self._append(table, df)
+            self._write_children(table, df[profile.pk].to_numpy(), verbatim=block == 0)
+
+    def _write_history(self, table: str) -> None:
+        total = self.profiles[table].rows * self.scale
+        per_chunk = max(1, int(self.chunk_rows / self._rows_per_parent(table)))
+        for start in range(0, total, per_chunk):
+            n = min(per_chunk, total - start)
+            df = self._sample_rows(table, n)
+            df[self.profiles[table].pk] = self._allocate(table, n)
+            self._append(table, df)
+            self._write_children(table, df[self.profiles[table].pk].to_numpy())
+        logger.info(f"Generated {table}: {self._counts.get(table, 0)} rows")
+
+    def _write_children(
+        self, parent: str, parent_ids: np.ndarray, verbatim: bool = False
+    ) -> None:
+        for child, (fk, parent_table) in FANOUT_CHILDREN.items():
+            if parent_table != parent or child not in self.fanouts:
+                continue
+            if verbatim:
+                df = self._without_orphans(child, self.frames[child])
+                self._append(child, df[df[fk].isin(parent_ids)])
+                continue
+            fanout = self.fanouts[child].sample(self.rng, len(parent_ids))
+            keys = np.repeat(parent_ids, fanout)
+            df = self._sample_rows(child, len(keys))
+            df[fk] = keys
+            pk = self.profiles[child].pk
+            if pk is not None:
+                df[pk] = self._allocate(child, len(keys))
+            self._append(child, df)
+            if pk is not None:
+                self._write_children(child, df[pk].to_numpy())
+
+    # -- helpers --
+
+    def _sample_rows(self, table: str, n: int) -> pd.DataFrame:
+        profile = self.profiles[table]
+        df = pd.DataFrame(
+            {
+                column: dist.sample(self.rng, n)
+                for column, dist in profile.values.items()
+            }
+        )
+        for column, parent in profile.references.items():
+            if parent in CATALOG_TABLES and self.catalog_scale > 1:
+                blocks = self.rng.integers(0, self.catalog_scale, size=n)
+                df[column] = df[column] + blocks * (self.profiles[parent].max_id + 1)
+        return df
+
+    def _without_orphans(self, table: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Shipped rows with references to missing parents set to NULL."""
+        df = df.copy()
+        for column, parent in self.profiles[table].references.items():
+            parent_ids = self.frames[parent][self.profiles[parent].pk]
+            df[column] = df[column].where(df[column].isin(parent_ids))
+        return df
+
+    def _allocate(self, table: str, n: int) -> np.ndarray:
+        # History tables start over at 1; catalog children continue past the source
+        if table not in self._next_id:
+            self._next_id[table] = (
+                1 if self._is_history(table) else self.profiles[table].max_id + 1
+            )
+        start = self._next_id[table]
+        self._next_id[table] = start + n
+        return np.arange(start, start + n, dtype=np.int64)
+
+    def _is_history(self, table: str) -> bool:
+        while table in FANOUT_CHILDREN:
+            table = FANOUT_CHILDREN[table][1]
+        return table in HISTORY_TABLES
+
+    def _rows_per_parent(self, table: str) -> float:
+        """Expected rows generated per row of `table`, descendants included."""
+        return 1 + sum(
+            self.fanouts[child].mean * self._rows_per_parent(child)
+            for child, (_, parent) in FANOUT_CHILDREN.items()
+            if parent == table and child in self.fanouts
+        )
+
+    def _start_file(self, table: str) -> None:
+        path = self.out_dir / _CSV_FILES[table]
+        pd.DataFrame(columns=self.profiles[table].columns).to_csv(path, index=False)
+        self._counts[table] = 0
+
+    def _append(self, table: str, df: pd.DataFrame) -> None:
+        profile = self.profiles[table]
+        df = df[profile.columns].copy()
+        model_table = database.Base.metadata.tables[table]
+        for column in df.columns:
+            if isinstance(model_table.columns[column].type, Boolean):
+                # LoadData.sql reads '1'/'TRUE' as true, anything else as false
+                df[column] = df[column].map({True: "1", False: "0"})
+        df.to_csv(
+            self.out_dir / _CSV_FILES[table],
+            mode="a",
+            header=False,
+            index=False,
+            date_format="%Y-%m-%d %H:%M:%S",
+        )
+        self._counts[table] += len(df)
+
+
+def check_integrity(
+    source_dir: Path, foreign_keys: Optional[Dict] = None
+) -> Dict[str, int]:
+    """Count rows per Relationships.sql foreign key that reference nothing."""
+    frames = read_datasource(source_dir)
+    orphans = {}
+    for (table, column), (parent, parent_column) in (
+        foreign_keys or read_foreign_keys()
+    ).items():
+        if table not in frames or parent not in frames:
+            continue
+        keys = frames[table][column].dropna()
+        orphans[f"{table}.{column}"] = int(
+            (~keys.isin(frames[parent][parent_column])).sum()
+        )
+    return orphans
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Generate a scaled datasource")
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--catalog-scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--source", type=Path, default=DATASOURCE_DIR)
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument(
+        "--check", action="store_true", help="Re-read the output and count orphans"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = DatasetGenerator(
+        args.source, args.scale, args.catalog_scale, args.seed
+    ).write(args.out)
+    logger.info(
+        f"Wrote {sum(counts.values())} rows to {args.out} in "
+        f"{time.perf_counter() - start:.1f}s"
+    )
+    for table, rows in sorted(counts.items()):
+        print(f"{table:<26} {rows:>12}")
+    if args.check:
+        orphans = {k: v for k, v in check_integrity(args.out).items() if v}
+        print(f"\nOrphaned references: {orphans or 'none'}")
+
+
+if __name__ == "__main__":
+    run()
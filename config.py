@@ -29,6 +29,47 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False  # Set to True for SQL query logging
 
+    # ID allocation (T_IdSequences): IDs reserved per round trip. 1 keeps IDs
+    # gap-free; larger blocks cut counter updates for bursty inserts.
+    ID_ALLOCATION_BLOCK_SIZE = int(os.getenv("ID_ALLOCATION_BLOCK_SIZE", 1))
+
+    # Rows fetched per round trip when views are streamed (server-side cursor)
+    STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", 5000))
+
+    # Delta refresh: above this many changed journal rows / affected cache
+    # rows, refresh_view_cache() reloads the whole view instead of merging
+    DELTA_REFRESH_MAX_ROWS = int(os.getenv("DELTA_REFRESH_MAX_ROWS", 500))
+
+    # Delta refresh: journal entries at or below a cache's watermark that are
+    # read again, since writers in other processes can commit out of ChangeID
+    # order; entries already applied are skipped by ChangeID
+    JOURNAL_REPLAY_WINDOW = int(os.getenv("JOURNAL_REPLAY_WINDOW", 200))
+
+    # Rows per statement for batched writes (generic_update_many)
+    BULK_WRITE_CHUNK_SIZE = int(os.getenv("BULK_WRITE_CHUNK_SIZE", 500))
+
+    # Query instrumentation: statements kept in the in-memory ring buffer,
+    # and the duration above which a statement is also logged to LOG_FILE
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "1") == "1"
+    QUERY_STATS_BUFFER_SIZE = int(os.getenv("QUERY_STATS_BUFFER_SIZE", 5000))
+    SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 250))
+
+    # Cast loaded caches to compact dtypes (Int32 IDs, categories, Arrow
+    # strings; see rest/dtypes.py). 0 keeps the plain object/float64 frames
+    COMPACT_DTYPES = os.getenv("COMPACT_DTYPES", "1") == "1"
+
+    # Seconds a Tier-1 lookup (items, units, ...) is served before reloading;
+    # writes through the API invalidate it sooner
+    LOOKUP_TTL_SECONDS = float(os.getenv("LOOKUP_TTL_SECONDS", 600))
+
+    # Inventory/plantings pages: 1 filters, sorts and pages in SQL
+    # (EdgewaterAPI.query_view) instead of loading the whole view
+    PUSHDOWN_FILTERS = os.getenv("PUSHDOWN_FILTERS", "0") == "1"
+
+    # Default rows per page of the admin grids (paged_grid.py); users can
+    # pick another size per grid
+    GRID_PAGE_SIZE = int(os.getenv("GRID_PAGE_SIZE", 50))
+
     # Application Settings
     APP_NAME = os.getenv("APP_NAME", "Edgewater Inventory Manager")
     APP_ENV = os.getenv("APP_ENV", "development")
@@ -74,7 +115,9 @@ class DevelopmentConfig(Config):
     """Development configuration"""
 
     DEBUG = True
-    SQLALCHEMY_ECHO = True  # Enable SQL logging in dev
+    # Full statement echo floods the console; query stats cover the usual
+    # "what ran and how long" question. SQLALCHEMY_ECHO=1 to turn it back on.
+    SQLALCHEMY_ECHO = os.getenv("SQLALCHEMY_ECHO", "0") == "1"
 
 
 class ProductionConfig(Config):
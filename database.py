@@ -2,7 +2,6 @@
 Database connection and utility functions
 """
 
-import pymysql
 from pymysql.cursors import DictCursor
 from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
@@ -30,36 +29,33 @@ Base = declarative_base()
 
 
 class Database:
-    """Database connection manager"""
+    """
+    Raw PyMySQL access for admin/maintenance queries.
+
+    Connections are borrowed from the shared SQLAlchemy engine pool rather
+    than opened per query; closing one returns it to the pool.
+    """
 
     def __init__(self):
         self.config = config.get_db_config()
         self._connection = None
 
-    def connect(self) -> pymysql.Connection:
-        """Create and return a database connection"""
+    def connect(self):
+        """Borrow a DBAPI connection from the engine pool"""
         try:
-            self._connection = pymysql.connect(
-                host=self.config["host"],
-                port=self.config["port"],
-                user=self.config["user"],
-                password=self.config["password"],
-                database=self.config["database"],
-                charset=self.config["charset"],
-                cursorclass=DictCursor,
-                autocommit=False,
-            )
-            logger.info("✓ Database connection established")
+            self._connection = engine.raw_connection()
+            logger.debug("Borrowed pooled database connection")
             return self._connection
-        except pymysql.Error as e:
+        except Exception as e:
             logger.error(f"✗ Database connection failed: {e}")
             raise
 
     def close(self):
-        """Close database connection"""
+        """Return the borrowed connection to the pool"""
         if self._connection:
             self._connection.close()
-            logger.info("Database connection closed")
+            self._connection = None
+            logger.debug("Database connection returned to pool")
 
     @contextmanager
     def get_connection(self):
@@ -79,7 +75,7 @@ class Database:
     def get_cursor(self):
         """Context manager for database cursors"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
+            cursor = conn.cursor(DictCursor)
             try:
                 yield cursor
             finally:
@@ -149,6 +145,56 @@ class Database:
         result = self.execute_query(query)
         return result[0]["count"] if result else 0
 
+    def get_table_stats(self, exact: bool = False) -> List[Dict[str, Any]]:
+        """
+        Row count and size for every base table, on one pooled connection.
+
+        By default counts are InnoDB estimates from information_schema.TABLES
+        (one query, no table scans). exact=True replaces them with a single
+        UNION ALL of COUNT(*) per table.
+        """
+        with self.get_cursor() as cursor:
+            # MySQL 8 caches information_schema statistics for a day. The
+            # connection goes back to the pool, so restore the session value.
+            cursor.execute(
+                "SELECT @@SESSION.information_schema_stats_expiry AS expiry"
+            )
+            expiry = cursor.fetchone()["expiry"]
+            cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+            try:
+                cursor.execute(
+                    """
+                    SELECT
+                        TABLE_NAME AS table_name,
+                        TABLE_ROWS AS `rows`,
+                        ROUND((DATA_LENGTH + INDEX_LENGTH) / 1024 / 1024, 2) AS size_mb
+                    FROM INFORMATION_SCHEMA.TABLES
+                    WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'
+                    ORDER BY TABLE_NAME
+                    """,
+                    (self.config["database"],),
+                )
+                stats = list(cursor.fetchall())
+
+                if exact and stats:
+                    cursor.execute(
+                        " UNION ALL ".join(
+                            "SELECT %s AS table_name, COUNT(*) AS `rows` FROM `{}`".format(
+                                row["table_name"].replace("`", "``")
+                            )
+                            for row in stats
+                        ),
+                        tuple(row["table_name"] for row in stats),
+                    )
+                    counts = {r["table_name"]: r["rows"] for r in cursor.fetchall()}
+                    for row in stats:
+                        row["rows"] = counts.get(row["table_name"], row["rows"])
+            finally:
+                cursor.execute(
+                    "SET SESSION information_schema_stats_expiry = %s", (expiry,)
+                )
+        return stats
+
 
 # SQLAlchemy session management
 @contextmanager
@@ -182,27 +228,24 @@ def test_connection() -> bool:
     return db.test_connection()
 
 
-def get_database_stats() -> Dict[str, Any]:
-    """Get database statistics"""
+def get_database_stats(exact: bool = False) -> Dict[str, Any]:
+    """
+    Get database statistics
+
+    Args:
+        exact: COUNT(*) every table instead of using InnoDB row estimates
+    """
     db = Database()
 
-    tables = db.get_all_tables()
-    stats = {
+    table_stats = db.get_table_stats(exact=exact)
+    return {
         "database": db.config["database"],
-        "total_tables": len(tables),
-        "tables": {},
+        "total_tables": len(table_stats),
+        "exact": exact,
+        "tables": {row["table_name"]: row["rows"] for row in table_stats},
+        "size_mb": {row["table_name"]: row["size_mb"] for row in table_stats},
     }
 
-    for table in tables:
-        try:
-            count = db.get_table_count(table)
-            stats["tables"][table] = count
-        except Exception as e:
-            logger.warning(f"Could not get count for {table}: {e}")
-            stats["tables"][table] = "error"
-
-    return stats
-
 
 # Global database instance
 db = Database()
@@ -0,0 +1,314 @@
+-- ChangeJournal.sql - Triggers that record row changes in T_ChangeJournal
+-- Run AFTER LoadData.sql so the initial bulk load is not journaled
+--
+-- Each INSERT/UPDATE/DELETE on a table that feeds a cached view appends
+-- (TableName, RowID, Operation). refresh_view_cache() reads the entries past
+-- the cached version and refetches only the affected view rows.
+-- Updates that change a primary key journal both the old and new ID.
+
+USE `EdgewaterMaster`;
+
+-- T_ItemType
+DROP TRIGGER IF EXISTS `trg_itemtype_ins`;
+CREATE TRIGGER `trg_itemtype_ins` AFTER INSERT ON `T_ItemType` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_ItemType', NEW.`TypeID`, 'I');
+DROP TRIGGER IF EXISTS `trg_itemtype_upd`;
+CREATE TRIGGER `trg_itemtype_upd` AFTER UPDATE ON `T_ItemType` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_ItemType', NEW.`TypeID`, 'U' UNION SELECT 'T_ItemType', OLD.`TypeID`, 'U';
+DROP TRIGGER IF EXISTS `trg_itemtype_del`;
+CREATE TRIGGER `trg_itemtype_del` AFTER DELETE ON `T_ItemType` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_ItemType', OLD.`TypeID`, 'D');
+
+-- T_UnitCategory
+DROP TRIGGER IF EXISTS `trg_unitcategory_ins`;
+CREATE TRIGGER `trg_unitcategory_ins` AFTER INSERT ON `T_UnitCategory` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_UnitCategory', NEW.`UnitCategoryID`, 'I');
+DROP TRIGGER IF EXISTS `trg_unitcategory_upd`;
+CREATE TRIGGER `trg_unitcategory_upd` AFTER UPDATE ON `T_UnitCategory` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_UnitCategory', NEW.`UnitCategoryID`, 'U' UNION SELECT 'T_UnitCategory', OLD.`UnitCategoryID`, 'U';
+DROP TRIGGER IF EXISTS `trg_unitcategory_del`;
+CREATE TRIGGER `trg_unitcategory_del` AFTER DELETE ON `T_UnitCategory` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_UnitCategory', OLD.`UnitCategoryID`, 'D');
+
+-- T_Units
+DROP TRIGGER IF EXISTS `trg_units_ins`;
+CREATE TRIGGER `trg_units_ins` AFTER INSERT ON `T_Units` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Units', NEW.`UnitID`, 'I');
+DROP TRIGGER IF EXISTS `trg_units_upd`;
+CREATE TRIGGER `trg_units_upd` AFTER UPDATE ON `T_Units` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Units', NEW.`UnitID`, 'U' UNION SELECT 'T_Units', OLD.`UnitID`, 'U';
+DROP TRIGGER IF EXISTS `trg_units_del`;
+CREATE TRIGGER `trg_units_del` AFTER DELETE ON `T_Units` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Units', OLD.`UnitID`, 'D');
+
+-- T_Brokers
+DROP TRIGGER IF EXISTS `trg_brokers_ins`;
+CREATE TRIGGER `trg_brokers_ins` AFTER INSERT ON `T_Brokers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Brokers', NEW.`BrokerID`, 'I');
+DROP TRIGGER IF EXISTS `trg_brokers_upd`;
+CREATE TRIGGER `trg_brokers_upd` AFTER UPDATE ON `T_Brokers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Brokers', NEW.`BrokerID`, 'U' UNION SELECT 'T_Brokers', OLD.`BrokerID`, 'U';
+DROP TRIGGER IF EXISTS `trg_brokers_del`;
+CREATE TRIGGER `trg_brokers_del` AFTER DELETE ON `T_Brokers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Brokers', OLD.`BrokerID`, 'D');
+
+-- T_Shippers
+DROP TRIGGER IF EXISTS `trg_shippers_ins`;
+CREATE TRIGGER `trg_shippers_ins` AFTER INSERT ON `T_Shippers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Shippers', NEW.`ShipperID`, 'I');
+DROP TRIGGER IF EXISTS `trg_shippers_upd`;
+CREATE TRIGGER `trg_shippers_upd` AFTER UPDATE ON `T_Shippers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Shippers', NEW.`ShipperID`, 'U' UNION SELECT 'T_Shippers', OLD.`ShipperID`, 'U';
+DROP TRIGGER IF EXISTS `trg_shippers_del`;
+CREATE TRIGGER `trg_shippers_del` AFTER DELETE ON `T_Shippers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Shippers', OLD.`ShipperID`, 'D');
+
+-- T_Suppliers
+DROP TRIGGER IF EXISTS `trg_suppliers_ins`;
+CREATE TRIGGER `trg_suppliers_ins` AFTER INSERT ON `T_Suppliers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Suppliers', NEW.`SupplierID`, 'I');
+DROP TRIGGER IF EXISTS `trg_suppliers_upd`;
+CREATE TRIGGER `trg_suppliers_upd` AFTER UPDATE ON `T_Suppliers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Suppliers', NEW.`SupplierID`, 'U' UNION SELECT 'T_Suppliers', OLD.`SupplierID`, 'U';
+DROP TRIGGER IF EXISTS `trg_suppliers_del`;
+CREATE TRIGGER `trg_suppliers_del` AFTER DELETE ON `T_Suppliers` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Suppliers', OLD.`SupplierID`, 'D');
+
+-- T_GrowingSeason
+DROP TRIGGER IF EXISTS `trg_growingseason_ins`;
+CREATE TRIGGER `trg_growingseason_ins` AFTER INSERT ON `T_GrowingSeason` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_GrowingSeason', NEW.`GrowingSeasonID`, 'I');
+DROP TRIGGER IF EXISTS `trg_growingseason_upd`;
+CREATE TRIGGER `trg_growingseason_upd` AFTER UPDATE ON `T_GrowingSeason` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_GrowingSeason', NEW.`GrowingSeasonID`, 'U' UNION SELECT 'T_GrowingSeason', OLD.`GrowingSeasonID`, 'U';
+DROP TRIGGER IF EXISTS `trg_growingseason_del`;
+CREATE TRIGGER `trg_growingseason_del` AFTER DELETE ON `T_GrowingSeason` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_GrowingSeason', OLD.`GrowingSeasonID`, 'D');
+
+-- T_OrderItemTypes
+DROP TRIGGER IF EXISTS `trg_orderitemtypes_ins`;
+CREATE TRIGGER `trg_orderitemtypes_ins` AFTER INSERT ON `T_OrderItemTypes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_OrderItemTypes', NEW.`OrderItemTypeID`, 'I');
+DROP TRIGGER IF EXISTS `trg_orderitemtypes_upd`;
+CREATE TRIGGER `trg_orderitemtypes_upd` AFTER UPDATE ON `T_OrderItemTypes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_OrderItemTypes', NEW.`OrderItemTypeID`, 'U' UNION SELECT 'T_OrderItemTypes', OLD.`OrderItemTypeID`, 'U';
+DROP TRIGGER IF EXISTS `trg_orderitemtypes_del`;
+CREATE TRIGGER `trg_orderitemtypes_del` AFTER DELETE ON `T_OrderItemTypes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_OrderItemTypes', OLD.`OrderItemTypeID`, 'D');
+
+-- T_OrderNotes
+DROP TRIGGER IF EXISTS `trg_ordernotes_ins`;
+CREATE TRIGGER `trg_ordernotes_ins` AFTER INSERT ON `T_OrderNotes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_OrderNotes', NEW.`OrderNoteID`, 'I');
+DROP TRIGGER IF EXISTS `trg_ordernotes_upd`;
+CREATE TRIGGER `trg_ordernotes_upd` AFTER UPDATE ON `T_OrderNotes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_OrderNotes', NEW.`OrderNoteID`, 'U' UNION SELECT 'T_OrderNotes', OLD.`OrderNoteID`, 'U';
+DROP TRIGGER IF EXISTS `trg_ordernotes_del`;
+CREATE TRIGGER `trg_ordernotes_del` AFTER DELETE ON `T_OrderNotes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_OrderNotes', OLD.`OrderNoteID`, 'D');
+
+-- T_Items
+DROP TRIGGER IF EXISTS `trg_items_ins`;
+CREATE TRIGGER `trg_items_ins` AFTER INSERT ON `T_Items` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Items', NEW.`ItemID`, 'I');
+DROP TRIGGER IF EXISTS `trg_items_upd`;
+CREATE TRIGGER `trg_items_upd` AFTER UPDATE ON `T_Items` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Items', NEW.`ItemID`, 'U' UNION SELECT 'T_Items', OLD.`ItemID`, 'U';
+DROP TRIGGER IF EXISTS `trg_items_del`;
+CREATE TRIGGER `trg_items_del` AFTER DELETE ON `T_Items` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Items', OLD.`ItemID`, 'D');
+
+-- T_Prices
+DROP TRIGGER IF EXISTS `trg_prices_ins`;
+CREATE TRIGGER `trg_prices_ins` AFTER INSERT ON `T_Prices` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Prices', NEW.`PriceID`, 'I');
+DROP TRIGGER IF EXISTS `trg_prices_upd`;
+CREATE TRIGGER `trg_prices_upd` AFTER UPDATE ON `T_Prices` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Prices', NEW.`PriceID`, 'U' UNION SELECT 'T_Prices', OLD.`PriceID`, 'U';
+DROP TRIGGER IF EXISTS `trg_prices_del`;
+CREATE TRIGGER `trg_prices_del` AFTER DELETE ON `T_Prices` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Prices', OLD.`PriceID`, 'D');
+
+-- T_Plantings
+DROP TRIGGER IF EXISTS `trg_plantings_ins`;
+CREATE TRIGGER `trg_plantings_ins` AFTER INSERT ON `T_Plantings` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Plantings', NEW.`PlantingID`, 'I');
+DROP TRIGGER IF EXISTS `trg_plantings_upd`;
+CREATE TRIGGER `trg_plantings_upd` AFTER UPDATE ON `T_Plantings` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Plantings', NEW.`PlantingID`, 'U' UNION SELECT 'T_Plantings', OLD.`PlantingID`, 'U';
+DROP TRIGGER IF EXISTS `trg_plantings_del`;
+CREATE TRIGGER `trg_plantings_del` AFTER DELETE ON `T_Plantings` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Plantings', OLD.`PlantingID`, 'D');
+
+-- T_Inventory
+DROP TRIGGER IF EXISTS `trg_inventory_ins`;
+CREATE TRIGGER `trg_inventory_ins` AFTER INSERT ON `T_Inventory` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Inventory', NEW.`InventoryID`, 'I');
+DROP TRIGGER IF EXISTS `trg_inventory_upd`;
+CREATE TRIGGER `trg_inventory_upd` AFTER UPDATE ON `T_Inventory` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Inventory', NEW.`InventoryID`, 'U' UNION SELECT 'T_Inventory', OLD.`InventoryID`, 'U';
+DROP TRIGGER IF EXISTS `trg_inventory_del`;
+CREATE TRIGGER `trg_inventory_del` AFTER DELETE ON `T_Inventory` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Inventory', OLD.`InventoryID`, 'D');
+
+-- T_Pitch
+DROP TRIGGER IF EXISTS `trg_pitch_ins`;
+CREATE TRIGGER `trg_pitch_ins` AFTER INSERT ON `T_Pitch` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Pitch', NEW.`PitchID`, 'I');
+DROP TRIGGER IF EXISTS `trg_pitch_upd`;
+CREATE TRIGGER `trg_pitch_upd` AFTER UPDATE ON `T_Pitch` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Pitch', NEW.`PitchID`, 'U' UNION SELECT 'T_Pitch', OLD.`PitchID`, 'U';
+DROP TRIGGER IF EXISTS `trg_pitch_del`;
+CREATE TRIGGER `trg_pitch_del` AFTER DELETE ON `T_Pitch` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Pitch', OLD.`PitchID`, 'D');
+
+-- T_Orders
+DROP TRIGGER IF EXISTS `trg_orders_ins`;
+CREATE TRIGGER `trg_orders_ins` AFTER INSERT ON `T_Orders` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Orders', NEW.`OrderID`, 'I');
+DROP TRIGGER IF EXISTS `trg_orders_upd`;
+CREATE TRIGGER `trg_orders_upd` AFTER UPDATE ON `T_Orders` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Orders', NEW.`OrderID`, 'U' UNION SELECT 'T_Orders', OLD.`OrderID`, 'U';
+DROP TRIGGER IF EXISTS `trg_orders_del`;
+CREATE TRIGGER `trg_orders_del` AFTER DELETE ON `T_Orders` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Orders', OLD.`OrderID`, 'D');
+
+-- T_OrderItems
+DROP TRIGGER IF EXISTS `trg_orderitems_ins`;
+CREATE TRIGGER `trg_orderitems_ins` AFTER INSERT ON `T_OrderItems` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_OrderItems', NEW.`OrderItemID`, 'I');
+DROP TRIGGER IF EXISTS `trg_orderitems_upd`;
+CREATE TRIGGER `trg_orderitems_upd` AFTER UPDATE ON `T_OrderItems` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_OrderItems', NEW.`OrderItemID`, 'U' UNION SELECT 'T_OrderItems', OLD.`OrderItemID`, 'U';
+DROP TRIGGER IF EXISTS `trg_orderitems_del`;
+CREATE TRIGGER `trg_orderitems_del` AFTER DELETE ON `T_OrderItems` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_OrderItems', OLD.`OrderItemID`, 'D');
+
+-- T_SeasonalNotes
+DROP TRIGGER IF EXISTS `trg_seasonalnotes_ins`;
+CREATE TRIGGER `trg_seasonalnotes_ins` AFTER INSERT ON `T_SeasonalNotes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_SeasonalNotes', NEW.`NoteID`, 'I');
+DROP TRIGGER IF EXISTS `trg_seasonalnotes_upd`;
+CREATE TRIGGER `trg_seasonalnotes_upd` AFTER UPDATE ON `T_SeasonalNotes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_SeasonalNotes', NEW.`NoteID`, 'U' UNION SELECT 'T_SeasonalNotes', OLD.`NoteID`, 'U';
+DROP TRIGGER IF EXISTS `trg_seasonalnotes_del`;
+CREATE TRIGGER `trg_seasonalnotes_del` AFTER DELETE ON `T_SeasonalNotes` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_SeasonalNotes', OLD.`NoteID`, 'D');
+
+-- T_OrderItemDestination
+DROP TRIGGER IF EXISTS `trg_orderitemdestination_ins`;
+CREATE TRIGGER `trg_orderitemdestination_ins` AFTER INSERT ON `T_OrderItemDestination` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_OrderItemDestination', NEW.`OrderItemDestinationID`, 'I');
+DROP TRIGGER IF EXISTS `trg_orderitemdestination_upd`;
+CREATE TRIGGER `trg_orderitemdestination_upd` AFTER UPDATE ON `T_OrderItemDestination` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_OrderItemDestination', NEW.`OrderItemDestinationID`, 'U' UNION SELECT 'T_OrderItemDestination', OLD.`OrderItemDestinationID`, 'U';
+DROP TRIGGER IF EXISTS `trg_orderitemdestination_del`;
+CREATE TRIGGER `trg_orderitemdestination_del` AFTER DELETE ON `T_OrderItemDestination` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_OrderItemDestination', OLD.`OrderItemDestinationID`, 'D');
+
+-- T_Users
+DROP TRIGGER IF EXISTS `trg_users_ins`;
+CREATE TRIGGER `trg_users_ins` AFTER INSERT ON `T_Users` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Users', NEW.`UserID`, 'I');
+DROP TRIGGER IF EXISTS `trg_users_upd`;
+CREATE TRIGGER `trg_users_upd` AFTER UPDATE ON `T_Users` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Users', NEW.`UserID`, 'U' UNION SELECT 'T_Users', OLD.`UserID`, 'U';
+DROP TRIGGER IF EXISTS `trg_users_del`;
+CREATE TRIGGER `trg_users_del` AFTER DELETE ON `T_Users` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Users', OLD.`UserID`, 'D');
+
+-- T_Locations
+DROP TRIGGER IF EXISTS `trg_locations_ins`;
+CREATE TRIGGER `trg_locations_ins` AFTER INSERT ON `T_Locations` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Locations', NEW.`LocationID`, 'I');
+DROP TRIGGER IF EXISTS `trg_locations_upd`;
+CREATE TRIGGER `trg_locations_upd` AFTER UPDATE ON `T_Locations` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_Locations', NEW.`LocationID`, 'U' UNION SELECT 'T_Locations', OLD.`LocationID`, 'U';
+DROP TRIGGER IF EXISTS `trg_locations_del`;
+CREATE TRIGGER `trg_locations_del` AFTER DELETE ON `T_Locations` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_Locations', OLD.`LocationID`, 'D');
+
+-- T_PlantingDestinations
+DROP TRIGGER IF EXISTS `trg_plantingdestinations_ins`;
+CREATE TRIGGER `trg_plantingdestinations_ins` AFTER INSERT ON `T_PlantingDestinations` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_PlantingDestinations', NEW.`PlantingDestinationID`, 'I');
+DROP TRIGGER IF EXISTS `trg_plantingdestinations_upd`;
+CREATE TRIGGER `trg_plantingdestinations_upd` AFTER UPDATE ON `T_PlantingDestinations` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    SELECT 'T_PlantingDestinations', NEW.`PlantingDestinationID`, 'U' UNION SELECT 'T_PlantingDestinations', OLD.`PlantingDestinationID`, 'U';
+DROP TRIGGER IF EXISTS `trg_plantingdestinations_del`;
+CREATE TRIGGER `trg_plantingdestinations_del` AFTER DELETE ON `T_PlantingDestinations` FOR EACH ROW
+    INSERT INTO `T_ChangeJournal` (`TableName`, `RowID`, `Operation`)
+    VALUES ('T_PlantingDestinations', OLD.`PlantingDestinationID`, 'D');
+
+-- Keep one week of history; caches older than that fall back to a full reload.
+-- Events only run with event_scheduler=ON (docker-compose.yml starts MySQL
+-- with --event-scheduler=ON); otherwise run `make prune-journal` regularly.
+DROP EVENT IF EXISTS `evt_prune_change_journal`;
+CREATE EVENT `evt_prune_change_journal`
+    ON SCHEDULE EVERY 1 DAY
+    DO DELETE FROM `T_ChangeJournal` WHERE `ChangedAt` < NOW() - INTERVAL 7 DAY;
+
+SELECT 'Change journal triggers created' AS Status;
+SHOW TRIGGERS;
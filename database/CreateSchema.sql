@@ -103,7 +103,11 @@ CREATE TABLE `T_Items` (
     `Definition` LONGTEXT,
     `PictureLayout` TEXT,
     `PictureLink` TEXT,
-    `SunConditions` TEXT
+    `SunConditions` TEXT,
+    -- Search text for api.search_items(), FULLTEXT-indexed in Relationships.sql
+    `SearchText` TEXT GENERATED ALWAYS AS (
+        CONCAT_WS(' ', `Item`, `Variety`, `Color`, `LabelDescription`)
+    ) STORED
 ) ENGINE=InnoDB CHARACTER SET UTF8;
 
 DROP TABLE IF EXISTS `T_Prices`;
@@ -251,4 +255,24 @@ CREATE TABLE `T_PlantingDestinations` (
     `LocationID` INTEGER,
     `UnitsDestined` TEXT,
     `PurposeComments` LONGTEXT
-) ENGINE=InnoDB CHARACTER SET UTF8;
\ No newline at end of file
+) ENGINE=InnoDB CHARACTER SET UTF8;
+
+-- Next-ID counters for tables whose primary keys are not AUTO_INCREMENT
+-- (seeded by Sequences.sql, advanced by the API's ID allocator)
+DROP TABLE IF EXISTS `T_IdSequences`;
+CREATE TABLE `T_IdSequences` (
+    `TableName` VARCHAR(64) PRIMARY KEY,
+    `NextID` INTEGER NOT NULL
+) ENGINE=InnoDB CHARACTER SET UTF8;
+
+-- Row-level change log written by the triggers in ChangeJournal.sql; the API
+-- reads entries past each cached view's watermark to refresh only those rows
+DROP TABLE IF EXISTS `T_ChangeJournal`;
+CREATE TABLE `T_ChangeJournal` (
+    `ChangeID` BIGINT PRIMARY KEY AUTO_INCREMENT,
+    `TableName` VARCHAR(64) NOT NULL,
+    `RowID` INTEGER NOT NULL,
+    `Operation` CHAR(1) NOT NULL,
+    `ChangedAt` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    INDEX `idx_changejournal_changedat` (`ChangedAt`)
+) ENGINE=InnoDB CHARACTER SET UTF8;
@@ -199,8 +199,19 @@ CREATE INDEX `ix_OrderItemDestination_OrderItemID` ON `T_OrderItemDestination`(`
 CREATE INDEX `ix_OrderItemDestination_UnitID` ON `T_OrderItemDestination`(`UnitID`);
 CREATE INDEX `ix_OrderItemDestination_LocationID` ON `T_OrderItemDestination`(`LocationID`);
 CREATE INDEX `ix_Passwords_UserID` ON `T_Passwords`(`UserID`);
+
+-- Date filters/ordering pushed down by EdgewaterAPI.query_view and
+-- aggregate_view (rest/view_query.py): newest-first pages, date ranges
+CREATE INDEX `ix_Plantings_DatePlanted` ON `T_Plantings`(`DatePlanted`);
+CREATE INDEX `ix_Inventory_DateCounted` ON `T_Inventory`(`DateCounted`);
+CREATE INDEX `ix_Orders_DatePlaced` ON `T_Orders`(`DatePlaced`);
+CREATE INDEX `ix_Orders_DateReceived_DateDue` ON `T_Orders`(`DateReceived`, `DateDue`);
+CREATE INDEX `ix_Pitch_DatePitched` ON `T_Pitch`(`DatePitched`);
 CREATE UNIQUE INDEX `ix_Users_Email` ON `T_Users`(`Email`(255));
 
+-- Item search: n-gram parser so partial words ("tom" in "Tomato") match
+CREATE FULLTEXT INDEX `ft_Items_SearchText` ON `T_Items`(`SearchText`) WITH PARSER ngram;
+
 SET FOREIGN_KEY_CHECKS = 1;
 
 -- ==================== VERIFICATION ====================
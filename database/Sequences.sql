@@ -0,0 +1,32 @@
+-- Sequences.sql - Seeds T_IdSequences for tables without AUTO_INCREMENT keys
+-- Run AFTER LoadData.sql, CleanupOrphans.sql and Relationships.sql
+--
+-- The API reserves IDs from these counters (SELECT ... FOR UPDATE + UPDATE)
+-- instead of scanning each table for MAX(id). Re-running this script is safe:
+-- counters only ever move forward.
+
+USE `EdgewaterMaster`;
+
+INSERT INTO `T_IdSequences` (`TableName`, `NextID`)
+SELECT * FROM (
+SELECT 'T_ItemType' AS TableName, COALESCE(MAX(TypeID), 0) + 1 AS NextID FROM T_ItemType
+UNION ALL SELECT 'T_UnitCategory', COALESCE(MAX(UnitCategoryID), 0) + 1 FROM T_UnitCategory
+UNION ALL SELECT 'T_Units', COALESCE(MAX(UnitID), 0) + 1 FROM T_Units
+UNION ALL SELECT 'T_Brokers', COALESCE(MAX(BrokerID), 0) + 1 FROM T_Brokers
+UNION ALL SELECT 'T_Shippers', COALESCE(MAX(ShipperID), 0) + 1 FROM T_Shippers
+UNION ALL SELECT 'T_Suppliers', COALESCE(MAX(SupplierID), 0) + 1 FROM T_Suppliers
+UNION ALL SELECT 'T_GrowingSeason', COALESCE(MAX(GrowingSeasonID), 0) + 1 FROM T_GrowingSeason
+UNION ALL SELECT 'T_OrderItemTypes', COALESCE(MAX(OrderItemTypeID), 0) + 1 FROM T_OrderItemTypes
+UNION ALL SELECT 'T_OrderNotes', COALESCE(MAX(OrderNoteID), 0) + 1 FROM T_OrderNotes
+UNION ALL SELECT 'T_Items', COALESCE(MAX(ItemID), 0) + 1 FROM T_Items
+UNION ALL SELECT 'T_Prices', COALESCE(MAX(PriceID), 0) + 1 FROM T_Prices
+UNION ALL SELECT 'T_Plantings', COALESCE(MAX(PlantingID), 0) + 1 FROM T_Plantings
+UNION ALL SELECT 'T_Inventory', COALESCE(MAX(InventoryID), 0) + 1 FROM T_Inventory
+UNION ALL SELECT 'T_Pitch', COALESCE(MAX(PitchID), 0) + 1 FROM T_Pitch
+UNION ALL SELECT 'T_Orders', COALESCE(MAX(OrderID), 0) + 1 FROM T_Orders
+UNION ALL SELECT 'T_OrderItems', COALESCE(MAX(OrderItemID), 0) + 1 FROM T_OrderItems
+) AS seeded
+ON DUPLICATE KEY UPDATE `NextID` = GREATEST(`T_IdSequences`.`NextID`, seeded.`NextID`);
+
+SELECT 'ID sequences seeded' AS Status;
+SELECT * FROM `T_IdSequences` ORDER BY `TableName`;
@@ -51,11 +51,6 @@ SELECT
     p.PlantingComments,
     p.LocationID AS PlantingLocationID,
     ploc.Location AS PlantingLocation,
-    pd.PlantingDestinationID,
-    pd.LocationID AS DestinationLocationID,
-    dloc.Location AS DestinationLocation,
-    pd.UnitsDestined,
-    pd.PurposeComments,
     i.ItemID,
     i.Item,
     i.Variety,
@@ -71,24 +66,33 @@ SELECT
     u.UnitType,
     u.UnitSize,
     u.UnitCategoryID,
-    uc.UnitCategory,
-    sn.NoteID,
-    sn.GrowingSeasonID, 
-    sn.Greenhouse,
-    sn.Note AS SeasonalNote,
-    sn.LastUpdate AS NoteLastUpdate
+    uc.UnitCategory
 FROM T_Plantings p
 LEFT JOIN T_Items i ON p.ItemID = i.ItemID
 LEFT JOIN T_ItemType it ON i.TypeID = it.TypeID
 LEFT JOIN T_Units u ON p.UnitID = u.UnitID
 LEFT JOIN T_UnitCategory uc ON u.UnitCategoryID = uc.UnitCategoryID
-LEFT JOIN T_SeasonalNotes sn ON p.ItemID = sn.ItemID
-LEFT JOIN T_Locations ploc ON p.LocationID = ploc.LocationID
-LEFT JOIN T_PlantingDestinations pd ON p.PlantingID = pd.PlantingID
-LEFT JOIN T_Locations dloc ON pd.LocationID = dloc.LocationID;
+LEFT JOIN T_Locations ploc ON p.LocationID = ploc.LocationID;
 
 SELECT 'v_plantings_full created' AS Status;
 
+-- One row per planting destination; seasonal notes are read from
+-- T_SeasonalNotes by ItemID. Neither is joined into v_plantings_full,
+-- which would repeat each planting once per destination and note.
+DROP VIEW IF EXISTS `v_planting_destinations`;
+CREATE VIEW `v_planting_destinations` AS
+SELECT
+    pd.PlantingDestinationID,
+    pd.PlantingID,
+    pd.LocationID AS DestinationLocationID,
+    dloc.Location AS DestinationLocation,
+    pd.UnitsDestined,
+    pd.PurposeComments
+FROM T_PlantingDestinations pd
+LEFT JOIN T_Locations dloc ON pd.LocationID = dloc.LocationID;
+
+SELECT 'v_planting_destinations created' AS Status;
+
 -- ==================== VIEW 3: ORDERS ====================
 DROP VIEW IF EXISTS `v_orders_full`;
 CREATE VIEW `v_orders_full` AS
@@ -108,13 +112,6 @@ SELECT
     i.Variety,
     i.Color,
     it.Type AS ItemTypeName,
-    od.OrderItemDestinationID,
-    od.Count AS DestinationCount,
-    od.UnitID AS DestinationUnitID,
-    du.UnitType AS DestinationUnitType,
-    du.UnitSize AS DestinationUnitSize,
-    loc.LocationID,
-    loc.Location AS LocationName,
     o.OrderID,
     o.DatePlaced,
     o.DateReceived,
@@ -169,12 +166,72 @@ LEFT JOIN T_OrderItemTypes oit ON oi.OrderItemTypeID = oit.OrderItemTypeID
 LEFT JOIN T_OrderNotes onote ON oi.OrderNote = onote.OrderNoteID
 LEFT JOIN T_Brokers b ON o.BrokerID = b.BrokerID
 LEFT JOIN T_Shippers s ON o.ShipperID = s.ShipperID
-LEFT JOIN T_Suppliers sup ON o.SupplierID = sup.SupplierID
-LEFT JOIN T_OrderItemDestination od ON oi.OrderItemID = od.OrderItemID
+LEFT JOIN T_Suppliers sup ON o.SupplierID = sup.SupplierID;
+
+SELECT 'v_orders_full created' AS Status;
+
+-- One row per order item destination (kept out of v_orders_full, which
+-- would otherwise repeat each order item once per destination)
+DROP VIEW IF EXISTS `v_order_item_destinations`;
+CREATE VIEW `v_order_item_destinations` AS
+SELECT
+    od.OrderItemDestinationID,
+    od.OrderItemID,
+    od.Count AS DestinationCount,
+    od.UnitID AS DestinationUnitID,
+    du.UnitType AS DestinationUnitType,
+    du.UnitSize AS DestinationUnitSize,
+    od.LocationID,
+    loc.Location AS LocationName
+FROM T_OrderItemDestination od
 LEFT JOIN T_Locations loc ON od.LocationID = loc.LocationID
 LEFT JOIN T_Units du ON od.UnitID = du.UnitID;
 
-SELECT 'v_orders_full created' AS Status;
+SELECT 'v_order_item_destinations created' AS Status;
+
+-- ==================== VIEW 3b: ORDER SUMMARY ====================
+-- One row per order with its line-item rollups, for the order tracking
+-- summary tab and metrics (no need to load every order item)
+DROP VIEW IF EXISTS `v_orders_summary`;
+CREATE VIEW `v_orders_summary` AS
+SELECT
+    o.OrderID,
+    o.DatePlaced,
+    o.DateReceived,
+    o.DateDue,
+    o.OrderNumber,
+    o.TrackingNumber,
+    o.OrderComments,
+    o.TotalCost,
+    o.GrowingSeason,
+    o.GrowingSeasonID,
+    b.BrokerID,
+    b.Broker,
+    b.BrokerComments,
+    s.ShipperID,
+    s.Shipper,
+    s.ShipperComments,
+    sup.SupplierID,
+    sup.Supplier,
+    sup.SupplierComments,
+    COALESCE(li.ItemCount, 0) AS ItemCount,
+    COALESCE(li.ReceivedCount, 0) AS ReceivedCount,
+    li.LineItemTotal
+FROM T_Orders o
+LEFT JOIN (
+    SELECT
+        OrderID,
+        COUNT(*) AS ItemCount,
+        SUM(CASE WHEN Received THEN 1 ELSE 0 END) AS ReceivedCount,
+        SUM(UnitPrice * CAST(NumberOfUnits AS DECIMAL(12, 2))) AS LineItemTotal
+    FROM T_OrderItems
+    GROUP BY OrderID
+) li ON o.OrderID = li.OrderID
+LEFT JOIN T_Brokers b ON o.BrokerID = b.BrokerID
+LEFT JOIN T_Shippers s ON o.ShipperID = s.ShipperID
+LEFT JOIN T_Suppliers sup ON o.SupplierID = sup.SupplierID;
+
+SELECT 'v_orders_summary created' AS Status;
 
 -- ==================== VIEW 4: LABELS ====================
 DROP VIEW IF EXISTS `v_label_data_full`;
@@ -192,8 +249,19 @@ SELECT
     i.Inactive,
     i.ShouldStock,
     i.TypeID,
-    it.Type,
+    it.Type
+FROM T_Items i
+LEFT JOIN T_ItemType it ON i.TypeID = it.TypeID;
+
+SELECT 'v_label_data_full created' AS Status;
+
+-- One row per price (kept out of v_label_data_full, which would otherwise
+-- repeat each item once per price row)
+DROP VIEW IF EXISTS `v_item_prices`;
+CREATE VIEW `v_item_prices` AS
+SELECT
     pr.PriceID,
+    pr.ItemID,
     pr.UnitID,
     pr.UnitPrice,
     pr.Year,
@@ -201,13 +269,11 @@ SELECT
     u.UnitSize,
     u.UnitCategoryID,
     uc.UnitCategory
-FROM T_Items i
-LEFT JOIN T_ItemType it ON i.TypeID = it.TypeID
-LEFT JOIN T_Prices pr ON i.ItemID = pr.ItemID
+FROM T_Prices pr
 LEFT JOIN T_Units u ON pr.UnitID = u.UnitID
 LEFT JOIN T_UnitCategory uc ON u.UnitCategoryID = uc.UnitCategoryID;
 
-SELECT 'v_label_data_full created' AS Status;
+SELECT 'v_item_prices created' AS Status;
 
 -- ==================== VIEW 5: PITCH ====================
 DROP VIEW IF EXISTS `v_pitch_full`;
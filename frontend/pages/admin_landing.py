@@ -1,4 +1,7 @@
+import pandas as pd
 import streamlit as st
+import sys
+from pathlib import Path
 
 st.set_page_config(
     page_title="Admin Landing Page",
@@ -8,6 +11,11 @@ st.set_page_config(
 )
 from edgewater_theme import apply_theme
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database import get_database_stats
+from rest.api import QUERY_STATS, EdgewaterAPI
+
+api = EdgewaterAPI()
 apply_theme()
 # Top navigation row
 top_row = st.columns([1, 2, 1])
@@ -87,3 +95,79 @@ with row4[3]:
         st.switch_page("pages/broker.py")
 with row4[4]:
     pass
+
+st.divider()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_table_health(exact: bool) -> pd.DataFrame:
+    stats = get_database_stats(exact=exact)
+    return pd.DataFrame(
+        {
+            "Table": list(stats["tables"]),
+            "Rows": list(stats["tables"].values()),
+            "Size (MB)": [stats["size_mb"][t] for t in stats["tables"]],
+        }
+    )
+
+
+with st.expander("📊 Table Health"):
+    exact_counts = st.toggle(
+        "Exact row counts",
+        key="table_health_exact",
+        help="Off: InnoDB estimates (instant). On: COUNT(*) every table.",
+    )
+    try:
+        health_df = _load_table_health(exact_counts)
+        st.dataframe(health_df, use_container_width=True, hide_index=True)
+        st.caption(
+            f"{len(health_df)} tables · "
+            f"{health_df['Size (MB)'].astype(float).sum():.1f} MB total"
+        )
+    except Exception as e:
+        st.error(f"❌ Could not load table stats: {e}")
+
+with st.expander("🐢 Query Performance"):
+    st.caption(
+        f"Last {len(QUERY_STATS)} statements across all sessions since startup. "
+        f"Statements over {QUERY_STATS.slow_query_ms:.0f} ms are also logged."
+    )
+    qp_cols = st.columns([1, 1, 4])
+    with qp_cols[0]:
+        top_n = st.number_input("Top N", min_value=5, max_value=100, value=15, step=5)
+    with qp_cols[1]:
+        if st.button("Clear", key="clear_query_stats"):
+            QUERY_STATS.clear()
+            st.rerun()
+
+    slow_tab, frequent_tab, total_tab = st.tabs(
+        ["Slowest (p95)", "Most frequent", "Most total time"]
+    )
+    for tab, sort_by in (
+        (slow_tab, "p95 (ms)"),
+        (frequent_tab, "Count"),
+        (total_tab, "Total (ms)"),
+    ):
+        with tab:
+            query_df = QUERY_STATS.summary(top_n=int(top_n), sort_by=sort_by)
+            if query_df.empty:
+                st.info("No queries recorded yet.")
+            else:
+                st.dataframe(query_df, use_container_width=True, hide_index=True)
+
+with st.expander("🧮 Cache Memory"):
+    st.caption(
+        "Memory of each cache loaded in this process: as loaded (object "
+        "columns) and after compact dtypes (Int32 IDs, categories, Arrow strings)."
+    )
+    memory_df = api.cache_memory_report()
+    if memory_df.empty:
+        st.info("No caches loaded yet.")
+    else:
+        st.dataframe(memory_df, use_container_width=True, hide_index=True)
+        loaded_mb = memory_df["Loaded (MB)"].sum()
+        compact_mb = memory_df["Compact (MB)"].sum()
+        st.caption(
+            f"{loaded_mb:.1f} MB as loaded → {compact_mb:.1f} MB compact "
+            f"({(1 - compact_mb / loaded_mb) * 100 if loaded_mb else 0:.0f}% saved)"
+        )
@@ -12,7 +12,7 @@ import streamlit as st
 import pandas as pd
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "rest"))
@@ -202,42 +202,26 @@ with form_col:
         label_visibility="collapsed",
     )
 
-    items_df = api.item_cache
     selected_item = None
 
-    if search_term and items_df is not None and not items_df.empty:
-        search_lower = search_term.lower()
-        mask = (
-            items_df["Item"].str.lower().str.contains(search_lower, na=False)
-            | items_df["Variety"].str.lower().str.contains(search_lower, na=False)
-            | items_df["Color"].str.lower().str.contains(search_lower, na=False)
-        )
-        matches = items_df[mask].head(20)
+    if search_term:
+        # Shared in-process index: no item-frame scan per keystroke
+        matches = dict(api.item_typeahead.search(search_term, k=20))
 
-        if matches.empty:
+        if not matches:
             st.caption("No items found.")
         else:
-            match_options = []
-            match_ids = []
-            for _, row in matches.iterrows():
-                display = str(row["Item"]) if pd.notna(row["Item"]) else "Unknown"
-                if pd.notna(row.get("Variety")):
-                    display += f" - {row['Variety']}"
-                if pd.notna(row.get("Color")):
-                    display += f" ({row['Color']})"
-                match_options.append(display)
-                match_ids.append(int(row["ItemID"]))
-
-            selected_label = st.selectbox(
+            selected_item_id = st.selectbox(
                 "Select item",
-                options=match_options,
+                options=list(matches),
+                format_func=matches.get,
                 key="pitch_item_select",
             )
 
-            if selected_label:
-                idx = match_options.index(selected_label)
-                selected_item_id = match_ids[idx]
-                selected_item = items_df[items_df["ItemID"] == selected_item_id].iloc[0]
+            if selected_item_id is not None:
+                selected_item = api.lookup_row(
+                    "items", selected_item_id, "employee_lookup"
+                )
 
                 info1, info2 = st.columns(2)
                 with info1:
@@ -333,22 +317,20 @@ with form_col:
 with log_col:
     st.markdown("### 📋 Today's Pitches")
 
-    pitch_df = api.pitch_view_cache
-
-    if pitch_df is not None and not pitch_df.empty:
-        if "DatePitched" in pitch_df.columns:
-            pitch_df = pitch_df.sort_values("DatePitched", ascending=False)
+    # Tiles and the log come from SQL (api.aggregate_view / query_view), so
+    # the page never loads the full pitch view
+    today = pd.Timestamp.now().normalize().to_pydatetime()
+    week_ago = today - timedelta(days=7)
+    pitch_metrics = {"pitches": "rows", "items": ("nunique", "ItemID")}
+    today_stats = api.aggregate_view("pitch", pitch_metrics, date_from=today)
+    week_stats = api.aggregate_view("pitch", pitch_metrics, date_from=week_ago)
 
-        today = pd.Timestamp.now().normalize()
-        today_pitches = pitch_df[
-            pd.to_datetime(pitch_df["DatePitched"], errors="coerce") >= today
-        ].copy()
-
-        if not today_pitches.empty:
+    if api.aggregate_view("pitch", {"rows": "rows"})["rows"]:
+        if today_stats["pitches"]:
             stat1, stat2 = st.columns(2)
             with stat1:
                 st.markdown(
-                    f'<div class="big-metric">{len(today_pitches)}</div>',
+                    f'<div class="big-metric">{today_stats["pitches"]}</div>',
                     unsafe_allow_html=True,
                 )
                 st.markdown(
@@ -356,13 +338,8 @@ with log_col:
                     unsafe_allow_html=True,
                 )
             with stat2:
-                unique_today = (
-                    today_pitches["ItemID"].nunique()
-                    if "ItemID" in today_pitches.columns
-                    else 0
-                )
                 st.markdown(
-                    f'<div class="big-metric">{unique_today}</div>',
+                    f'<div class="big-metric">{today_stats["items"]}</div>',
                     unsafe_allow_html=True,
                 )
                 st.markdown(
@@ -372,7 +349,8 @@ with log_col:
 
             st.markdown("---")
 
-            for _, row in today_pitches.head(20).iterrows():
+            today_pitches = api.query_view("pitch", date_from=today, limit=20)
+            for _, row in today_pitches.iterrows():
                 item_name = row["Item"] if pd.notna(row.get("Item")) else "Unknown"
                 variety = f" - {row['Variety']}" if pd.notna(row.get("Variety")) else ""
                 qty = row.get("NumberOfUnits", "?")
@@ -397,14 +375,10 @@ with log_col:
             st.caption("No pitches logged today yet.")
 
         st.markdown("---")
-        week_ago = today - pd.Timedelta(days=7)
-        week_pitches = pitch_df[
-            pd.to_datetime(pitch_df["DatePitched"], errors="coerce") >= week_ago
-        ]
-        if not week_pitches.empty:
+        if week_stats["pitches"]:
             st.caption(
-                f"**This week:** {len(week_pitches)} pitches, "
-                f"{week_pitches['ItemID'].nunique()} unique items"
+                f"**This week:** {week_stats['pitches']} pitches, "
+                f"{week_stats['items']} unique items"
             )
     else:
         st.caption("No pitch data available.")
@@ -140,42 +140,26 @@ with form_col:
         label_visibility="collapsed",
     )
 
-    items_df = api.item_cache
     selected_item = None
 
-    if search_term and items_df is not None and not items_df.empty:
-        search_lower = search_term.lower()
-        mask = (
-            items_df["Item"].str.lower().str.contains(search_lower, na=False)
-            | items_df["Variety"].str.lower().str.contains(search_lower, na=False)
-            | items_df["Color"].str.lower().str.contains(search_lower, na=False)
-        )
-        matches = items_df[mask].head(20)
+    if search_term:
+        # Shared in-process index: no item-frame scan per keystroke
+        matches = dict(api.item_typeahead.search(search_term, k=20))
 
-        if matches.empty:
+        if not matches:
             st.caption("No items found.")
         else:
-            match_options = []
-            match_ids = []
-            for _, row in matches.iterrows():
-                display = str(row["Item"]) if pd.notna(row["Item"]) else "Unknown"
-                if pd.notna(row.get("Variety")):
-                    display += f" - {row['Variety']}"
-                if pd.notna(row.get("Color")):
-                    display += f" ({row['Color']})"
-                match_options.append(display)
-                match_ids.append(int(row["ItemID"]))
-
-            selected_label = st.selectbox(
+            selected_item_id = st.selectbox(
                 "Select item",
-                options=match_options,
+                options=list(matches),
+                format_func=matches.get,
                 key="plant_item_select",
             )
 
-            if selected_label:
-                idx = match_options.index(selected_label)
-                selected_item_id = match_ids[idx]
-                selected_item = items_df[items_df["ItemID"] == selected_item_id].iloc[0]
+            if selected_item_id is not None:
+                selected_item = api.lookup_row(
+                    "items", selected_item_id, "employee_lookup"
+                )
 
                 info1, info2 = st.columns(2)
                 with info1:
@@ -274,7 +258,7 @@ with form_col:
 with log_col:
     st.markdown("### 📋 Today's Plantings")
 
-    planting_df = api.planting_view_cache
+    planting_df = api.view("plantings", "employee_lookup")
 
     if planting_df is not None and not planting_df.empty:
         today = pd.Timestamp.now().normalize()
@@ -19,7 +19,9 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "rest"))
 
+from config import get_config
 from rest.api import EdgewaterAPI
+from rest.filter_engine import FilterEngine
 from models import Inventory, Item, Unit
 
 # ===== STREAMLIT CONFIG =====
@@ -130,8 +132,6 @@ def refresh_data():
     with st.spinner("Refreshing data..."):
         api.refresh_view_cache("inventory")
         api.clear_lookup_caches()
-        for key in ("_inv_sorted", "_inv_by_id"):
-            st.session_state.pop(key, None)
     st.success("Data refreshed!", icon="✅")
 
 
@@ -239,59 +239,149 @@ _COL_LABELS = {
 
 
 # ================================================================
-# DATA LOADING — single read, derived structures cached in session_state
+# DATA LOADING — single read, derived structures shared via api.derived()
 # ================================================================
 
-_raw_cache = api.inventory_view_cache
+# Pushdown mode: filters, sort and LIMIT run in SQL (api.query_view) and the
+# full view is never loaded by this page
+PUSHDOWN_FILTERS = get_config().PUSHDOWN_FILTERS
 
-if _raw_cache is None or _raw_cache.empty:
+# Unfiltered total from SQL, so an empty table is detected without loading
+# the view in either mode
+total_items = api.aggregate_view("inventory", {"rows": "rows"})["rows"]
+
+if not total_items:
     st.markdown("# 📦 Inventory Manager")
     st.info("No inventory data available. Check your database connection.")
     if st.button("← Back to Home"):
         st.switch_page("edgewater.py")
     st.stop()
 
-inv_df = _raw_cache
-
 
-def _build_sorted(df: pd.DataFrame) -> pd.DataFrame:
-    """Sort inventory by date descending. Cached in session_state."""
+def _build_sorted() -> pd.DataFrame:
+    """Sort inventory by date descending."""
+    df = api.inventory_view_cache
     if "DateCounted" in df.columns:
         return df.sort_values("DateCounted", ascending=False)
     return df
 
 
-def _build_inv_index(df: pd.DataFrame) -> dict:
-    """Pre-build {InventoryID: Series} for O(1) per-record lookups."""
-    return {row["InventoryID"]: row for _, row in df.iterrows()}
-
+def _build_filters() -> FilterEngine:
+    """Filter masks over the sorted inventory."""
+    return FilterEngine(
+        api.derived("inventory_manager.sorted", _build_sorted, ["inventory"]),
+        categorical=["Type", "Location", "Inactive", "ShouldStock"],
+    )
 
-if "_inv_sorted" not in st.session_state:
-    st.session_state["_inv_sorted"] = _build_sorted(inv_df)
-sorted_inv = st.session_state["_inv_sorted"]
 
-if "_inv_by_id" not in st.session_state:
-    st.session_state["_inv_by_id"] = _build_inv_index(inv_df)
-inv_by_id = st.session_state["_inv_by_id"]
+# Status filter -> (flag column, value)
+_STATUS_FILTERS = {
+    "Active": ("Inactive", False),
+    "Inactive": ("Inactive", True),
+    "Should Stock": ("ShouldStock", True),
+}
 
 
 # ================================================================
 # FK decode maps for dropdown columns
-# These use Tier-1 cached lookups (no DB hit on rerun)
+# Built from Tier-1 lookups once per lookup change (api.derived)
 # ================================================================
 
-_loc_df = api.location_cache if api.location_cache is not None else pd.DataFrame()
 
-# ID -> display name (for rendering)
-_LOC_ID_TO_NAME = (
-    dict(zip(_loc_df["LocationID"], _loc_df["Location"])) if not _loc_df.empty else {}
+def _build_location_maps() -> tuple:
+    loc_df = api.location_cache if api.location_cache is not None else pd.DataFrame()
+    # ID -> display name (for rendering)
+    id_to_name = (
+        dict(zip(loc_df["LocationID"], loc_df["Location"])) if not loc_df.empty else {}
+    )
+    return (
+        id_to_name,
+        # Display name -> ID (for saving edits back to DB)
+        {v: k for k, v in id_to_name.items()},
+        # Options for SelectboxColumn (display names, with empty option)
+        [""] + sorted(id_to_name.values()),
+    )
+
+
+_LOC_ID_TO_NAME, _LOC_NAME_TO_ID, _LOC_DISPLAY_OPTIONS = api.derived(
+    "inventory_manager.locations", _build_location_maps, ["locations"]
 )
 
-# Display name -> ID (for saving edits back to DB)
-_LOC_NAME_TO_ID = {v: k for k, v in _LOC_ID_TO_NAME.items()}
 
-# Options for SelectboxColumn (display names, with empty option)
-_LOC_DISPLAY_OPTIONS = [""] + sorted(_LOC_ID_TO_NAME.values())
+def _build_unit_map() -> dict:
+    """Add-form unit labels ("Type - Size") -> UnitID."""
+    units_df = api.unit_cache
+    if units_df is None or units_df.empty:
+        return {}
+    unit_map = {}
+    for unit_id, unit_type, unit_size in zip(
+        units_df["UnitID"], units_df["UnitType"], units_df["UnitSize"]
+    ):
+        label = str(unit_type)
+        if pd.notna(unit_size) and unit_size:
+            label += f" - {unit_size}"
+        unit_map[label] = unit_id
+    return unit_map
+
+
+# ===== APPLY FILTERS =====
+# Before the sidebar, so its multiselects can show facet counts
+page_filters = dict(
+    search=st.session_state.filter_search,
+    types=st.session_state.filter_types,
+    locations=st.session_state.filter_locations,
+    status=(
+        None
+        if st.session_state.filter_status == "All"
+        else st.session_state.filter_status
+    ),
+)
+# Sidebar statistics over the filtered counts, evaluated in SQL
+stats = api.aggregate_view(
+    "inventory",
+    {
+        "rows": "rows",
+        "unique_items": ("nunique", "ItemID"),
+        "active": ("false", "Inactive"),
+    },
+    **page_filters,
+)
+
+if PUSHDOWN_FILTERS:
+    # Only the visible page of rows is transferred; no facet counts
+    filtered_df = api.query_view(
+        "inventory", limit=st.session_state.results_limit, **page_filters
+    )
+    total_filtered = stats["rows"] or 0
+    type_counts, location_counts = {}, {}
+else:
+    inv_filters = api.derived(
+        "inventory_manager.filters", _build_filters, ["inventory"]
+    )
+    search_mask = None
+    if st.session_state.filter_search:
+        matches = api.search_items(
+            st.session_state.filter_search, active_only=False, limit=None
+        )
+        search_mask = inv_filters.isin_mask("ItemID", matches["ItemID"])
+
+    status_filter = {}
+    if st.session_state.filter_status in _STATUS_FILTERS:
+        flag_column, flag_value = _STATUS_FILTERS[st.session_state.filter_status]
+        status_filter = {flag_column: [flag_value]}
+
+    filter_result = inv_filters.query(
+        isin={
+            "Type": st.session_state.filter_types,
+            "Location": st.session_state.filter_locations,
+            **status_filter,
+        },
+        where=search_mask,
+    )
+    total_filtered = filter_result.count
+    filtered_df = filter_result.df.head(st.session_state.results_limit)
+    type_counts = filter_result.facets.get("Type", {})
+    location_counts = filter_result.facets.get("Location", {})
 
 
 # ===== SIDEBAR =====
@@ -328,17 +418,21 @@ with st.sidebar:
         "Item Types",
         options=item_types,
         default=st.session_state.filter_types,
+        format_func=lambda t: f"{t} ({type_counts.get(t, 0)})" if type_counts else t,
         key="type_filter",
     )
     if selected_types != st.session_state.filter_types:
         st.session_state.filter_types = selected_types
         st.rerun()
 
-    location_options = _loc_df["Location"].tolist() if not _loc_df.empty else []
+    location_options = list(_LOC_ID_TO_NAME.values())
     selected_locations = st.multiselect(
         "Location",
         options=location_options,
         default=st.session_state.filter_locations,
+        format_func=lambda loc: (
+            f"{loc} ({location_counts.get(loc, 0)})" if location_counts else loc
+        ),
         key="location_filter",
     )
     if selected_locations != st.session_state.filter_locations:
@@ -379,15 +473,9 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### 📊 Statistics")
 
-    total_items = len(inv_df)
-    unique_items = inv_df["ItemID"].nunique() if "ItemID" in inv_df.columns else 0
-    active_items = (
-        len(inv_df[inv_df["Inactive"] == False]) if "Inactive" in inv_df.columns else 0
-    )
-
-    st.metric("Total Counts", total_items)
-    st.metric("Unique Items", unique_items)
-    st.metric("Active Items", active_items)
+    st.metric("Counts", stats["rows"])
+    st.metric("Unique Items", stats["unique_items"])
+    st.metric("Active Items", stats["active"])
 
 
 # ===== MAIN HEADER =====
@@ -399,37 +487,6 @@ tab_cards, tab_table, tab_create = st.tabs(
     ["📋 Inventory Cards", "📊 Table View", "➕ Add Count"]
 )
 
-# ===== APPLY FILTERS =====
-filtered_df = sorted_inv
-
-if st.session_state.filter_search:
-    search_lower = st.session_state.filter_search.lower()
-    mask = (
-        filtered_df["Item"].str.lower().str.contains(search_lower, na=False)
-        | filtered_df["Variety"].str.lower().str.contains(search_lower, na=False)
-        | filtered_df["Color"].str.lower().str.contains(search_lower, na=False)
-    )
-    filtered_df = filtered_df[mask]
-
-if st.session_state.filter_types:
-    filtered_df = filtered_df[filtered_df["Type"].isin(st.session_state.filter_types)]
-
-if st.session_state.filter_locations:
-    if "Location" in filtered_df.columns:
-        filtered_df = filtered_df[
-            filtered_df["Location"].isin(st.session_state.filter_locations)
-        ]
-
-if st.session_state.filter_status == "Active":
-    filtered_df = filtered_df[filtered_df["Inactive"] == False]
-elif st.session_state.filter_status == "Inactive":
-    filtered_df = filtered_df[filtered_df["Inactive"] == True]
-elif st.session_state.filter_status == "Should Stock":
-    filtered_df = filtered_df[filtered_df["ShouldStock"] == True]
-
-total_filtered = len(filtered_df)
-filtered_df = filtered_df.head(st.session_state.results_limit)
-
 
 # ==================== TAB 1: INVENTORY CARDS ====================
 # Uses st.expander — expanding/collapsing does NOT trigger st.rerun().
@@ -590,7 +647,6 @@ with tab_cards:
                             allowed_fields=_EDITABLE_INVENTORY_COLS,
                         )
                         st.success("✅ Updated successfully!")
-                        refresh_data()
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Update failed: {e}")
@@ -608,7 +664,6 @@ with tab_cards:
                     try:
                         api._delete(Inventory, "InventoryID", inv_id)
                         st.success("Deleted!")
-                        refresh_data()
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Error deleting: {e}")
@@ -637,43 +692,24 @@ with tab_create:
     st.markdown("### ➕ Add New Inventory Count")
 
     # Lookup data for dropdowns (Tier-1 cached, no DB hit on rerun)
-    items_df = api.item_cache
-    units_df = api.unit_cache
+    item_picker = api.item_typeahead
+    unit_map = api.derived("inventory_manager.unit_labels", _build_unit_map, ["units"])
 
-    if items_df is None or items_df.empty or units_df is None or units_df.empty:
+    if not len(item_picker) or not unit_map:
         st.warning("⚠️ Item or Unit data not loaded. Please refresh data.")
     else:
         with st.form("add_inventory_form", clear_on_submit=True):
             col1, col2 = st.columns(2)
 
             with col1:
-                # Item selection — build label->ID map
-                item_map = {}
-                for _, r in items_df.iterrows():
-                    name = r.get("Item")
-                    if pd.isna(name) or not name:
-                        continue
-                    label = str(name)
-                    if pd.notna(r.get("Variety")) and r["Variety"]:
-                        label += f" - {r['Variety']}"
-                    if pd.notna(r.get("Color")) and r["Color"]:
-                        label += f" ({r['Color']})"
-                    item_map[label] = r["ItemID"]
-
+                # Labels precomputed by the shared typeahead index
                 selected_item_label = st.selectbox(
                     "Select Item *",
-                    options=[""] + sorted(item_map.keys()),
+                    options=[""] + item_picker.options,
                     key="form_item",
                 )
 
-                # Unit selection — build label->ID map
-                unit_map = {}
-                for _, r in units_df.iterrows():
-                    label = str(r["UnitType"])
-                    if pd.notna(r.get("UnitSize")) and r["UnitSize"]:
-                        label += f" - {r['UnitSize']}"
-                    unit_map[label] = r["UnitID"]
-
+                # Unit selection — label->ID map from _build_unit_map
                 selected_unit_label = st.selectbox(
                     "Select Unit *",
                     options=[""] + sorted(unit_map.keys()),
@@ -716,7 +752,7 @@ with tab_create:
                     for err in errors:
                         st.error(err)
                 else:
-                    selected_item_id = item_map[selected_item_label]
+                    selected_item_id = item_picker.id_for(selected_item_label)
                     selected_unit_id = unit_map[selected_unit_label]
                     selected_location_id = (
                         _LOC_NAME_TO_ID.get(selected_loc_label)
@@ -736,7 +772,6 @@ with tab_create:
                             LocationID=selected_location_id,
                         )
                         st.success("✅ Inventory count added successfully!")
-                        refresh_data()
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Error adding inventory: {e}")
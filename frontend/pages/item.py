@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "rest"))
 from rest.api import EdgewaterAPI
 from export_utils import export_csv
+from paged_grid import paged_grid
 from models import Item as IM
 from payloads import ItemPayload
 
@@ -99,29 +100,30 @@ def create_item_from_form(form_data: dict) -> Optional[dict]:
         return None
 
 
+ITEM_ALLOWED_FIELDS = {
+    "Item",
+    "Variety",
+    "Color",
+    "Inactive",
+    "ShouldStock",
+    "TypeID",
+    "LabelDescription",
+    "Definition",
+    "PictureLayout",
+    "PictureLink",
+    "SunConditions",
+}
+
+
 def update_item(item_id: int, updates: dict) -> bool:
     """Update an item using the API's generic_update method"""
     try:
-        allowed_fields = {
-            "Item",
-            "Variety",
-            "Color",
-            "Inactive",
-            "ShouldStock",
-            "TypeID",
-            "LabelDescription",
-            "Definition",
-            "PictureLayout",
-            "PictureLink",
-            "SunConditions",
-        }
-
         result = api.generic_update(
             model_class=IM,
             id_column="ItemID",
             id_value=item_id,
             updates=updates,
-            allowed_fields=allowed_fields,
+            allowed_fields=ITEM_ALLOWED_FIELDS,
         )
 
         if result:
@@ -134,6 +136,29 @@ def update_item(item_id: int, updates: dict) -> bool:
         return False
 
 
+def update_items(updates_by_id: dict) -> int:
+    """Update many items in one transaction. Returns the number updated."""
+    try:
+        results = api.generic_update_many(
+            model_class=IM,
+            id_column="ItemID",
+            updates_by_id={int(k): v for k, v in updates_by_id.items()},
+            allowed_fields=ITEM_ALLOWED_FIELDS,
+        )
+        failed = [item_id for item_id, result in results.items() if result is None]
+        if failed:
+            logger.warning(f"Failed to update items: {failed}")
+        for item_id in failed:
+            st.error(
+                f"❌ Error updating item {item_id}: {results.errors.get(item_id)}"
+            )
+        return len(results) - len(failed)
+    except Exception as e:
+        st.error(f"❌ Error updating items: {e}")
+        logger.error(f"Batch update failed for Items: {e}")
+        return 0
+
+
 def delete_item(item_id: int) -> bool:
     """Delete an item using the API's _delete method"""
     try:
@@ -262,39 +287,26 @@ with filter_col4:
         key="stock_filter",
     )
 
-# Apply filters
-# Data is already loaded by ensure_caches_loaded()
-filtered_df = api.item_cache.copy()
-
-# Search filter
-if search_term:
-    mask = (
-        filtered_df["Item"].fillna("").str.contains(search_term, case=False)
-        | filtered_df["Variety"].fillna("").str.contains(search_term, case=False)
-        | filtered_df["Color"].fillna("").str.contains(search_term, case=False)
-    )
-    filtered_df = filtered_df[mask]
-
+# Filters run in SQL; the grid below fetches one page at a time
+filters = dict(
+    search=search_term,
+    inactive={"Active Only": [False], "Inactive Only": [True]}.get(status_filter, []),
+    should_stock={"Should Stock": [True], "Don't Stock": [False]}.get(
+        stock_filter, []
+    ),
+)
 if type_filter:
-    type_ids = api.item_type_cache[api.item_type_cache["Type"].isin(type_filter)][
-        "TypeID"
-    ].tolist()
-    filtered_df = filtered_df[filtered_df["TypeID"].isin(type_ids)]
-
-if status_filter == "Active Only":
-    filtered_df = filtered_df[filtered_df["Inactive"] == False]
-elif status_filter == "Inactive Only":
-    filtered_df = filtered_df[filtered_df["Inactive"] == True]
-
-if stock_filter == "Should Stock":
-    filtered_df = filtered_df[filtered_df["ShouldStock"] == True]
-elif stock_filter == "Don't Stock":
-    filtered_df = filtered_df[filtered_df["ShouldStock"] == False]
+    filters["types"] = api.item_type_cache[
+        api.item_type_cache["Type"].isin(type_filter)
+    ]["TypeID"].tolist()
 
 st.divider()
 
 # ==================== DATA DISPLAY & EDITING ====================
-st.write(f"### 📊 Items ({len(filtered_df)} records)")
+total_filtered = api.aggregate_view(
+    "item_table", {"rows": "rows"}, **filters
+)["rows"]
+st.write(f"### 📊 Items ({total_filtered} records)")
 
 # Action buttons
 action_col1, action_col2 = st.columns([1, 5])
@@ -310,7 +322,7 @@ with action_col1:
 
 with action_col2:
     if st.button("📥 Export CSV", use_container_width=True):
-        csv = export_csv(filtered_df, IM)
+        csv = export_csv(api.query_view("item_table", **filters), IM)
         st.download_button(
             label="Download CSV",
             data=csv,
@@ -337,14 +349,17 @@ column_config = {
 if st.session_state.edit_mode:
     st.info("✏️ **Edit Mode** - Make changes, then click 'Save Changes'")
 
-    edited_df = st.data_editor(
-        filtered_df,
-        use_container_width=True,
-        num_rows="fixed",  # No row deletion in table - use bulk delete
+    grid = paged_grid(
+        api,
+        "item_table",
+        key="items",
+        filters=filters,
         column_config=column_config,
-        hide_index=True,
-        key="items_editor",
+        default_sort="ItemID",
+        default_descending=False,
+        editable=True,
     )
+    filtered_df, edited_df = grid.df, grid.edited
 
     if not edited_df.equals(filtered_df):
         st.warning(f"⚠️ Unsaved changes detected!")
@@ -355,8 +370,7 @@ if st.session_state.edit_mode:
             if st.button(
                 "💾 Save All Changes", type="primary", use_container_width=True
             ):
-                success_count = 0
-                error_count = 0
+                all_changes = {}
 
                 for idx in edited_df.index:
                     item_id = edited_df.loc[idx, "ItemID"]
@@ -371,14 +385,18 @@ if st.session_state.edit_mode:
 
                             if pd.isna(orig_val) and pd.isna(edit_val):
                                 continue
-                            if orig_val != edit_val:
+                            if (
+                                pd.isna(orig_val)
+                                or pd.isna(edit_val)
+                                or orig_val != edit_val
+                            ):
                                 changes[col] = edit_val
 
                     if changes:
-                        if update_item(item_id, changes):
-                            success_count += 1
-                        else:
-                            error_count += 1
+                        all_changes[item_id] = changes
+
+                success_count = update_items(all_changes)
+                error_count = len(all_changes) - success_count
 
                 if success_count > 0:
                     st.success(f"✅ Updated {success_count} items")
@@ -392,11 +410,14 @@ if st.session_state.edit_mode:
             if st.button("🔄 Discard Changes", use_container_width=True):
                 st.rerun()
 else:
-    st.dataframe(
-        filtered_df,
-        use_container_width=True,
+    paged_grid(
+        api,
+        "item_table",
+        key="items",
+        filters=filters,
         column_config=column_config,
-        hide_index=True,
+        default_sort="ItemID",
+        default_descending=False,
     )
 
 # ==================== BULK OPERATIONS ====================
@@ -419,7 +440,7 @@ with st.expander("🔧 Bulk Operations"):
         if st.button("Set Inactive", key="bulk_inactive_btn"):
             if inactive_ids:
                 ids = [int(x.strip()) for x in inactive_ids.split(",")]
-                success = sum([update_item(id, {"Inactive": True}) for id in ids])
+                success = update_items({id: {"Inactive": True} for id in ids})
                 st.success(f"✅ Marked {success}/{len(ids)} items as inactive")
                 refresh_cache()
                 st.rerun()
@@ -438,7 +459,7 @@ with st.expander("🔧 Bulk Operations"):
         if st.button("Update Type", key="bulk_type_btn"):
             if bulk_type_ids:
                 ids = [int(x.strip()) for x in bulk_type_ids.split(",")]
-                success = sum([update_item(id, {"TypeID": new_type}) for id in ids])
+                success = update_items({id: {"TypeID": new_type} for id in ids})
                 st.success(f"✅ Updated type for {success}/{len(ids)} items")
                 refresh_cache()
                 st.rerun()
@@ -464,8 +485,9 @@ st.divider()
 col1, col2 = st.columns([3, 1])
 
 with col1:
+    total_records = api.aggregate_view("item_table", {"rows": "rows"})["rows"]
     st.caption(
-        f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total items in database: {len(api.item_cache)}"
+        f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total items in database: {total_records}"
     )
 
 with col2:
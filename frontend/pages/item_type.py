@@ -214,7 +214,11 @@ if st.session_state.edit_mode:
 
                             if pd.isna(orig_val) and pd.isna(edit_val):
                                 continue
-                            if orig_val != edit_val:
+                            if (
+                                pd.isna(orig_val)
+                                or pd.isna(edit_val)
+                                or orig_val != edit_val
+                            ):
                                 changes[col] = edit_val
 
                     if changes:
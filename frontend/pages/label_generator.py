@@ -107,6 +107,7 @@ if "search_term" not in st.session_state:
 def refresh_data():
     with st.spinner("Refreshing data..."):
         api.refresh_view_cache("labels")
+        api.refresh_view_cache("item_prices")
         api.clear_lookup_caches()
     st.success("✅ Data refreshed!", icon="✅")
 
@@ -123,27 +124,25 @@ def build_item_display_name(row):
 
 def get_label_data_for_item(item_id):
     """Get all label-relevant data for an item from the label view"""
-    label_df = api.label_view_cache
+    label_df = api.view("labels", "label_print")
     if label_df is None or label_df.empty:
         return None
     matches = label_df[label_df["ItemID"] == item_id]
     if matches.empty:
         return None
-    # Take the first row for base item data (there may be multiple price rows)
     row = matches.iloc[0].to_dict()
-    # Collect all prices
-    prices = []
-    for _, price_row in matches.iterrows():
-        if pd.notna(price_row.get("UnitPrice")):
-            prices.append(
-                {
-                    "unit_type": price_row.get("UnitType", ""),
-                    "unit_size": price_row.get("UnitSize", ""),
-                    "unit_price": float(price_row["UnitPrice"]),
-                    "year": str(price_row.get("Year", "")),
-                }
-            )
-    row["prices"] = prices
+    # Prices are a separate dataset indexed by ItemID
+    item_prices = api.get_children("item_prices", item_id)
+    item_prices = item_prices[item_prices["UnitPrice"].notna()]
+    row["prices"] = [
+        {
+            "unit_type": price_row.get("UnitType", ""),
+            "unit_size": price_row.get("UnitSize", ""),
+            "unit_price": float(price_row["UnitPrice"]),
+            "year": str(price_row["Year"]) if pd.notna(price_row["Year"]) else "",
+        }
+        for price_row in item_prices.to_dict("records")
+    ]
     return row
 
 
@@ -204,9 +203,9 @@ def export_label_order_json():
             "prices": data.get("prices", []),
         }
 
-        # Clean up NaN values for JSON
+        # Clean up NaN/NA values for JSON
         for key, val in item_export.items():
-            if isinstance(val, float) and pd.isna(val):
+            if not isinstance(val, list) and pd.isna(val):
                 item_export[key] = None
             elif isinstance(val, str) and val == "nan":
                 item_export[key] = None
@@ -306,44 +305,42 @@ with tab_search:
         )
 
     # Get label data
-    label_df = (
-        api.label_view_cache.copy()
-        if api.label_view_cache is not None
-        else pd.DataFrame()
-    )
+    label_df = api.view("labels", "label_print")
 
     if label_df.empty:
         st.info("No label data available.")
     else:
-        # Deduplicate to unique items (label view has multiple rows per item due to price joins)
-        unique_items = label_df.drop_duplicates(subset=["ItemID"]).copy()
+        # One row per item; prices come from the item_prices child dataset
+        unique_items = label_df
 
-        # Apply search
         if search_term:
-            search_lower = search_term.lower()
-            mask = (
-                unique_items["Item"].str.lower().str.contains(search_lower, na=False)
-                | unique_items["Variety"]
-                .str.lower()
-                .str.contains(search_lower, na=False)
-                | unique_items["Color"].str.lower().str.contains(search_lower, na=False)
-                | unique_items["LabelDescription"]
-                .str.lower()
-                .str.contains(search_lower, na=False)
+            # Ranked server-side; the type filter and active-only go along
+            matches = api.search_items(
+                search_term,
+                type=None if type_filter == "All" else type_filter,
+                limit=None,
             )
-            unique_items = unique_items[mask]
-
-        # Apply type filter
-        if type_filter != "All":
-            unique_items = unique_items[unique_items["Type"] == type_filter]
+            unique_items = matches[["ItemID"]].merge(unique_items, on="ItemID")
+        else:
+            # Apply type filter
+            if type_filter != "All":
+                unique_items = unique_items[unique_items["Type"] == type_filter]
 
-        # Only show active items by default
-        unique_items = unique_items[unique_items["Inactive"] != True]
+            # Only show active items by default
+            unique_items = unique_items[unique_items["Inactive"] != True]
 
         st.caption(f"{len(unique_items)} items found")
 
+        shown_items = unique_items.head(50)
+        shown_prices = (
+            api.get_children("item_prices", shown_items["ItemID"])
+            .dropna(subset=["UnitPrice"])
+            .drop_duplicates(subset=["ItemID"])
+            .set_index("ItemID")
+        )
+
         # Display results
-        for _, row in unique_items.head(50).iterrows():
+        for _, row in shown_items.iterrows():
             item_col1, item_col2, item_col3, item_col4 = st.columns([3, 1, 1, 1])
 
             with item_col1:
@@ -370,13 +367,14 @@ with tab_search:
 
             with item_col3:
                 # Show price if available
-                if pd.notna(row.get("UnitPrice")):
-                    st.markdown(f"**${row['UnitPrice']:.2f}**")
+                if row["ItemID"] in shown_prices.index:
+                    price = shown_prices.loc[row["ItemID"]]
+                    st.markdown(f"**${price['UnitPrice']:.2f}**")
                     unit_info = ""
-                    if pd.notna(row.get("UnitSize")):
-                        unit_info += str(row["UnitSize"])
-                    if pd.notna(row.get("UnitType")):
-                        unit_info += f" {row['UnitType']}"
+                    if pd.notna(price.get("UnitSize")):
+                        unit_info += str(price["UnitSize"])
+                    if pd.notna(price.get("UnitType")):
+                        unit_info += f" {price['UnitType']}"
                     if unit_info:
                         st.caption(unit_info.strip())
 
@@ -425,16 +423,16 @@ with tab_order:
                 st.markdown(f"**{entry['display_name']}**")
 
                 details = []
-                if data.get("Type") and pd.notna(data.get("Type")):
+                if pd.notna(data.get("Type")) and data.get("Type"):
                     details.append(f"Type: {data['Type']}")
-                if data.get("SunConditions") and pd.notna(data.get("SunConditions")):
+                if pd.notna(data.get("SunConditions")) and data.get("SunConditions"):
                     details.append(f"Sun: {data['SunConditions']}")
                 if details:
                     st.caption(" | ".join(details))
 
                 # Show label description
-                if data.get("LabelDescription") and pd.notna(
-                    data.get("LabelDescription")
+                if pd.notna(data.get("LabelDescription")) and data.get(
+                    "LabelDescription"
                 ):
                     with st.expander("Label Description", expanded=False):
                         st.write(data["LabelDescription"])
@@ -577,12 +575,8 @@ st.markdown("---")
 col1, col2 = st.columns([3, 1])
 
 with col1:
-    label_df = api.label_view_cache
-    item_count = (
-        label_df["ItemID"].nunique()
-        if label_df is not None and not label_df.empty
-        else 0
-    )
+    label_df = api.view("labels", "label_print")
+    item_count = len(label_df) if label_df is not None else 0
     st.caption(
         f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
         f"{item_count} items available"
@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "rest"))
 from rest.api import EdgewaterAPI
 from export_utils import export_csv
+from paged_grid import paged_grid
 from models import OrderItem as ORI
 
 api = EdgewaterAPI()
@@ -63,30 +64,31 @@ def create_order_item_from_form(form_data: dict) -> Optional[dict]:
         return None
 
 
+ORDER_ITEM_ALLOWED_FIELDS = {
+    "OrderID",
+    "ItemID",
+    "ItemCode",
+    "OrderItemTypeID",
+    "Unit",
+    "UnitPrice",
+    "NumberOfUnits",
+    "Received",
+    "OrderNote",
+    "OrderComments",
+    "Leftover",
+    "ToOrder",
+}
+
+
 def update_order_item(order_item_id: int, updates: dict) -> bool:
     """Update an order item"""
     try:
-        allowed_fields = {
-            "OrderID",
-            "ItemID",
-            "ItemCode",
-            "OrderItemTypeID",
-            "Unit",
-            "UnitPrice",
-            "NumberOfUnits",
-            "Received",
-            "OrderNote",
-            "OrderComments",
-            "Leftover",
-            "ToOrder",
-        }
-
         result = api.generic_update(
             model_class=ORI,
             id_column="OrderItemID",
             id_value=order_item_id,
             updates=updates,
-            allowed_fields=allowed_fields,
+            allowed_fields=ORDER_ITEM_ALLOWED_FIELDS,
         )
 
         if result:
@@ -99,6 +101,29 @@ def update_order_item(order_item_id: int, updates: dict) -> bool:
         return False
 
 
+def update_order_items(updates_by_id: dict) -> int:
+    """Update many order items in one transaction. Returns the number updated."""
+    try:
+        results = api.generic_update_many(
+            model_class=ORI,
+            id_column="OrderItemID",
+            updates_by_id={int(k): v for k, v in updates_by_id.items()},
+            allowed_fields=ORDER_ITEM_ALLOWED_FIELDS,
+        )
+        failed = [key for key, result in results.items() if result is None]
+        if failed:
+            logger.warning(f"Failed to update order items: {failed}")
+        for key in failed:
+            st.error(
+                f"❌ Error updating order item {key}: {results.errors.get(key)}"
+            )
+        return len(results) - len(failed)
+    except Exception as e:
+        st.error(f"❌ Error updating order items: {e}")
+        logger.error(f"Batch update failed for OrderItems: {e}")
+        return 0
+
+
 def delete_order_item(order_item_id: int) -> bool:
     """Delete an order item"""
     try:
@@ -127,10 +152,7 @@ st.divider()
 
 # ==================== LOAD DATA ====================
 # Prepare lookup dictionaries
-items_dict = {
-    int(k): str(v)
-    for k, v in api.item_cache.set_index("ItemID")["Item"].to_dict().items()
-}
+item_picker = api.item_typeahead
 order_item_types_dict = {
     int(k): str(v)
     for k, v in api.order_item_type_cache.set_index("OrderItemTypeID")["OrderItemType"]
@@ -157,8 +179,8 @@ with st.expander("➕ Add New Order Item", expanded=st.session_state.show_add_fo
             )
             form_item_id = st.selectbox(
                 "Item *",
-                options=list(items_dict.keys()),
-                format_func=lambda x: items_dict[x],
+                options=item_picker.item_ids,
+                format_func=item_picker.label_for,
                 key="form_item_id",
             )
             form_item_code = st.text_input("Item Code", key="form_item_code")
@@ -253,30 +275,23 @@ with filter_col3:
         key="received_filter",
     )
 
-# Apply filters
-filtered_df = api.order_item_cache.copy()
-
-# Order ID filter
-if order_id_filter > 0:
-    filtered_df = filtered_df[filtered_df["OrderID"] == order_id_filter]
-
-# Item filter
+# Filters run in SQL; the grid below fetches one page at a time
+filters = dict(
+    orders=[order_id_filter] if order_id_filter > 0 else [],
+    received={"Received": [True], "Not Received": [False]}.get(received_filter, []),
+)
 if item_filter:
-    item_ids = api.item_cache[api.item_cache["Item"].isin(item_filter)][
+    filters["items"] = api.item_cache[api.item_cache["Item"].isin(item_filter)][
         "ItemID"
     ].tolist()
-    filtered_df = filtered_df[filtered_df["ItemID"].isin(item_ids)]
-
-# Received filter
-if received_filter == "Received":
-    filtered_df = filtered_df[filtered_df["Received"] == True]
-elif received_filter == "Not Received":
-    filtered_df = filtered_df[filtered_df["Received"] == False]
 
 st.divider()
 
 # ==================== DATA DISPLAY & EDITING ====================
-st.write(f"### 📊 Order Items ({len(filtered_df)} records)")
+total_filtered = api.aggregate_view(
+    "order_item_table", {"rows": "rows"}, **filters
+)["rows"]
+st.write(f"### 📊 Order Items ({total_filtered} records)")
 
 # Action buttons
 action_col1, action_col2 = st.columns([1, 5])
@@ -292,7 +307,7 @@ with action_col1:
 
 with action_col2:
     if st.button("📥 Export CSV", use_container_width=True):
-        csv = export_csv(filtered_df, ORI)
+        csv = export_csv(api.query_view("order_item_table", **filters), ORI)
         st.download_button(
             label="Download CSV",
             data=csv,
@@ -322,14 +337,17 @@ column_config = {
 if st.session_state.edit_mode:
     st.info("✏️ **Edit Mode** - Make changes, then click 'Save Changes'")
 
-    edited_df = st.data_editor(
-        filtered_df,
-        use_container_width=True,
-        num_rows="fixed",
+    grid = paged_grid(
+        api,
+        "order_item_table",
+        key="order_items",
+        filters=filters,
         column_config=column_config,
-        hide_index=True,
-        key="order_items_editor",
+        default_sort="OrderItemID",
+        default_descending=False,
+        editable=True,
     )
+    filtered_df, edited_df = grid.df, grid.edited
 
     if not edited_df.equals(filtered_df):
         st.warning(f"⚠️ Unsaved changes detected!")
@@ -340,8 +358,7 @@ if st.session_state.edit_mode:
             if st.button(
                 "💾 Save All Changes", type="primary", use_container_width=True
             ):
-                success_count = 0
-                error_count = 0
+                all_changes = {}
 
                 for idx in edited_df.index:
                     order_item_id = edited_df.loc[idx, "OrderItemID"]
@@ -356,14 +373,18 @@ if st.session_state.edit_mode:
 
                             if pd.isna(orig_val) and pd.isna(edit_val):
                                 continue
-                            if orig_val != edit_val:
+                            if (
+                                pd.isna(orig_val)
+                                or pd.isna(edit_val)
+                                or orig_val != edit_val
+                            ):
                                 changes[col] = edit_val
 
                     if changes:
-                        if update_order_item(order_item_id, changes):
-                            success_count += 1
-                        else:
-                            error_count += 1
+                        all_changes[order_item_id] = changes
+
+                success_count = update_order_items(all_changes)
+                error_count = len(all_changes) - success_count
 
                 if success_count > 0:
                     st.success(f"✅ Updated {success_count} order items")
@@ -377,11 +398,14 @@ if st.session_state.edit_mode:
             if st.button("🔄 Discard Changes", use_container_width=True):
                 st.rerun()
 else:
-    st.dataframe(
-        filtered_df,
-        use_container_width=True,
+    paged_grid(
+        api,
+        "order_item_table",
+        key="order_items",
+        filters=filters,
         column_config=column_config,
-        hide_index=True,
+        default_sort="OrderItemID",
+        default_descending=False,
     )
 
 # ==================== BULK OPERATIONS ====================
@@ -401,7 +425,7 @@ with st.expander("🔧 Bulk Operations"):
         if st.button("✅ Mark Received", key="bulk_received_btn"):
             if received_ids:
                 ids = [int(x.strip()) for x in received_ids.split(",")]
-                success = sum([update_order_item(id, {"Received": True}) for id in ids])
+                success = update_order_items({id: {"Received": True} for id in ids})
                 st.success(f"✅ Marked {success}/{len(ids)} order items as received")
                 refresh_cache()
                 st.rerun()
@@ -426,6 +450,7 @@ with st.expander("🔧 Bulk Operations"):
 # ==================== FOOTER ====================
 st.divider()
 
+total_records = api.aggregate_view("order_item_table", {"rows": "rows"})["rows"]
 st.caption(
-    f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total order items: {len(api.order_item_cache)}"
+    f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total order items: {total_records}"
 )
@@ -20,6 +20,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "rest"))
 
 from rest.api import EdgewaterAPI
+from rest.filter_engine import FilterEngine
+from paged_grid import paged_grid
 from models import Order, OrderItem, OrderItemDestination
 
 # ===== STREAMLIT CONFIG =====
@@ -138,10 +140,10 @@ if "results_limit" not in st.session_state:
 def refresh_data():
     """Refresh view cache and invalidate derived structures."""
     with st.spinner("Refreshing data..."):
+        api.refresh_view_cache("orders_summary")
         api.refresh_view_cache("orders")
+        api.refresh_view_cache("order_destinations")
         api.clear_lookup_caches()
-        for key in ("_order_summary", "_order_items_by_id"):
-            st.session_state.pop(key, None)
     st.success("Data refreshed!", icon="✅")
 
 
@@ -278,45 +280,35 @@ _COL_LABELS = {
 
 
 # ================================================================
-# DATA LOADING — single read, derived structures cached in session_state
+# DATA LOADING — shared ViewStore frames, derived structures via api.derived
 # ================================================================
 
-_raw_cache = api.order_view_cache
+# One row per order (v_orders_summary): drives the summary and timeline tabs,
+# filters and metrics. The full item view loads only when an order's items
+# or the All Items tab are opened.
+summary = api.order_summary_view_cache
 
-if _raw_cache is None or _raw_cache.empty:
+if summary is None or summary.empty:
     st.markdown("# 📦 Order Tracking")
     st.info("No order data available. Check your database connection.")
     if st.button("← Back to Home"):
         st.switch_page("edgewater.py")
     st.stop()
 
-order_df = _raw_cache
-
-
-def _build_summary(df: pd.DataFrame) -> pd.DataFrame:
-    """Build order-level summary. Cached in session_state."""
-    s = (
-        df.groupby("OrderID")
-        .agg(
-            {
-                "Supplier": "first",
-                "Broker": "first",
-                "Shipper": "first",
-                "DatePlaced": "first",
-                "DateDue": "first",
-                "DateReceived": "first",
-                "OrderNumber": "first",
-                "TrackingNumber": "first",
-                "TotalCost": "first",
-                "GrowingSeason": "first",
-                "OrderComments": "first",
-                "OrderItemID": "count",
-            }
-        )
-        .reset_index()
-        .rename(columns={"OrderItemID": "ItemCount"})
+
+def _build_summary_filters() -> FilterEngine:
+    """Filter masks, date indexes and search text over the order summary."""
+    return FilterEngine(
+        api.order_summary_view_cache,
+        categorical=["Supplier", "GrowingSeason"],
+        dates=["DatePlaced", "DateReceived", "DateDue"],
+        text=["Supplier", "OrderNumber", "OrderComments"],
     )
-    return s.sort_values("DatePlaced", ascending=False)
+
+
+summary_filters = api.derived(
+    "order_tracking.summary_filters", _build_summary_filters, ["orders_summary"]
+)
 
 
 def _build_order_index(df: pd.DataFrame) -> dict:
@@ -324,65 +316,92 @@ def _build_order_index(df: pd.DataFrame) -> dict:
     return {oid: group for oid, group in df.groupby("OrderID")}
 
 
-if "_order_summary" not in st.session_state:
-    st.session_state["_order_summary"] = _build_summary(order_df)
-summary = st.session_state["_order_summary"]
-
-if "_order_items_by_id" not in st.session_state:
-    st.session_state["_order_items_by_id"] = _build_order_index(order_df)
-order_items_by_id = st.session_state["_order_items_by_id"]
+def _build_order_structures() -> tuple:
+    """({OrderID: items}, {OrderItemID: OrderID}) over the item view."""
+    df = api.order_view_cache
+    return _build_order_index(df), dict(zip(df["OrderItemID"], df["OrderID"]))
+
+
+def _patch_order_structures(structures: tuple, changed: set) -> tuple:
+    """Copies with per-order groups redone only for orders whose items changed."""
+    df = api.order_view_cache
+    index, item_order = structures
+    affected = {item_order[i] for i in changed if i in item_order}
+    current = df[df["OrderItemID"].isin(changed)]
+    affected.update(current["OrderID"].tolist())
+    item_order = {k: v for k, v in item_order.items() if k not in changed}
+    item_order.update(zip(current["OrderItemID"], current["OrderID"]))
+
+    index = {k: v for k, v in index.items() if k not in affected}
+    index.update(_build_order_index(df[df["OrderID"].isin(affected)]))
+    return index, item_order
+
+
+def _order_items_index() -> dict:
+    """{OrderID: items}; the item view is loaded on first use."""
+    # Shared by every session. Saves patch the view (write-through), so
+    # usually only a few OrderItemIDs changed since the last build.
+    index, _ = api.derived(
+        "order_tracking.order_items",
+        _build_order_structures,
+        ["orders"],
+        patch=_patch_order_structures,
+    )
+    return index
 
 
 def get_order_items(order_id: int) -> pd.DataFrame:
     """O(1) lookup for items belonging to a specific order."""
-    return order_items_by_id.get(order_id, pd.DataFrame())
+    return _order_items_index().get(order_id, pd.DataFrame())
 
 
 # ================================================================
 # FK decode maps for dropdown columns in data_editor
-# These use Tier-1 cached lookups (no DB hit on rerun)
+# Built from Tier-1 lookups once per lookup change (api.derived)
 # ================================================================
 
-_order_note_df = api.order_note_cache
-_order_item_type_df = api.order_item_type_cache
 
-# ID -> display name (for rendering)
-_NOTE_ID_TO_NAME = (
-    dict(zip(_order_note_df["OrderNoteID"], _order_note_df["OrderNote"]))
-    if not _order_note_df.empty
-    else {}
-)
-_OIT_ID_TO_NAME = (
-    dict(
-        zip(
-            _order_item_type_df["OrderItemTypeID"],
-            _order_item_type_df["OrderItemType"],
-        )
+def _build_note_maps() -> tuple:
+    note_df = api.order_note_cache
+    # ID -> display name (for rendering)
+    id_to_name = (
+        dict(zip(note_df["OrderNoteID"], note_df["OrderNote"]))
+        if not note_df.empty
+        else {}
+    )
+    return (
+        id_to_name,
+        # Display name -> ID (for saving edits back to DB)
+        {v: k for k, v in id_to_name.items()},
+        # Options for SelectboxColumn (display names, with empty option)
+        [""] + sorted(id_to_name.values()),
     )
-    if not _order_item_type_df.empty
-    else {}
-)
 
-# Display name -> ID (for saving edits back to DB)
-_NOTE_NAME_TO_ID = {v: k for k, v in _NOTE_ID_TO_NAME.items()}
-_OIT_NAME_TO_ID = {v: k for k, v in _OIT_ID_TO_NAME.items()}
 
-# Options for SelectboxColumn (display names, with empty option)
-_NOTE_DISPLAY_OPTIONS = [""] + sorted(_NOTE_ID_TO_NAME.values())
-_OIT_DISPLAY_OPTIONS = [""] + sorted(_OIT_ID_TO_NAME.values())
+def _build_oit_maps() -> tuple:
+    oit_df = api.order_item_type_cache
+    id_to_name = (
+        dict(zip(oit_df["OrderItemTypeID"], oit_df["OrderItemType"]))
+        if not oit_df.empty
+        else {}
+    )
+    return (
+        id_to_name,
+        {v: k for k, v in id_to_name.items()},
+        [""] + sorted(id_to_name.values()),
+    )
+
+
+_NOTE_ID_TO_NAME, _NOTE_NAME_TO_ID, _NOTE_DISPLAY_OPTIONS = api.derived(
+    "order_tracking.notes", _build_note_maps, ["order_notes"]
+)
+_OIT_ID_TO_NAME, _OIT_NAME_TO_ID, _OIT_DISPLAY_OPTIONS = api.derived(
+    "order_tracking.order_item_types", _build_oit_maps, ["order_item_types"]
+)
 
 # ================================================================
 # Location lookups for destination assignment (receiving workflow)
 # ================================================================
-_location_df = api.location_cache
-_unit_df = api.unit_cache
-
-_LOCATION_ID_TO_NAME = (
-    dict(zip(_location_df["LocationID"], _location_df["Location"]))
-    if not _location_df.empty
-    else {}
-)
-_LOCATION_NAME_TO_ID = {v: k for k, v in _LOCATION_ID_TO_NAME.items()}
 
 
 # Group locations by category for organized multiselect display
@@ -395,34 +414,63 @@ def _categorize_location(name: str) -> str:
     return "Other"
 
 
-_LOCATION_NAMES_GROUPED = []
-if not _location_df.empty:
-    _loc_working = _location_df.copy()
-    _loc_working["_cat"] = _loc_working["Location"].apply(_categorize_location)
-    for _cat in ["Greenhouses", "Fields", "Other"]:
-        _cat_locs = _loc_working[_loc_working["_cat"] == _cat].sort_values("Location")
-        _LOCATION_NAMES_GROUPED.extend(_cat_locs["Location"].tolist())
+def _build_location_maps() -> tuple:
+    location_df = api.location_cache
+    if location_df.empty:
+        return {}, {}, []
+    id_to_name = dict(zip(location_df["LocationID"], location_df["Location"]))
+    category = location_df["Location"].apply(_categorize_location)
+    grouped = []
+    for cat in ["Greenhouses", "Fields", "Other"]:
+        grouped.extend(
+            location_df.loc[category == cat, "Location"].sort_values().tolist()
+        )
+    return id_to_name, {v: k for k, v in id_to_name.items()}, grouped
+
 
-_UNIT_ID_TO_LABEL = (
-    {
-        int(r["UnitID"]): f"{r['UnitSize']} {r['UnitType']}"
-        for _, r in _unit_df.iterrows()
-    }
-    if not _unit_df.empty
-    else {}
+def _build_unit_labels() -> tuple:
+    unit_df = api.unit_cache
+    id_to_label = (
+        {
+            int(unit_id): f"{size} {unit_type}"
+            for unit_id, size, unit_type in zip(
+                unit_df["UnitID"], unit_df["UnitSize"], unit_df["UnitType"]
+            )
+        }
+        if not unit_df.empty
+        else {}
+    )
+    return id_to_label, {v: k for k, v in id_to_label.items()}
+
+
+_LOCATION_ID_TO_NAME, _LOCATION_NAME_TO_ID, _LOCATION_NAMES_GROUPED = api.derived(
+    "order_tracking.locations", _build_location_maps, ["locations"]
+)
+_UNIT_ID_TO_LABEL, _UNIT_LABEL_TO_ID = api.derived(
+    "order_tracking.units", _build_unit_labels, ["units"]
 )
-_UNIT_LABEL_TO_ID = {v: k for k, v in _UNIT_ID_TO_LABEL.items()}
 
-# Pre-load existing destinations grouped by OrderItemID
-_oid_df = api.order_item_destination_cache
-_DESTINATIONS_BY_ITEM = {}
-if not _oid_df.empty:
-    for _oi_id, _group in _oid_df.groupby("OrderItemID"):
-        _DESTINATIONS_BY_ITEM[int(_oi_id)] = _group.to_dict("records")
 
+def _destinations_for(item_id: int) -> list:
+    """Existing destinations of one order item (indexed by OrderItemID in the API)."""
+    return api.get_children("order_destinations", item_id).to_dict("records")
 
-def _display_items_dataframe(items_df: pd.DataFrame, cols: list, max_rows: int = 0):
-    """Render an items dataframe with shared column config. Decodes FK IDs to names."""
+
+def _with_destination_names(items_df: pd.DataFrame) -> pd.DataFrame:
+    """Add a LocationName column listing each order item's destinations."""
+    dests = api.get_children("order_destinations", items_df["OrderItemID"])
+    names = (
+        dests.dropna(subset=["LocationName"])
+        .groupby("OrderItemID")["LocationName"]
+        .agg(lambda s: ", ".join(map(str, s)))
+    )
+    return items_df.assign(LocationName=items_df["OrderItemID"].map(names))
+
+
+def _decoded_items(items_df: pd.DataFrame, cols: list) -> pd.DataFrame:
+    """`cols` of an items dataframe with FK IDs decoded to names."""
+    if "LocationName" in cols and "OrderItemID" in items_df.columns:
+        items_df = _with_destination_names(items_df)
     available = [c for c in cols if c in items_df.columns]
     display = items_df[available].copy()
 
@@ -433,7 +481,12 @@ def _display_items_dataframe(items_df: pd.DataFrame, cols: list, max_rows: int =
         display["OrderItemTypeID"] = (
             display["OrderItemTypeID"].map(_OIT_ID_TO_NAME).fillna("")
         )
+    return display
+
 
+def _display_items_dataframe(items_df: pd.DataFrame, cols: list, max_rows: int = 0):
+    """Render an items dataframe with shared column config. Decodes FK IDs to names."""
+    display = _decoded_items(items_df, cols)
     if max_rows and len(display) > max_rows:
         st.dataframe(
             display.head(max_rows),
@@ -451,6 +504,66 @@ def _display_items_dataframe(items_df: pd.DataFrame, cols: list, max_rows: int =
         )
 
 
+# ===== APPLY FILTERS =====
+# Before the sidebar, so its supplier/season pickers can show facet counts.
+# The date inputs' values are read from session state (set before this rerun).
+status_missing, status_between = {}, {}
+if st.session_state.filter_status == "Pending":
+    status_missing = {"DateReceived": True}
+elif st.session_state.filter_status == "Received":
+    status_missing = {"DateReceived": False}
+elif st.session_state.filter_status == "Overdue":
+    status_missing = {"DateReceived": True}
+    status_between = {"DateDue": (None, pd.Timestamp.now())}
+
+summary_result = summary_filters.query(
+    isin={
+        "Supplier": st.session_state.filter_suppliers,
+        "GrowingSeason": (
+            [st.session_state.filter_season]
+            if st.session_state.filter_season != "All"
+            else []
+        ),
+    },
+    between={
+        "DatePlaced": (
+            st.session_state.get("date_start"),
+            st.session_state.get("date_end"),
+        ),
+        **status_between,
+    },
+    missing=status_missing,
+    contains=st.session_state.filter_search,
+)
+supplier_counts = summary_result.facets.get("Supplier", {})
+season_counts = summary_result.facets.get("GrowingSeason", {})
+
+# Sidebar statistics under the same filters, evaluated in SQL
+stats = api.aggregate_view(
+    "orders_summary",
+    {
+        "orders": "rows",
+        "cost": ("sum", "TotalCost"),
+        "pending": ("null", "DateReceived"),
+        "received": ("count", "DateReceived"),
+    },
+    search=st.session_state.filter_search,
+    suppliers=st.session_state.filter_suppliers,
+    seasons=(
+        [st.session_state.filter_season]
+        if st.session_state.filter_season != "All"
+        else []
+    ),
+    status=(
+        None
+        if st.session_state.filter_status == "All"
+        else st.session_state.filter_status
+    ),
+    date_from=st.session_state.get("date_start"),
+    date_to=st.session_state.get("date_end"),
+)
+
+
 # ===== SIDEBAR =====
 with st.sidebar:
     st.markdown("### 📦 Order Tracking")
@@ -478,11 +591,12 @@ with st.sidebar:
         st.session_state.filter_search = search_term
         st.rerun()
 
-    supplier_list = sorted(summary["Supplier"].dropna().unique().tolist())
+    supplier_list = sorted(summary_filters.values("Supplier"))
     selected_suppliers = st.multiselect(
         "Supplier",
         options=supplier_list,
         default=st.session_state.filter_suppliers,
+        format_func=lambda s: f"{s} ({supplier_counts.get(s, 0)})",
         key="supplier_filter",
     )
     if selected_suppliers != st.session_state.filter_suppliers:
@@ -500,9 +614,7 @@ with st.sidebar:
         st.session_state.filter_status = selected_status
         st.rerun()
 
-    seasons = ["All"] + sorted(
-        summary["GrowingSeason"].dropna().unique().tolist(), reverse=True
-    )
+    seasons = ["All"] + sorted(summary_filters.values("GrowingSeason"), reverse=True)
     selected_season = st.selectbox(
         "Growing Season",
         options=seasons,
@@ -511,6 +623,7 @@ with st.sidebar:
             if st.session_state.filter_season in seasons
             else 0
         ),
+        format_func=lambda g: g if g == "All" else f"{g} ({season_counts.get(g, 0)})",
         key="season_filter",
     )
     if selected_season != st.session_state.filter_season:
@@ -518,8 +631,8 @@ with st.sidebar:
         st.rerun()
 
     st.markdown("**Date Range (Placed)**")
-    date_start = st.date_input("From", value=None, key="date_start")
-    date_end = st.date_input("To", value=None, key="date_end")
+    st.date_input("From", value=None, key="date_start")
+    st.date_input("To", value=None, key="date_end")
 
     if st.button("Clear All Filters", use_container_width=True):
         st.session_state.filter_search = ""
@@ -531,15 +644,10 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### 📊 Statistics")
 
-    total_orders = len(summary)
-    total_cost = summary["TotalCost"].sum()
-    pending_count = len(summary[summary["DateReceived"].isna()])
-    received_count = len(summary[summary["DateReceived"].notna()])
-
-    st.metric("Total Orders", total_orders)
-    st.metric("Total Cost", format_currency(total_cost))
-    st.metric("Pending", pending_count)
-    st.metric("Received", received_count)
+    st.metric("Orders", stats["orders"])
+    st.metric("Total Cost", format_currency(stats["cost"]))
+    st.metric("Pending", stats["pending"])
+    st.metric("Received", stats["received"])
 
 
 # ===== MAIN HEADER =====
@@ -547,55 +655,14 @@ st.markdown("# 📦 Order Tracking")
 st.markdown("---")
 
 # ===== TABS =====
+# Rerun on tab change so the All Items tab only loads items when selected
 tab_summary, tab_timeline, tab_items, tab_receiving, tab_create = st.tabs(
-    ["📋 Order Summary", "📅 Timeline", "📦 All Items", "✅ Receiving", "➕ New Order"]
+    ["📋 Order Summary", "📅 Timeline", "📦 All Items", "✅ Receiving", "➕ New Order"],
+    key="order_tabs",
+    on_change="rerun",
 )
 
-# ===== APPLY FILTERS =====
-filtered_summary = summary
-
-if st.session_state.filter_search:
-    search_lower = st.session_state.filter_search.lower()
-    mask = (
-        filtered_summary["Supplier"].str.lower().str.contains(search_lower, na=False)
-        | filtered_summary["OrderNumber"]
-        .str.lower()
-        .str.contains(search_lower, na=False)
-        | filtered_summary["OrderComments"]
-        .str.lower()
-        .str.contains(search_lower, na=False)
-    )
-    filtered_summary = filtered_summary[mask]
-
-if st.session_state.filter_suppliers:
-    filtered_summary = filtered_summary[
-        filtered_summary["Supplier"].isin(st.session_state.filter_suppliers)
-    ]
-
-if st.session_state.filter_status == "Pending":
-    filtered_summary = filtered_summary[filtered_summary["DateReceived"].isna()]
-elif st.session_state.filter_status == "Received":
-    filtered_summary = filtered_summary[filtered_summary["DateReceived"].notna()]
-elif st.session_state.filter_status == "Overdue":
-    now = pd.Timestamp.now()
-    filtered_summary = filtered_summary[
-        (filtered_summary["DateReceived"].isna()) & (filtered_summary["DateDue"] < now)
-    ]
-
-if st.session_state.filter_season != "All":
-    filtered_summary = filtered_summary[
-        filtered_summary["GrowingSeason"] == st.session_state.filter_season
-    ]
-
-if date_start:
-    filtered_summary = filtered_summary[
-        filtered_summary["DatePlaced"] >= pd.to_datetime(date_start)
-    ]
-if date_end:
-    filtered_summary = filtered_summary[
-        filtered_summary["DatePlaced"] <= pd.to_datetime(date_end)
-    ]
-
+filtered_summary = summary_result.df
 filtered_order_ids = set(filtered_summary["OrderID"].tolist())
 
 
@@ -620,7 +687,13 @@ with tab_summary:
             f"{format_date(row['DatePlaced'])} — {item_count} items — {cost_str}"
         )
 
-        with st.expander(expander_label, expanded=False):
+        order_expander = st.expander(
+            expander_label,
+            expanded=False,
+            key=f"order_exp_{int(row['OrderID'])}",
+            on_change="rerun",
+        )
+        with order_expander:
             st.markdown(_STATUS_HTML[status], unsafe_allow_html=True)
 
             meta1, meta2, meta3 = st.columns(3)
@@ -669,7 +742,6 @@ with tab_summary:
                                 allowed_fields={"DateReceived", "OrderComments"},
                             )
                             st.success("Order marked as unreceived.")
-                            refresh_data()
                             st.rerun()
                         except Exception as e:
                             st.error(f"❌ {e}")
@@ -688,7 +760,6 @@ with tab_summary:
                                 allowed_fields={"DateReceived", "OrderComments"},
                             )
                             st.success("Order marked as received.")
-                            refresh_data()
                             st.rerun()
                         except Exception as e:
                             st.error(f"❌ {e}")
@@ -697,7 +768,11 @@ with tab_summary:
                 st.info(f"**Comments:** {row['OrderComments']}")
 
             st.markdown("#### Items in this Order")
-            oi = get_order_items(row["OrderID"])
+            oi = (
+                get_order_items(row["OrderID"])
+                if order_expander.open
+                else pd.DataFrame()
+            )
             if not oi.empty:
                 available_cols = [
                     c for c in _ITEM_DISPLAY_COLS_DETAIL if c in oi.columns
@@ -781,6 +856,7 @@ with tab_summary:
                     ):
                         save_errors = []
                         save_count = 0
+                        pending = {}
                         for idx_row in range(len(edited)):
                             orig_row = edit_df.iloc[idx_row]
                             edit_row = edited.iloc[idx_row]
@@ -794,7 +870,11 @@ with tab_summary:
                                 new_val = edit_row[col]
                                 if pd.isna(orig_val) and pd.isna(new_val):
                                     continue
-                                if orig_val != new_val:
+                                if (
+                                    pd.isna(orig_val)
+                                    or pd.isna(new_val)
+                                    or orig_val != new_val
+                                ):
                                     # Translate display names back to FK IDs
                                     if col == "OrderNote":
                                         new_val = (
@@ -811,24 +891,29 @@ with tab_summary:
                                     updates[col] = new_val
 
                             if updates:
-                                try:
-                                    api.generic_update(
-                                        model_class=OrderItem,
-                                        id_column="OrderItemID",
-                                        id_value=item_id,
-                                        updates=updates,
-                                        allowed_fields=_EDITABLE_ORDER_ITEM_COLS,
+                                pending[item_id] = updates
+
+                        if pending:
+                            results = api.generic_update_many(
+                                model_class=OrderItem,
+                                id_column="OrderItemID",
+                                updates_by_id=pending,
+                                allowed_fields=_EDITABLE_ORDER_ITEM_COLS,
+                            )
+                            for item_id, result in results.items():
+                                if result is None:
+                                    save_errors.append(
+                                        f"Item {item_id}: "
+                                        f"{results.errors.get(item_id, 'not saved')}"
                                     )
+                                else:
                                     save_count += 1
-                                except Exception as e:
-                                    save_errors.append(f"Item {item_id}: {e}")
 
                         if save_errors:
                             for err in save_errors:
                                 st.error(f"❌ {err}")
                         if save_count:
                             st.success(f"✅ Updated {save_count} item(s).")
-                            refresh_data()
                             st.rerun()
                 else:
                     st.caption("Edit cells above, then save.")
@@ -900,41 +985,36 @@ with tab_timeline:
 with tab_items:
     st.markdown("### 📦 All Order Items (Expanded)")
 
-    if filtered_order_ids:
-        parts = [
-            order_items_by_id[oid]
-            for oid in filtered_order_ids
-            if oid in order_items_by_id
-        ]
-        filtered_items = (
-            pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
-        )
-    else:
-        filtered_items = pd.DataFrame()
-
-    if filtered_items.empty:
-        st.info("No items match current filters.")
-    else:
-        item_search = st.text_input(
-            "Search items",
-            placeholder="Search by item name, code, variety...",
-            key="item_search",
-        )
-
-        if item_search:
-            sl = item_search.lower()
-            mask = (
-                filtered_items["Item"].str.lower().str.contains(sl, na=False)
-                | filtered_items["Variety"].str.lower().str.contains(sl, na=False)
-                | filtered_items["ItemCode"].str.lower().str.contains(sl, na=False)
+if tab_items.open:
+    with tab_items:
+        if not filtered_order_ids:
+            st.info("No items match current filters.")
+        else:
+            item_search = st.text_input(
+                "Search items",
+                placeholder="Search by item name, code, variety...",
+                key="item_search",
+            )
+            # Paged from v_orders_full; only the visible page is fetched
+            item_filters = dict(orders=filtered_order_ids, search=item_search)
+            item_stats = api.aggregate_view(
+                "orders",
+                {"items": "rows", "orders": ("nunique", "OrderID")},
+                **item_filters,
+            )
+            st.markdown(
+                f"**{item_stats['items']} items across {item_stats['orders']} orders**"
             )
-            filtered_items = filtered_items[mask]
-
-        st.markdown(
-            f"**{len(filtered_items)} items across {filtered_items['OrderID'].nunique()} orders**"
-        )
 
-        _display_items_dataframe(filtered_items, _ITEM_DISPLAY_COLS_ALL, max_rows=200)
+            paged_grid(
+                api,
+                "orders",
+                key="all_items",
+                filters=item_filters,
+                column_config=_ITEM_COLUMN_CONFIG,
+                default_sort="DatePlaced",
+                prepare=lambda page: _decoded_items(page, _ITEM_DISPLAY_COLS_ALL),
+            )
 
 
 # ==================== TAB 4: RECEIVING ====================
@@ -969,21 +1049,35 @@ with tab_receiving:
                 # All allocations done — save them all
                 alloc_errors = []
                 alloc_count = 0
+                destinations = []
                 for entry in queue:
                     for loc_name, qty in entry["allocations"].items():
                         if qty > 0:
                             loc_id = _LOCATION_NAME_TO_ID.get(loc_name)
                             if loc_id:
-                                try:
-                                    api.table_add_order_item_destination(
-                                        OrderItemID=entry["item_id"],
-                                        Count=qty,
-                                        UnitID=entry["unit_id"],
-                                        LocationID=loc_id,
-                                    )
-                                    alloc_count += 1
-                                except Exception as e:
-                                    alloc_errors.append(f"{entry['item_label']}: {e}")
+                                destinations.append(
+                                    {
+                                        "OrderItemID": entry["item_id"],
+                                        "Count": qty,
+                                        "UnitID": entry["unit_id"],
+                                        "LocationID": loc_id,
+                                    }
+                                )
+                if destinations:
+                    try:
+                        alloc_count = len(
+                            api.table_add_order_item_destinations(destinations)
+                        )
+                    except Exception as e:
+                        # One transaction: none of the queue's destinations saved
+                        labels = dict.fromkeys(
+                            entry["item_label"]
+                            for entry in queue
+                            if any(qty > 0 for qty in entry["allocations"].values())
+                        )
+                        alloc_errors.append(
+                            f"Destinations not saved for {', '.join(labels)}: {e}"
+                        )
 
                 if alloc_errors:
                     for err in alloc_errors:
@@ -994,7 +1088,6 @@ with tab_receiving:
                 # Clear queue
                 st.session_state._alloc_queue = []
                 st.session_state._alloc_index = 0
-                refresh_data()
                 st.rerun()
             else:
                 # Show allocation form for current item
@@ -1076,15 +1169,22 @@ with tab_receiving:
                 status = get_order_status(order_row)
                 status_label = "⚠️ OVERDUE" if status == "overdue" else "⏳ Pending"
 
-                items = get_order_items(order_id)
-                item_count = len(items) if not items.empty else 0
+                item_count = int(order_row["ItemCount"])
 
-                with st.expander(
+                recv_expander = st.expander(
                     f"{status_label} — {supplier} — Order #{order_num} "
                     f"— {item_count} items "
                     f"— Due {format_date(order_row['DateDue'])}",
                     expanded=False,
-                ):
+                    key=f"recv_exp_{order_id}",
+                    on_change="rerun",
+                )
+                # Items (and the item view) load only for an opened order
+                if not recv_expander.open:
+                    continue
+                items = get_order_items(order_id)
+
+                with recv_expander:
                     with st.form(f"recv_form_{order_id}"):
                         # ---- Order-level ----
                         recv_col1, recv_col2 = st.columns([1, 3])
@@ -1149,7 +1249,7 @@ with tab_receiving:
                                 }
 
                                 # Existing destinations for display
-                                existing_dests = _DESTINATIONS_BY_ITEM.get(item_id, [])
+                                existing_dests = _destinations_for(item_id)
                                 existing_loc_names = [
                                     _LOCATION_ID_TO_NAME.get(d["LocationID"], "?")
                                     for d in existing_dests
@@ -1193,6 +1293,8 @@ with tab_receiving:
                             save_errors = []
                             save_count = 0
                             alloc_needed = []
+                            item_updates = {}
+                            new_destinations = []
 
                             for item_id, db_state in item_db_states.items():
                                 db_received = db_state["received"]
@@ -1224,28 +1326,14 @@ with tab_receiving:
                                     ).strip()
 
                                 if updates:
-                                    try:
-                                        api.generic_update(
-                                            model_class=OrderItem,
-                                            id_column="OrderItemID",
-                                            id_value=item_id,
-                                            updates=updates,
-                                            allowed_fields={
-                                                "Received",
-                                                "OrderComments",
-                                                "Leftover",
-                                            },
-                                        )
-                                        save_count += 1
-                                    except Exception as e:
-                                        save_errors.append(f"Item {item_id}: {e}")
+                                    item_updates[item_id] = updates
 
                                 # Process destinations
                                 dest_key = f"recv_dest_{order_id}_{item_id}"
                                 selected_locs = st.session_state.get(dest_key, [])
 
                                 # Find which are NEW (not already in DB)
-                                existing_dests = _DESTINATIONS_BY_ITEM.get(item_id, [])
+                                existing_dests = _destinations_for(item_id)
                                 existing_loc_ids = {
                                     d["LocationID"] for d in existing_dests
                                 }
@@ -1278,18 +1366,14 @@ with tab_receiving:
                                         if not unit_id and _UNIT_ID_TO_LABEL:
                                             unit_id = list(_UNIT_ID_TO_LABEL.keys())[0]
 
-                                        try:
-                                            api.table_add_order_item_destination(
-                                                OrderItemID=item_id,
-                                                Count=max(qty_val, 1),
-                                                UnitID=unit_id or 1,
-                                                LocationID=loc_id,
-                                            )
-                                            save_count += 1
-                                        except Exception as e:
-                                            save_errors.append(
-                                                f"Dest {new_locs[0]}: {e}"
-                                            )
+                                        new_destinations.append(
+                                            {
+                                                "OrderItemID": item_id,
+                                                "Count": max(qty_val, 1),
+                                                "UnitID": unit_id or 1,
+                                                "LocationID": loc_id,
+                                            }
+                                        )
                                 else:
                                     # Multiple new destinations — queue
                                     # for allocation
@@ -1312,6 +1396,44 @@ with tab_receiving:
                                         }
                                     )
 
+                            # Item changes go out as one batch
+                            if item_updates:
+                                results = api.generic_update_many(
+                                    model_class=OrderItem,
+                                    id_column="OrderItemID",
+                                    updates_by_id=item_updates,
+                                    allowed_fields={
+                                        "Received",
+                                        "OrderComments",
+                                        "Leftover",
+                                    },
+                                )
+                                for item_id, result in results.items():
+                                    if result is None:
+                                        save_errors.append(
+                                            f"Item {item_id}: "
+                                            f"{results.errors.get(item_id, 'not saved')}"
+                                        )
+                                    else:
+                                        save_count += 1
+
+                            if new_destinations:
+                                try:
+                                    save_count += len(
+                                        api.table_add_order_item_destinations(
+                                            new_destinations
+                                        )
+                                    )
+                                except Exception as e:
+                                    labels = dict.fromkeys(
+                                        item_db_states[d["OrderItemID"]]["label"]
+                                        for d in new_destinations
+                                    )
+                                    save_errors.append(
+                                        "Destinations not saved for "
+                                        f"{', '.join(map(str, labels))}: {e}"
+                                    )
+
                             # Process order-level changes
                             order_updates = {}
 
@@ -1363,7 +1485,6 @@ with tab_receiving:
                                 )
                                 st.rerun()
                             elif save_count and not save_errors:
-                                refresh_data()
                                 st.rerun()
                             elif not save_errors:
                                 st.info("No changes to save.")
@@ -1378,7 +1499,6 @@ with tab_create:
     broker_df = api.broker_cache
     shipper_df = api.shipper_cache
     season_df = api.growing_season_cache
-    item_df = api.item_cache
     order_item_type_df = api.order_item_type_cache
     order_note_df = api.order_note_cache
 
@@ -1404,18 +1524,8 @@ with tab_create:
         else {}
     )
 
-    item_map = {}
-    if not item_df.empty:
-        for _, r in item_df.iterrows():
-            name = r.get("Item")
-            if pd.isna(name) or not name:
-                continue
-            label = str(name)
-            if pd.notna(r.get("Variety")) and r["Variety"]:
-                label += f" - {r['Variety']}"
-            if pd.notna(r.get("Color")) and r["Color"]:
-                label += f" ({r['Color']})"
-            item_map[label] = r["ItemID"]
+    # Item labels precomputed by the shared typeahead index
+    item_picker = api.item_typeahead
 
     oit_map = (
         dict(
@@ -1449,7 +1559,7 @@ with tab_create:
     with li_col1:
         li_item = st.selectbox(
             "Item",
-            options=[""] + sorted(item_map.keys()),
+            options=[""] + item_picker.options,
             key="li_item_select",
         )
     with li_col2:
@@ -1486,7 +1596,7 @@ with tab_create:
             st.session_state.new_order_line_items.append(
                 {
                     "item_label": li_item,
-                    "ItemID": item_map[li_item],
+                    "ItemID": item_picker.id_for(li_item),
                     "NumberOfUnits": li_qty,
                     "Unit": li_unit or None,
                     "UnitPrice": li_price if li_price > 0 else None,
@@ -1639,19 +1749,22 @@ with tab_create:
 
                     new_order_id = order_result["OrderID"]
 
-                    items_added = 0
-                    for li in st.session_state.new_order_line_items:
-                        api.table_add_order_item(
-                            OrderID=new_order_id,
-                            ItemID=li["ItemID"],
-                            NumberOfUnits=li["NumberOfUnits"],
-                            Unit=li.get("Unit"),
-                            UnitPrice=li.get("UnitPrice"),
-                            ItemCode=li.get("ItemCode"),
-                            OrderItemTypeID=li.get("OrderItemTypeID"),
-                            OrderNote=li.get("OrderNote"),
-                        )
-                        items_added += 1
+                    added = api.table_add_order_items(
+                        [
+                            {
+                                "OrderID": new_order_id,
+                                "ItemID": li["ItemID"],
+                                "NumberOfUnits": li["NumberOfUnits"],
+                                "Unit": li.get("Unit"),
+                                "UnitPrice": li.get("UnitPrice"),
+                                "ItemCode": li.get("ItemCode"),
+                                "OrderItemTypeID": li.get("OrderItemTypeID"),
+                                "OrderNote": li.get("OrderNote"),
+                            }
+                            for li in st.session_state.new_order_line_items
+                        ]
+                    )
+                    items_added = len(added)
 
                     st.session_state.new_order_line_items = []
 
@@ -1660,7 +1773,6 @@ with tab_create:
                         + (f" with {items_added} items!" if items_added else "!")
                     )
 
-                    refresh_data()
                     st.rerun()
 
                 except Exception as e:
@@ -1674,7 +1786,7 @@ col1, col2 = st.columns([3, 1])
 with col1:
     st.caption(
         f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
-        f"{len(filtered_summary)} orders | {len(order_df)} total items"
+        f"{len(filtered_summary)} orders | {int(summary['ItemCount'].sum())} total items"
     )
 
 with col2:
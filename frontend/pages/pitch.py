@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "rest"))
 from rest.api import EdgewaterAPI
 from export_utils import export_csv
+from paged_grid import paged_grid
 from models import Pitch as PIT
 from payloads import PitchPayload
 
@@ -119,10 +120,7 @@ with st.expander("➕ Add New Pitch Record", expanded=st.session_state.show_add_
     st.write("### Create New Pitch Record")
 
     # Prepare lookup dictionaries
-    items_dict = {
-        int(k): str(v)
-        for k, v in api.item_cache.set_index("ItemID")["Item"].to_dict().items()
-    }
+    item_picker = api.item_typeahead
     units_dict = {
         int(k): str(v)
         for k, v in api.unit_cache.set_index("UnitID")
@@ -137,8 +135,8 @@ with st.expander("➕ Add New Pitch Record", expanded=st.session_state.show_add_
         with col1:
             form_item_id = st.selectbox(
                 "Item *",
-                options=list(items_dict.keys()),
-                format_func=lambda x: items_dict[x],
+                options=item_picker.item_ids,
+                format_func=item_picker.label_for,
                 key="form_item_id",
             )
             form_unit_id = st.selectbox(
@@ -206,30 +204,20 @@ with filter_col3:
         key="item_filter",
     )
 
-# Apply filters
-filtered_df = api.pitch_cache.copy()
-
-# Date filters
-if date_filter_start:
-    filtered_df = filtered_df[
-        filtered_df["DatePitched"] >= pd.to_datetime(date_filter_start)
-    ]
-if date_filter_end:
-    filtered_df = filtered_df[
-        filtered_df["DatePitched"] <= pd.to_datetime(date_filter_end)
-    ]
-
-# Item filter
+# Filters run in SQL; the grid below fetches one page at a time
+filters = dict(date_from=date_filter_start, date_to=date_filter_end)
 if item_filter:
-    item_ids = api.item_cache[api.item_cache["Item"].isin(item_filter)][
+    filters["items"] = api.item_cache[api.item_cache["Item"].isin(item_filter)][
         "ItemID"
     ].tolist()
-    filtered_df = filtered_df[filtered_df["ItemID"].isin(item_ids)]
 
 st.divider()
 
 # ==================== DATA DISPLAY & EDITING ====================
-st.write(f"### 📊 Pitch Records ({len(filtered_df)} records)")
+total_filtered = api.aggregate_view(
+    "pitch_table", {"rows": "rows"}, **filters
+)["rows"]
+st.write(f"### 📊 Pitch Records ({total_filtered} records)")
 
 # Action buttons
 action_col1, action_col2 = st.columns([1, 5])
@@ -245,7 +233,7 @@ with action_col1:
 
 with action_col2:
     if st.button("📥 Export CSV", use_container_width=True):
-        csv = export_csv(filtered_df, PIT)
+        csv = export_csv(api.query_view("pitch_table", **filters), PIT)
         st.download_button(
             label="Download CSV",
             data=csv,
@@ -267,14 +255,16 @@ column_config = {
 if st.session_state.edit_mode:
     st.info("✏️ **Edit Mode** - Make changes, then click 'Save Changes'")
 
-    edited_df = st.data_editor(
-        filtered_df,
-        use_container_width=True,
-        num_rows="fixed",
+    grid = paged_grid(
+        api,
+        "pitch_table",
+        key="pitch",
+        filters=filters,
         column_config=column_config,
-        hide_index=True,
-        key="pitch_editor",
+        default_sort="DatePitched",
+        editable=True,
     )
+    filtered_df, edited_df = grid.df, grid.edited
 
     if not edited_df.equals(filtered_df):
         st.warning(f"⚠️ Unsaved changes detected!")
@@ -301,7 +291,11 @@ if st.session_state.edit_mode:
 
                             if pd.isna(orig_val) and pd.isna(edit_val):
                                 continue
-                            if orig_val != edit_val:
+                            if (
+                                pd.isna(orig_val)
+                                or pd.isna(edit_val)
+                                or orig_val != edit_val
+                            ):
                                 changes[col] = edit_val
 
                     if changes:
@@ -322,11 +316,13 @@ if st.session_state.edit_mode:
             if st.button("🔄 Discard Changes", use_container_width=True):
                 st.rerun()
 else:
-    st.dataframe(
-        filtered_df,
-        use_container_width=True,
+    paged_grid(
+        api,
+        "pitch_table",
+        key="pitch",
+        filters=filters,
         column_config=column_config,
-        hide_index=True,
+        default_sort="DatePitched",
     )
 
 # ==================== BULK OPERATIONS ====================
@@ -351,6 +347,7 @@ with st.expander("🔧 Bulk Operations"):
 # ==================== FOOTER ====================
 st.divider()
 
+total_records = api.aggregate_view("pitch_table", {"rows": "rows"})["rows"]
 st.caption(
-    f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total pitch records: {len(api.pitch_cache)}"
+    f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total pitch records: {total_records}"
 )
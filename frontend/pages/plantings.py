@@ -19,7 +19,9 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "rest"))
 
+from config import get_config
 from rest.api import EdgewaterAPI
+from rest.filter_engine import FilterEngine
 from models import Planting, SeasonalNotes
 
 # ===== STREAMLIT CONFIG =====
@@ -134,9 +136,9 @@ def refresh_data():
     """Refresh view cache and invalidate derived structures."""
     with st.spinner("Refreshing data..."):
         api.refresh_view_cache("plantings")
+        api.refresh_view_cache("planting_destinations")
+        api.refresh_view_cache("seasonal_notes_table")
         api.clear_lookup_caches()
-        for key in ("_plant_sorted", "_plant_by_id"):
-            st.session_state.pop(key, None)
     st.success("Data refreshed!", icon="✅")
 
 
@@ -196,7 +198,6 @@ _COLUMN_CONFIG = {
     "PlantingComments": st.column_config.TextColumn("Comments", width="medium"),
     "SeasonalNote": st.column_config.TextColumn("Seasonal Note", width="medium"),
     "LocationID": st.column_config.TextColumn("Location", width="small"),
-    "Greenhouse": st.column_config.CheckboxColumn("Greenhouse", width="small"),
 }
 
 # Columns shown in table view
@@ -242,61 +243,163 @@ _COL_LABELS = {
 
 
 # ================================================================
-# DATA LOADING — single read, derived structures cached in session_state
+# DATA LOADING — single read, derived structures shared via api.derived()
 # ================================================================
 
-_raw_cache = (
-    api.planting_view_cache if api.planting_view_cache is not None else pd.DataFrame()
-)
+# Pushdown mode: filters, sort and LIMIT run in SQL (api.query_view) and the
+# full view is never loaded by this page
+PUSHDOWN_FILTERS = get_config().PUSHDOWN_FILTERS
+
+# Unfiltered total from SQL, so an empty table is detected without loading
+# the view in either mode
+total_plantings = api.aggregate_view("plantings", {"rows": "rows"})["rows"]
 
-if _raw_cache.empty:
+if not total_plantings:
     st.markdown("# 🌱 Plantings Tracker")
     st.info("No planting data available. Check your database connection.")
     if st.button("← Back to Home"):
         st.switch_page("edgewater.py")
     st.stop()
 
-plant_df = _raw_cache
-
 
-def _build_sorted(df: pd.DataFrame) -> pd.DataFrame:
-    """Sort plantings by date descending. Cached in session_state."""
+def _build_sorted() -> pd.DataFrame:
+    """Sort plantings by date descending."""
+    df = api.planting_view_cache
     if "DatePlanted" in df.columns:
         return df.sort_values("DatePlanted", ascending=False)
     return df
 
 
-def _build_plant_index(df: pd.DataFrame) -> dict:
-    """Pre-build {PlantingID: Series} for O(1) per-record lookups."""
-    return {row["PlantingID"]: row for _, row in df.iterrows()}
+def _build_filters() -> FilterEngine:
+    """Filter masks and date index over the sorted plantings."""
+    return FilterEngine(
+        api.derived("plantings.sorted", _build_sorted, ["plantings"]),
+        categorical=["Type", "PlantingLocation"],
+        dates=["DatePlanted"],
+    )
+
 
+def _latest_notes(item_ids) -> pd.DataFrame:
+    """Most recent seasonal note per item, indexed by ItemID."""
+    notes = api.get_children("seasonal_notes_table", item_ids)
+    return (
+        notes.sort_values("LastUpdate", ascending=False)
+        .drop_duplicates(subset=["ItemID"])
+        .set_index("ItemID")
+    )
 
-if "_plant_sorted" not in st.session_state:
-    st.session_state["_plant_sorted"] = _build_sorted(plant_df)
-sorted_plant = st.session_state["_plant_sorted"]
 
-if "_plant_by_id" not in st.session_state:
-    st.session_state["_plant_by_id"] = _build_plant_index(plant_df)
-plant_by_id = st.session_state["_plant_by_id"]
+def _with_child_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Add DestinationLocation and SeasonalNote columns for the table view."""
+    dests = api.get_children("planting_destinations", df["PlantingID"])
+    dest_names = (
+        dests.dropna(subset=["DestinationLocation"])
+        .groupby("PlantingID")["DestinationLocation"]
+        .agg(lambda s: ", ".join(map(str, s)))
+    )
+    notes = _latest_notes(df["ItemID"])
+    return df.assign(
+        DestinationLocation=df["PlantingID"].map(dest_names),
+        SeasonalNote=df["ItemID"].map(notes["Note"]),
+    )
 
 
 # ================================================================
 # FK decode maps for dropdown columns
-# These use Tier-1 cached lookups (no DB hit on rerun)
+# Built from Tier-1 lookups once per lookup change (api.derived)
 # ================================================================
 
-_loc_df = api.location_cache if api.location_cache is not None else pd.DataFrame()
 
-# ID -> display name (for rendering)
-_LOC_ID_TO_NAME = (
-    dict(zip(_loc_df["LocationID"], _loc_df["Location"])) if not _loc_df.empty else {}
+def _build_location_maps() -> tuple:
+    loc_df = api.location_cache if api.location_cache is not None else pd.DataFrame()
+    # ID -> display name (for rendering)
+    id_to_name = (
+        dict(zip(loc_df["LocationID"], loc_df["Location"])) if not loc_df.empty else {}
+    )
+    return (
+        id_to_name,
+        # Display name -> ID (for saving edits back to DB)
+        {v: k for k, v in id_to_name.items()},
+        # Options for SelectboxColumn (display names, with empty option)
+        [""] + sorted(id_to_name.values()),
+    )
+
+
+_LOC_ID_TO_NAME, _LOC_NAME_TO_ID, _LOC_DISPLAY_OPTIONS = api.derived(
+    "plantings.locations", _build_location_maps, ["locations"]
 )
 
-# Display name -> ID (for saving edits back to DB)
-_LOC_NAME_TO_ID = {v: k for k, v in _LOC_ID_TO_NAME.items()}
 
-# Options for SelectboxColumn (display names, with empty option)
-_LOC_DISPLAY_OPTIONS = [""] + sorted(_LOC_ID_TO_NAME.values())
+def _build_unit_map() -> dict:
+    """Add-form unit labels ("Type - Size") -> UnitID."""
+    units_df = api.unit_cache
+    if units_df is None or units_df.empty:
+        return {}
+    unit_map = {}
+    for unit_id, unit_type, unit_size in zip(
+        units_df["UnitID"], units_df["UnitType"], units_df["UnitSize"]
+    ):
+        label = str(unit_type)
+        if pd.notna(unit_size) and unit_size:
+            label += f" - {unit_size}"
+        unit_map[label] = unit_id
+    return unit_map
+
+
+# ===== APPLY FILTERS =====
+# Before the sidebar, so its multiselects can show facet counts. The date
+# inputs' values are read from session state (set before this rerun).
+page_filters = dict(
+    search=st.session_state.filter_search,
+    types=st.session_state.filter_types,
+    locations=st.session_state.filter_locations,
+    date_from=st.session_state.get("date_start"),
+    date_to=st.session_state.get("date_end"),
+)
+# Sidebar statistics over the filtered plantings, evaluated in SQL
+stats = api.aggregate_view(
+    "plantings",
+    {
+        "rows": "rows",
+        "unique_items": ("nunique", "ItemID"),
+        "locations_used": ("nunique", "PlantingLocation"),
+    },
+    **page_filters,
+)
+
+if PUSHDOWN_FILTERS:
+    # Only the visible page of rows is transferred; no facet counts
+    filtered_df = api.query_view(
+        "plantings", limit=st.session_state.results_limit, **page_filters
+    )
+    total_filtered = stats["rows"] or 0
+    type_counts, location_counts = {}, {}
+else:
+    plant_filters = api.derived("plantings.filters", _build_filters, ["plantings"])
+    search_mask = None
+    if st.session_state.filter_search:
+        matches = api.search_items(
+            st.session_state.filter_search, active_only=False, limit=None
+        )
+        search_mask = plant_filters.isin_mask("ItemID", matches["ItemID"])
+
+    filter_result = plant_filters.query(
+        isin={
+            "Type": st.session_state.filter_types,
+            "PlantingLocation": st.session_state.filter_locations,
+        },
+        between={
+            "DatePlanted": (
+                st.session_state.get("date_start"),
+                st.session_state.get("date_end"),
+            )
+        },
+        where=search_mask,
+    )
+    total_filtered = filter_result.count
+    filtered_df = filter_result.df.head(st.session_state.results_limit)
+    type_counts = filter_result.facets.get("Type", {})
+    location_counts = filter_result.facets.get("PlantingLocation", {})
 
 
 # ===== SIDEBAR =====
@@ -333,17 +436,21 @@ with st.sidebar:
         "Item Types",
         options=item_types,
         default=st.session_state.filter_types,
+        format_func=lambda t: f"{t} ({type_counts.get(t, 0)})" if type_counts else t,
         key="type_filter",
     )
     if selected_types != st.session_state.filter_types:
         st.session_state.filter_types = selected_types
         st.rerun()
 
-    location_options = _loc_df["Location"].tolist() if not _loc_df.empty else []
+    location_options = list(_LOC_ID_TO_NAME.values())
     selected_locations = st.multiselect(
         "Planted Location",
         options=location_options,
         default=st.session_state.filter_locations,
+        format_func=lambda loc: (
+            f"{loc} ({location_counts.get(loc, 0)})" if location_counts else loc
+        ),
         key="location_filter",
     )
     if selected_locations != st.session_state.filter_locations:
@@ -351,8 +458,8 @@ with st.sidebar:
         st.rerun()
 
     st.markdown("**Date Range**")
-    date_start = st.date_input("From", value=None, key="date_start")
-    date_end = st.date_input("To", value=None, key="date_end")
+    st.date_input("From", value=None, key="date_start")
+    st.date_input("To", value=None, key="date_end")
 
     if st.button("Clear All Filters", use_container_width=True):
         st.session_state.filter_search = ""
@@ -376,17 +483,9 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### 📊 Statistics")
 
-    total_plantings = len(plant_df)
-    unique_items = plant_df["ItemID"].nunique() if "ItemID" in plant_df.columns else 0
-    locations_used = (
-        plant_df["PlantingLocation"].dropna().nunique()
-        if "PlantingLocation" in plant_df.columns
-        else 0
-    )
-
-    st.metric("Total Plantings", total_plantings)
-    st.metric("Unique Items", unique_items)
-    st.metric("Locations Used", locations_used)
+    st.metric("Plantings", stats["rows"])
+    st.metric("Unique Items", stats["unique_items"])
+    st.metric("Locations Used", stats["locations_used"])
 
 
 # ===== MAIN HEADER =====
@@ -398,34 +497,6 @@ tab_cards, tab_table, tab_create = st.tabs(
     ["📋 Planting Cards", "📊 Table View", "➕ Add Planting"]
 )
 
-# ===== APPLY FILTERS =====
-filtered_df = sorted_plant
-
-if st.session_state.filter_search:
-    search_lower = st.session_state.filter_search.lower()
-    mask = (
-        filtered_df["Item"].str.lower().str.contains(search_lower, na=False)
-        | filtered_df["Variety"].str.lower().str.contains(search_lower, na=False)
-        | filtered_df["Color"].str.lower().str.contains(search_lower, na=False)
-    )
-    filtered_df = filtered_df[mask]
-
-if st.session_state.filter_types:
-    filtered_df = filtered_df[filtered_df["Type"].isin(st.session_state.filter_types)]
-
-if st.session_state.filter_locations and "PlantingLocation" in filtered_df.columns:
-    filtered_df = filtered_df[
-        filtered_df["PlantingLocation"].isin(st.session_state.filter_locations)
-    ]
-
-if date_start:
-    filtered_df = filtered_df[filtered_df["DatePlanted"] >= pd.to_datetime(date_start)]
-if date_end:
-    filtered_df = filtered_df[filtered_df["DatePlanted"] <= pd.to_datetime(date_end)]
-
-total_filtered = len(filtered_df)
-filtered_df = filtered_df.head(st.session_state.results_limit)
-
 
 # ==================== TAB 1: PLANTING CARDS ====================
 # Uses st.expander — expanding/collapsing does NOT trigger st.rerun().
@@ -452,15 +523,18 @@ with tab_cards:
             if "PlantingLocation" in row.index and pd.notna(row.get("PlantingLocation"))
             else "Unassigned"
         )
-        dest_name = (
-            row["DestinationLocation"]
-            if "DestinationLocation" in row.index
-            and pd.notna(row.get("DestinationLocation"))
-            else ""
+        destinations = api.get_children("planting_destinations", row["PlantingID"])
+        notes = api.get_children("seasonal_notes_table", row["ItemID"]).sort_values(
+            "LastUpdate", ascending=False
         )
+        latest_note = notes.iloc[0] if not notes.empty else None
         date_str = format_date(row.get("DatePlanted"))
-        greenhouse_icon = "🏠" if row.get("Greenhouse") else "🌿"
-        has_notes = "📝" if pd.notna(row.get("SeasonalNote")) else ""
+        greenhouse_icon = (
+            "🏠"
+            if latest_note is not None and latest_note.get("Greenhouse")
+            else "🌿"
+        )
+        has_notes = "📝" if latest_note is not None else ""
 
         expander_label = (
             f"{greenhouse_icon}  **{item_display}** — {count_str} — "
@@ -489,13 +563,21 @@ with tab_cards:
             with meta2:
                 st.markdown("**Location & Destination**")
                 st.markdown(f"- **Planted at:** {loc_name}")
-                st.markdown(f"- **Destined for:** {dest_name or 'Not set'}")
-                st.markdown(
-                    f"- **Units Destined:** {row['UnitsDestined'] if pd.notna(row.get('UnitsDestined')) else 'N/A'}"
-                )
-                st.markdown(
-                    f"- **Purpose:** {row['PurposeComments'] if pd.notna(row.get('PurposeComments')) else 'None'}"
-                )
+                if destinations.empty:
+                    st.markdown("- **Destined for:** Not set")
+                for _, dest in destinations.iterrows():
+                    dest_name = (
+                        dest["DestinationLocation"]
+                        if pd.notna(dest.get("DestinationLocation"))
+                        else "Not set"
+                    )
+                    st.markdown(f"- **Destined for:** {dest_name}")
+                    st.markdown(
+                        f"  - **Units Destined:** {dest['UnitsDestined'] if pd.notna(dest.get('UnitsDestined')) else 'N/A'}"
+                    )
+                    st.markdown(
+                        f"  - **Purpose:** {dest['PurposeComments'] if pd.notna(dest.get('PurposeComments')) else 'None'}"
+                    )
                 st.markdown(
                     f"- **Unit:** {row.get('UnitType', '')} - {row.get('UnitSize', '')}"
                 )
@@ -505,20 +587,18 @@ with tab_cards:
 
             with meta3:
                 st.markdown("**Seasonal Notes**")
-                if pd.notna(row.get("SeasonalNote")):
+                for _, note in notes.iterrows():
                     greenhouse_text = (
-                        "🏠 Greenhouse" if row.get("Greenhouse") else "🌿 Outdoor"
+                        "🏠 Greenhouse" if note.get("Greenhouse") else "🌿 Outdoor"
                     )
                     st.markdown(f"- **Environment:** {greenhouse_text}")
                     st.markdown(
-                        f"- **Season ID:** {int(row['GrowingSeasonID']) if pd.notna(row.get('GrowingSeasonID')) else 'N/A'}"
+                        f"- **Season ID:** {int(note['GrowingSeasonID']) if pd.notna(note.get('GrowingSeasonID')) else 'N/A'}"
                     )
-                    st.info(row["SeasonalNote"])
-                    if pd.notna(row.get("NoteLastUpdate")):
-                        st.caption(
-                            f"Last updated: {format_date(row['NoteLastUpdate'])}"
-                        )
-                else:
+                    st.info(note["Note"])
+                    if pd.notna(note.get("LastUpdate")):
+                        st.caption(f"Last updated: {format_date(note['LastUpdate'])}")
+                if notes.empty:
                     st.markdown("*No seasonal notes for this planting*")
 
                 if pd.notna(row.get("PlantingComments")):
@@ -613,7 +693,6 @@ with tab_cards:
                             allowed_fields=_EDITABLE_PLANTING_COLS,
                         )
                         st.success("✅ Updated successfully!")
-                        refresh_data()
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Update failed: {e}")
@@ -629,7 +708,6 @@ with tab_cards:
                     try:
                         api._delete(Planting, "PlantingID", plant_id)
                         st.success("Deleted!")
-                        refresh_data()
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Error deleting: {e}")
@@ -642,8 +720,9 @@ with tab_table:
     if filtered_df.empty:
         st.info("No records match current filters.")
     else:
-        available_cols = [c for c in _TABLE_DISPLAY_COLS if c in filtered_df.columns]
-        display_df = filtered_df[available_cols].copy()
+        table_df = _with_child_columns(filtered_df)
+        available_cols = [c for c in _TABLE_DISPLAY_COLS if c in table_df.columns]
+        display_df = table_df[available_cols].copy()
 
         st.dataframe(
             display_df,
@@ -658,43 +737,24 @@ with tab_create:
     st.markdown("### ➕ Add New Planting")
 
     # Lookup data for dropdowns (Tier-1 cached, no DB hit on rerun)
-    items_df = api.item_cache
-    units_df = api.unit_cache
+    item_picker = api.item_typeahead
+    unit_map = api.derived("plantings.unit_labels", _build_unit_map, ["units"])
 
-    if items_df is None or items_df.empty or units_df is None or units_df.empty:
+    if not len(item_picker) or not unit_map:
         st.warning("⚠️ Item or Unit data not loaded. Please refresh data.")
     else:
         with st.form("add_planting_form", clear_on_submit=True):
             col1, col2 = st.columns(2)
 
             with col1:
-                # Item selection — build label->ID map
-                item_map = {}
-                for _, r in items_df.iterrows():
-                    name = r.get("Item")
-                    if pd.isna(name) or not name:
-                        continue
-                    label = str(name)
-                    if pd.notna(r.get("Variety")) and r["Variety"]:
-                        label += f" - {r['Variety']}"
-                    if pd.notna(r.get("Color")) and r["Color"]:
-                        label += f" ({r['Color']})"
-                    item_map[label] = r["ItemID"]
-
+                # Labels precomputed by the shared typeahead index
                 selected_item_label = st.selectbox(
                     "Select Item *",
-                    options=[""] + sorted(item_map.keys()),
+                    options=[""] + item_picker.options,
                     key="form_item",
                 )
 
-                # Unit selection — build label->ID map
-                unit_map = {}
-                for _, r in units_df.iterrows():
-                    label = str(r["UnitType"])
-                    if pd.notna(r.get("UnitSize")) and r["UnitSize"]:
-                        label += f" - {r['UnitSize']}"
-                    unit_map[label] = r["UnitID"]
-
+                # Unit selection — label->ID map from _build_unit_map
                 selected_unit_label = st.selectbox(
                     "Select Unit *",
                     options=[""] + sorted(unit_map.keys()),
@@ -737,7 +797,7 @@ with tab_create:
                     for err in errors:
                         st.error(err)
                 else:
-                    selected_item_id = item_map[selected_item_label]
+                    selected_item_id = item_picker.id_for(selected_item_label)
                     selected_unit_id = unit_map[selected_unit_label]
                     selected_location_id = (
                         _LOC_NAME_TO_ID.get(selected_loc_label)
@@ -757,7 +817,6 @@ with tab_create:
                             LocationID=selected_location_id,
                         )
                         st.success("✅ Planting added successfully!")
-                        refresh_data()
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Error adding planting: {e}")
@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "rest"))
 from rest.api import EdgewaterAPI
 from export_utils import export_csv
+from paged_grid import paged_grid
 from models import Price as PRC
 from payloads import PricePayload
 
@@ -110,10 +111,7 @@ with st.expander("➕ Add New Price Record", expanded=st.session_state.show_add_
     st.write("### Create New Price Record")
 
     # Prepare lookup dictionaries
-    items_dict = {
-        int(k): str(v)
-        for k, v in api.item_cache.set_index("ItemID")["Item"].to_dict().items()
-    }
+    item_picker = api.item_typeahead
     units_dict = {
         int(k): str(v)
         for k, v in api.unit_cache.set_index("UnitID")
@@ -128,8 +126,8 @@ with st.expander("➕ Add New Price Record", expanded=st.session_state.show_add_
         with col1:
             form_item_id = st.selectbox(
                 "Item *",
-                options=list(items_dict.keys()),
-                format_func=lambda x: items_dict[x],
+                options=item_picker.item_ids,
+                format_func=item_picker.label_for,
                 key="form_item_id",
             )
             form_unit_id = st.selectbox(
@@ -193,28 +191,20 @@ with filter_col3:
         "Min Price", min_value=0.0, value=0.0, step=1.0, key="price_min"
     )
 
-# Apply filters
-filtered_df = api.price_cache.copy()
-
-# Item filter
+# Filters run in SQL; the grid below fetches one page at a time
+filters = dict(years=year_filter, min_price=price_min if price_min > 0 else None)
 if item_filter:
-    item_ids = api.item_cache[api.item_cache["Item"].isin(item_filter)][
+    filters["items"] = api.item_cache[api.item_cache["Item"].isin(item_filter)][
         "ItemID"
     ].tolist()
-    filtered_df = filtered_df[filtered_df["ItemID"].isin(item_ids)]
-
-# Year filter
-if year_filter:
-    filtered_df = filtered_df[filtered_df["Year"].isin(year_filter)]
-
-# Price filter
-if price_min > 0:
-    filtered_df = filtered_df[filtered_df["UnitPrice"] >= price_min]
 
 st.divider()
 
 # ==================== DATA DISPLAY & EDITING ====================
-st.write(f"### 📊 Price Records ({len(filtered_df)} records)")
+total_filtered = api.aggregate_view(
+    "price_table", {"rows": "rows"}, **filters
+)["rows"]
+st.write(f"### 📊 Price Records ({total_filtered} records)")
 
 # Action buttons
 action_col1, action_col2 = st.columns([1, 5])
@@ -230,7 +220,7 @@ with action_col1:
 
 with action_col2:
     if st.button("📥 Export CSV", use_container_width=True):
-        csv = export_csv(filtered_df, PRC)
+        csv = export_csv(api.query_view("price_table", **filters), PRC)
         st.download_button(
             label="Download CSV",
             data=csv,
@@ -252,14 +242,17 @@ column_config = {
 if st.session_state.edit_mode:
     st.info("✏️ **Edit Mode** - Make changes, then click 'Save Changes'")
 
-    edited_df = st.data_editor(
-        filtered_df,
-        use_container_width=True,
-        num_rows="fixed",
+    grid = paged_grid(
+        api,
+        "price_table",
+        key="prices",
+        filters=filters,
         column_config=column_config,
-        hide_index=True,
-        key="prices_editor",
+        default_sort="PriceID",
+        default_descending=False,
+        editable=True,
     )
+    filtered_df, edited_df = grid.df, grid.edited
 
     if not edited_df.equals(filtered_df):
         st.warning(f"⚠️ Unsaved changes detected!")
@@ -286,7 +279,11 @@ if st.session_state.edit_mode:
 
                             if pd.isna(orig_val) and pd.isna(edit_val):
                                 continue
-                            if orig_val != edit_val:
+                            if (
+                                pd.isna(orig_val)
+                                or pd.isna(edit_val)
+                                or orig_val != edit_val
+                            ):
                                 changes[col] = edit_val
 
                     if changes:
@@ -307,11 +304,14 @@ if st.session_state.edit_mode:
             if st.button("🔄 Discard Changes", use_container_width=True):
                 st.rerun()
 else:
-    st.dataframe(
-        filtered_df,
-        use_container_width=True,
+    paged_grid(
+        api,
+        "price_table",
+        key="prices",
+        filters=filters,
         column_config=column_config,
-        hide_index=True,
+        default_sort="PriceID",
+        default_descending=False,
     )
 
 # ==================== BULK OPERATIONS ====================
@@ -353,6 +353,7 @@ with st.expander("🔧 Bulk Operations"):
 # ==================== FOOTER ====================
 st.divider()
 
+total_records = api.aggregate_view("price_table", {"rows": "rows"})["rows"]
 st.caption(
-    f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total price records: {len(api.price_cache)}"
+    f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total price records: {total_records}"
 )
@@ -117,10 +117,7 @@ with st.expander("➕ Add New Seasonal Note", expanded=st.session_state.show_add
     st.write("### Create New Seasonal Note")
 
     # Prepare lookup dictionaries
-    items_dict = {
-        int(k): str(v)
-        for k, v in api.item_cache.set_index("ItemID")["Item"].to_dict().items()
-    }
+    item_picker = api.item_typeahead
 
     with st.form("add_seasonal_note_form", clear_on_submit=True):
         col1, col2 = st.columns(2)
@@ -128,8 +125,8 @@ with st.expander("➕ Add New Seasonal Note", expanded=st.session_state.show_add
         with col1:
             form_item_id = st.selectbox(
                 "Item *",
-                options=list(items_dict.keys()),
-                format_func=lambda x: items_dict[x],
+                options=item_picker.item_ids,
+                format_func=item_picker.label_for,
                 key="form_item_id",
             )
             form_growing_season = st.number_input(
@@ -300,7 +297,11 @@ if st.session_state.edit_mode:
 
                             if pd.isna(orig_val) and pd.isna(edit_val):
                                 continue
-                            if orig_val != edit_val:
+                            if (
+                                pd.isna(orig_val)
+                                or pd.isna(edit_val)
+                                or orig_val != edit_val
+                            ):
                                 changes[col] = edit_val
 
                     if changes:
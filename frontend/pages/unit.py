@@ -52,17 +52,18 @@ def create_unit_from_form(form_data: dict) -> Optional[dict]:
         return None
 
 
+UNIT_ALLOWED_FIELDS = {"UnitType", "UnitSize", "UnitCategoryID"}
+
+
 def update_unit(unit_id: int, updates: dict) -> bool:
     """Update a unit"""
     try:
-        allowed_fields = {"UnitType", "UnitSize", "UnitCategoryID"}
-
         result = api.generic_update(
             model_class=UNT,
             id_column="UnitID",
             id_value=unit_id,
             updates=updates,
-            allowed_fields=allowed_fields,
+            allowed_fields=UNIT_ALLOWED_FIELDS,
         )
 
         if result:
@@ -75,6 +76,29 @@ def update_unit(unit_id: int, updates: dict) -> bool:
         return False
 
 
+def update_units(updates_by_id: dict) -> int:
+    """Update many units in one transaction. Returns the number updated."""
+    try:
+        results = api.generic_update_many(
+            model_class=UNT,
+            id_column="UnitID",
+            updates_by_id={int(k): v for k, v in updates_by_id.items()},
+            allowed_fields=UNIT_ALLOWED_FIELDS,
+        )
+        failed = [key for key, result in results.items() if result is None]
+        if failed:
+            logger.warning(f"Failed to update units: {failed}")
+        for key in failed:
+            st.error(
+                f"❌ Error updating unit {key}: {results.errors.get(key)}"
+            )
+        return len(results) - len(failed)
+    except Exception as e:
+        st.error(f"❌ Error updating units: {e}")
+        logger.error(f"Batch update failed for Units: {e}")
+        return 0
+
+
 def delete_unit(unit_id: int) -> bool:
     """Delete a unit"""
     try:
@@ -255,8 +279,7 @@ if st.session_state.edit_mode:
             if st.button(
                 "💾 Save All Changes", type="primary", use_container_width=True
             ):
-                success_count = 0
-                error_count = 0
+                all_changes = {}
 
                 for idx in edited_df.index:
                     unit_id = edited_df.loc[idx, "UnitID"]
@@ -271,14 +294,18 @@ if st.session_state.edit_mode:
 
                             if pd.isna(orig_val) and pd.isna(edit_val):
                                 continue
-                            if orig_val != edit_val:
+                            if (
+                                pd.isna(orig_val)
+                                or pd.isna(edit_val)
+                                or orig_val != edit_val
+                            ):
                                 changes[col] = edit_val
 
                     if changes:
-                        if update_unit(unit_id, changes):
-                            success_count += 1
-                        else:
-                            error_count += 1
+                        all_changes[unit_id] = changes
+
+                success_count = update_units(all_changes)
+                error_count = len(all_changes) - success_count
 
                 if success_count > 0:
                     st.success(f"✅ Updated {success_count} units")
@@ -320,8 +347,8 @@ with st.expander("🔧 Bulk Operations"):
         if st.button("Update Category", key="bulk_category_btn"):
             if bulk_unit_ids:
                 ids = [int(x.strip()) for x in bulk_unit_ids.split(",")]
-                success = sum(
-                    [update_unit(id, {"UnitCategoryID": new_category}) for id in ids]
+                success = update_units(
+                    {id: {"UnitCategoryID": new_category} for id in ids}
                 )
                 st.success(f"✅ Updated category for {success}/{len(ids)} units")
                 refresh_cache()
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     Column,
+    BigInteger,
     Integer,
     String,
     Text,
@@ -212,6 +213,7 @@ class Planting(Base):
     UnitID = Column(Integer, ForeignKey("T_Units.UnitID"))
     NumberOfUnits = Column(Text)
     PlantingComments = Column(Text)
+    LocationID = Column(Integer, ForeignKey("T_Locations.LocationID"))
 
     # Relationships
     item = relationship("Item", back_populates="plantings")
@@ -321,7 +323,7 @@ class SeasonalNotes(Base):
 
 class Users(Base):
     __tablename__ = "T_Users"
-    UserID = Column(Integer, primary_key=True)
+    UserID = Column(Integer, primary_key=True, autoincrement=True)
     Role = Column(Text)
     PermissionLevel = Column(Text)
     Email = Column(String(255))
@@ -361,13 +363,34 @@ class OrderItemDestination(Base):
 class Location(Base):
     __tablename__ = "T_Locations"
 
-    LocationID = Column(Integer, primary_key=True)
+    LocationID = Column(Integer, primary_key=True, autoincrement=True)
     Location = Column(Text)
 
     # Relationships
     inventory = relationship("Inventory", back_populates="location")
 
 
+class IdSequence(Base):
+    """T_IdSequences - Next-ID counters for tables without AUTO_INCREMENT"""
+
+    __tablename__ = "T_IdSequences"
+
+    TableName = Column(String(64), primary_key=True)
+    NextID = Column(Integer, nullable=False)
+
+
+class ChangeJournal(Base):
+    """T_ChangeJournal - Row changes recorded by triggers (see ChangeJournal.sql)"""
+
+    __tablename__ = "T_ChangeJournal"
+
+    ChangeID = Column(BigInteger, primary_key=True, autoincrement=True)
+    TableName = Column(String(64), nullable=False)
+    RowID = Column(Integer, nullable=False)
+    Operation = Column(String(1), nullable=False)  # I / U / D
+    ChangedAt = Column(DateTime, default=datetime.now, nullable=False)
+
+
 """
  Views!
 """
@@ -434,13 +457,6 @@ class PlantingsFullView(Base):
     PlantingLocationID = Column(Integer)
     PlantingLocation = Column(Text)
 
-    # PlantingDestination fields
-    PlantingDestinationID = Column(Integer)
-    DestinationLocationID = Column(Integer)
-    DestinationLocation = Column(Text)
-    UnitsDestined = Column(Text)
-    PurposeComments = Column(Text)
-
     # Item fields
     ItemID = Column(Integer)
     Item = Column(Text)
@@ -465,12 +481,23 @@ class PlantingsFullView(Base):
     # UnitCategory fields
     UnitCategory = Column(Text)
 
-    # SeasonalNotes fields (from LEFT JOIN)
-    NoteID = Column(Integer)
-    GrowingSeasonID = Column(Integer)
-    Greenhouse = Column(Boolean)
-    SeasonalNote = Column(Text)
-    NoteLastUpdate = Column(DateTime)
+
+class PlantingDestinationsView(Base):
+    """v_planting_destinations - One row per planting destination"""
+
+    __tablename__ = "v_planting_destinations"
+
+    # Primary key
+    PlantingDestinationID = Column(Integer, primary_key=True)
+
+    # Parent planting
+    PlantingID = Column(Integer)
+
+    # Destination fields
+    DestinationLocationID = Column(Integer)
+    DestinationLocation = Column(Text)
+    UnitsDestined = Column(Text)
+    PurposeComments = Column(Text)
 
 
 class OrdersFullView(Base):
@@ -501,17 +528,6 @@ class OrdersFullView(Base):
     Color = Column(Text)
     ItemTypeName = Column(Text)
 
-    # OrderItemDestination fields
-    OrderItemDestinationID = Column(Integer)
-    DestinationCount = Column(Integer)
-    DestinationUnitID = Column(Integer)
-    DestinationUnitType = Column(Text)
-    DestinationUnitSize = Column(Text)
-
-    # Location fields
-    LocationID = Column(Integer)
-    LocationName = Column(Text)
-
     # Order fields
     OrderID = Column(Integer)
     DatePlaced = Column(DateTime)
@@ -574,6 +590,68 @@ class OrdersFullView(Base):
     SupplierType = Column(Text)
 
 
+class OrderItemDestinationsView(Base):
+    """v_order_item_destinations - One row per order item destination"""
+
+    __tablename__ = "v_order_item_destinations"
+
+    # Primary key
+    OrderItemDestinationID = Column(Integer, primary_key=True)
+
+    # Parent order item
+    OrderItemID = Column(Integer)
+
+    # Destination fields
+    DestinationCount = Column(Integer)
+    DestinationUnitID = Column(Integer)
+    DestinationUnitType = Column(Text)
+    DestinationUnitSize = Column(Text)
+
+    # Location fields
+    LocationID = Column(Integer)
+    LocationName = Column(Text)
+
+
+class OrdersSummaryView(Base):
+    """v_orders_summary - One row per order with line-item rollups"""
+
+    __tablename__ = "v_orders_summary"
+
+    # Primary key
+    OrderID = Column(Integer, primary_key=True)
+
+    # Order fields
+    DatePlaced = Column(DateTime)
+    DateReceived = Column(DateTime)
+    DateDue = Column(DateTime)
+    OrderNumber = Column(Text)
+    TrackingNumber = Column(Text)
+    OrderComments = Column(Text)
+    TotalCost = Column(Float)
+    GrowingSeason = Column(Text)
+    GrowingSeasonID = Column(Integer)
+
+    # Broker fields
+    BrokerID = Column(Integer)
+    Broker = Column(Text)
+    BrokerComments = Column(Text)
+
+    # Shipper fields
+    ShipperID = Column(Integer)
+    Shipper = Column(Text)
+    ShipperComments = Column(Text)
+
+    # Supplier fields
+    SupplierID = Column(Integer)
+    Supplier = Column(Text)
+    SupplierComments = Column(Text)
+
+    # Line-item rollups
+    ItemCount = Column(Integer)
+    ReceivedCount = Column(Integer)
+    LineItemTotal = Column(Float)
+
+
 class LabelDataFullView(Base):
     """v_label_data_full - SQL View for label data"""
 
@@ -598,8 +676,19 @@ class LabelDataFullView(Base):
     # ItemType fields
     Type = Column(Text)
 
+
+class ItemPricesView(Base):
+    """v_item_prices - One row per price, with its unit"""
+
+    __tablename__ = "v_item_prices"
+
+    # Primary key
+    PriceID = Column(Integer, primary_key=True)
+
+    # Parent item
+    ItemID = Column(Integer)
+
     # Price fields
-    PriceID = Column(Integer)
     UnitID = Column(Integer)
     UnitPrice = Column(Float)
     Year = Column(Text)
@@ -0,0 +1,171 @@
+"""
+Paged grid for the admin pages.
+
+Renders one keyset page of a filtered view (EdgewaterAPI.fetch_page, see
+rest/paging.py) in st.dataframe or st.data_editor, with sort, page size and
+First / Previous / Next controls, so the payload sent to the browser is one
+page no matter how large the table is. Changing the filters, sort or page
+size goes back to the first page.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+import streamlit as st
+
+from config import get_config
+from rest.paging import sort_keys
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+@dataclass
+class GridPage:
+    df: pd.DataFrame  # rows shown on this page
+    edited: Optional[pd.DataFrame]  # data_editor output (editable grids)
+    total: int  # rows matching the filters
+
+
+def _signature(view: str, sort: str, descending: bool, size: int, filters: Dict):
+    """What the current page was fetched for; any change restarts at page 1."""
+    hashable = tuple(
+        sorted(
+            (name, tuple(value) if isinstance(value, (list, set)) else value)
+            for name, value in filters.items()
+        )
+    )
+    return view, sort, descending, size, hashable
+
+
+def paged_grid(
+    api,
+    view: str,
+    key: str,
+    filters: Optional[Dict[str, Any]] = None,
+    column_config: Optional[Dict] = None,
+    default_sort: Optional[str] = None,
+    default_descending: bool = True,
+    editable: bool = False,
+    prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+) -> GridPage:
+    """
+    Render one page of `view` (a name in EdgewaterAPI._VIEW_QUERIES).
+
+    Args:
+        key: Unique per grid on the page; prefixes its session state keys
+        filters: As in api.query_view (None/empty values are no filter)
+        default_sort: Initial sort column (default: primary key)
+        default_descending: Initial sort direction
+        editable: Render with st.data_editor and return its output
+        prepare: Optional df -> df applied to the page before rendering
+                 (e.g. decoding FK IDs)
+    """
+    filters = filters or {}
+    spec = api._VIEW_QUERIES[view]
+    sortable = sort_keys(spec)
+    labels = column_config or {}
+    state_key = f"{key}_paging"
+    default_size = get_config().GRID_PAGE_SIZE
+    sizes = sorted(set(PAGE_SIZES) | {default_size})
+
+    sort_col, order_col, size_col = st.columns([2, 1, 1])
+    with sort_col:
+        sort = st.selectbox(
+            "Sort by",
+            options=sortable,
+            index=sortable.index(default_sort) if default_sort in sortable else 0,
+            format_func=lambda c: (labels.get(c) or {}).get("label") or c,
+            key=f"{key}_sort",
+        )
+    with order_col:
+        descending = (
+            st.selectbox(
+                "Order",
+                options=["Descending", "Ascending"],
+                index=0 if default_descending else 1,
+                key=f"{key}_order",
+            )
+            == "Descending"
+        )
+    with size_col:
+        size = st.selectbox(
+            "Rows per page",
+            options=sizes,
+            index=sizes.index(default_size),
+            key=f"{key}_size",
+        )
+
+    signature = _signature(view, sort, descending, size, filters)
+    paging = st.session_state.get(state_key)
+    if paging is None or paging["signature"] != signature:
+        paging = {"signature": signature, "after": None, "before": None, "number": 1}
+        st.session_state[state_key] = paging
+
+    page = api.fetch_page(
+        view,
+        sort,
+        descending,
+        after=paging["after"],
+        before=paging["before"],
+        page_size=size,
+        **filters,
+    )
+    total = api.aggregate_view(view, {"rows": "rows"}, **filters)["rows"] or 0
+
+    shown = prepare(page.df) if prepare is not None else page.df
+    edited = None
+    if editable:
+        edited = st.data_editor(
+            shown,
+            use_container_width=True,
+            num_rows="fixed",
+            column_config=column_config,
+            hide_index=True,
+            key=f"{key}_editor",
+        )
+    else:
+        st.dataframe(
+            shown,
+            use_container_width=True,
+            column_config=column_config,
+            hide_index=True,
+        )
+
+    def _go(after, before, number):
+        paging.update(after=after, before=before, number=number)
+
+    first = (paging["number"] - 1) * size + 1 if len(shown) else 0
+    last = first + len(shown) - 1 if len(shown) else 0
+    nav_first, nav_prev, nav_info, nav_next = st.columns([1, 1, 3, 1])
+    with nav_first:
+        st.button(
+            "⏮ First",
+            key=f"{key}_first",
+            disabled=not page.has_prev,
+            on_click=_go,
+            args=(None, None, 1),
+            use_container_width=True,
+        )
+    with nav_prev:
+        st.button(
+            "◀ Previous",
+            key=f"{key}_prev",
+            disabled=not page.has_prev,
+            on_click=_go,
+            args=(None, page.first_key, max(paging["number"] - 1, 1)),
+            use_container_width=True,
+        )
+    with nav_info:
+        st.caption(f"Page {paging['number']} · rows {first}–{last} of {total}")
+    with nav_next:
+        st.button(
+            "Next ▶",
+            key=f"{key}_next",
+            disabled=not page.has_next,
+            on_click=_go,
+            args=(page.last_key, None, paging["number"] + 1),
+            use_container_width=True,
+        )
+
+    return GridPage(df=shown, edited=edited, total=total)
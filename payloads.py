@@ -252,12 +252,6 @@ class PlantingsFullViewPayload(TypedDict, total=False):
     # Planting location fields
     PlantingLocationID: int
     PlantingLocation: str
-    # PlantingDestination fields
-    PlantingDestinationID: int
-    DestinationLocationID: int
-    DestinationLocation: str
-    UnitsDestined: str
-    PurposeComments: str
     # Item fields
     ItemID: int
     Item: str
@@ -278,12 +272,17 @@ class PlantingsFullViewPayload(TypedDict, total=False):
     UnitCategoryID: int
     # UnitCategory fields
     UnitCategory: str
-    # SeasonalNotes fields
-    NoteID: int
-    GrowingSeasonID: int
-    Greenhouse: bool
-    SeasonalNote: str
-    NoteLastUpdate: datetime
+
+
+class PlantingDestinationsViewPayload(TypedDict, total=False):
+    """Payload for v_planting_destinations view"""
+
+    PlantingDestinationID: int
+    PlantingID: int
+    DestinationLocationID: int
+    DestinationLocation: str
+    UnitsDestined: str
+    PurposeComments: str
 
 
 class OrdersFullViewPayload(TypedDict, total=False):
@@ -305,15 +304,6 @@ class OrdersFullViewPayload(TypedDict, total=False):
     Variety: str
     Color: str
     ItemTypeName: str
-    # OrderItemDestination fields
-    OrderItemDestinationID: int
-    DestinationCount: int
-    DestinationUnitID: int
-    DestinationUnitType: str
-    DestinationUnitSize: str
-    # Location fields
-    LocationID: int
-    LocationName: str
     # Order fields
     OrderID: int
     DatePlaced: datetime
@@ -368,6 +358,51 @@ class OrdersFullViewPayload(TypedDict, total=False):
     SupplierType: str
 
 
+class OrderItemDestinationsViewPayload(TypedDict, total=False):
+    """Payload for v_order_item_destinations view"""
+
+    OrderItemDestinationID: int
+    OrderItemID: int
+    DestinationCount: int
+    DestinationUnitID: int
+    DestinationUnitType: str
+    DestinationUnitSize: str
+    # Location fields
+    LocationID: int
+    LocationName: str
+
+
+class OrdersSummaryViewPayload(TypedDict, total=False):
+    """Payload for v_orders_summary view"""
+
+    OrderID: int
+    DatePlaced: datetime
+    DateReceived: datetime
+    DateDue: datetime
+    OrderNumber: str
+    TrackingNumber: str
+    OrderComments: str
+    TotalCost: float
+    GrowingSeason: str
+    GrowingSeasonID: int
+    # Broker fields
+    BrokerID: int
+    Broker: str
+    BrokerComments: str
+    # Shipper fields
+    ShipperID: int
+    Shipper: str
+    ShipperComments: str
+    # Supplier fields
+    SupplierID: int
+    Supplier: str
+    SupplierComments: str
+    # Line-item rollups
+    ItemCount: int
+    ReceivedCount: int
+    LineItemTotal: float
+
+
 class LabelDataFullViewPayload(TypedDict, total=False):
     """Payload for v_label_data_full view"""
 
@@ -385,8 +420,13 @@ class LabelDataFullViewPayload(TypedDict, total=False):
     TypeID: int
     # ItemType fields
     Type: str
-    # Price fields
+
+
+class ItemPricesViewPayload(TypedDict, total=False):
+    """Payload for v_item_prices view"""
+
     PriceID: int
+    ItemID: int
     UnitID: int
     UnitPrice: float
     Year: str
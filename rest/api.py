@@ -8,28 +8,36 @@ All public endpoints (properties, methods, signatures) are preserved.
 """
 
 import base64
+import warnings
 from collections import defaultdict
-from datetime import datetime, date
+from dataclasses import dataclass
+from functools import partial
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     DefaultDict,
+    FrozenSet,
     Dict,
     List,
     Optional,
+    Sequence,
     Set,
     Text,
     Tuple,
     TypedDict,
 )
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from loguru import logger
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import and_, case, false, func, insert, or_, select, true, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
-from database import get_db_session
+from config import get_config
+from database import engine, get_db_session
 from models import (
     Inventory,
     Item,
@@ -51,6 +59,16 @@ from models import (
     Users,
     Location,
     SeasonalNotes,
+    ChangeJournal,
+    InventoryFullView,
+    PlantingsFullView,
+    PlantingDestinationsView,
+    OrdersFullView,
+    OrdersSummaryView,
+    OrderItemDestinationsView,
+    LabelDataFullView,
+    ItemPricesView,
+    PitchFullView,
 )
 from payloads import (
     BrokerPayload,
@@ -74,6 +92,50 @@ from payloads import (
     UserPayload,
     LocationPayload,
 )
+from rest.dtypes import apply_dtypes, compact, memory_report
+from rest.id_allocator import IdAllocator
+from rest.lookup_store import LookupStore
+from rest.paging import Page, PageKey, keyset_statement, to_page
+from rest.query_stats import QueryStats, instrument_engine, track_operation
+from rest.search import search_items as _search_items
+from rest.typeahead import ItemTypeahead
+from rest.view_query import (
+    ITEM_SEARCH,
+    Metric,
+    ViewQuery,
+    aggregate_statement,
+    aggregate_values,
+    count_statement,
+    filtered_statement,
+    ordered_statement,
+)
+from rest.view_store import ViewEntry, ViewStore
+
+config = get_config()
+
+
+class ConcurrentUpdateError(Exception):
+    """An update's `expected` values no longer matched the stored row."""
+
+
+class BatchUpdateResults(dict):
+    """
+    {id: updated record, or None} from a batched update, plus `errors`:
+    {id: why that row was not saved} for every None.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.errors: Dict[Any, str] = {}
+
+    def fail(self, id_value: Any, reason: str) -> None:
+        self[id_value] = None
+        self.errors[id_value] = reason
+
+
+def _error_text(e: Exception) -> str:
+    """The DB driver's message (e.g. the violated constraint) when there is one."""
+    return str(getattr(e, "orig", None) or e)
 
 
 # ============================================================
@@ -91,104 +153,369 @@ def _rows_to_dataframe(rows) -> pd.DataFrame:
     return pd.DataFrame([_row_to_dict(r) for r in rows])
 
 
+def _db_value(value: Any) -> Any:
+    """Plain Python value for a DB parameter: pd.NA/NaT -> None, numpy scalars unboxed."""
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
 # ============================================================
-# Helper: Generic cached table loader (used by @st.cache_data stubs)
+# Write plans: per-model insert recipes
 # ============================================================
 
 
-def _load_table(model_class, label: str) -> pd.DataFrame:
-    """
-    Shared implementation for all Tier-1 cached loaders.
-    Each @st.cache_data stub delegates here so Streamlit still sees
-    distinct function identities for cache keying.
-    """
-    try:
-        with get_db_session() as session:
-            results = session.query(model_class).all()
-            df = _rows_to_dataframe(results)
-            logger.info(f"Loaded {len(df)} {label} (cached)")
-            return df
-    except Exception as e:
-        logger.error(f"Error loading {label}: {e}")
-        return pd.DataFrame()
+def _coercer_for(column) -> Optional[Callable[[Any], Any]]:
+    """Python type a written value is coerced to for `column` (None = pass through)."""
+    from sqlalchemy import Text, String, Integer, Float, Boolean
 
+    for type_group, coerce_fn in (
+        ((Text, String), str),
+        ((Integer,), int),
+        ((Float,), float),
+        ((Boolean,), bool),
+    ):
+        if isinstance(column.type, type_group):
+            return coerce_fn
+    # DateTime and anything else — pass through
+    return None
 
-# ============================================================
-# Tier 1: Cached lookup loaders
-# ============================================================
-# Each must be a distinct function so @st.cache_data keys them separately.
-# They are module-level statics; the class exposes them via properties.
 
+_MISSING = object()
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_items():
-    return _load_table(Item, "items")
 
+@dataclass(frozen=True)
+class _WritePlan:
+    """
+    How to turn payload dicts into INSERT rows for one model.
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_item_types():
-    return _load_table(ItemType, "item types")
+    Built once per model from its table metadata (see _write_plan), so
+    inserts don't re-inspect column types for every field of every row.
+    """
 
+    table: Any
+    pk: str
+    auto_increment: bool
+    columns: Tuple[str, ...]
+    coercers: Tuple[Optional[Callable[[Any], Any]], ...]
+    defaults: Tuple[Optional[Callable[[], Any]], ...]
+    required: Tuple[str, ...]  # NOT NULL without a default
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_units():
-    return _load_table(Unit, "units")
+    def records(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Coerce payloads to full-width records, one column at a time.
 
+        Keys that aren't columns are ignored. Missing columns get the
+        column default (or None); explicit None is kept, as with the ORM.
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_unit_categories():
-    return _load_table(UnitCategory, "unit categories")
+        Raises:
+            ValueError: A required column is None
+        """
+        records: List[Dict[str, Any]] = [{} for _ in rows]
+        for column, coerce_fn, default in zip(
+            self.columns, self.coercers, self.defaults
+        ):
+            values = [_db_value(row.get(column, _MISSING)) for row in rows]
+            if default is not None:
+                values = [default() if v is _MISSING else v for v in values]
+            if coerce_fn is not None:
+                values = [
+                    None if v is None or v is _MISSING else coerce_fn(v)
+                    for v in values
+                ]
+            for record, value in zip(records, values):
+                record[column] = None if value is _MISSING else value
 
+        for column in self.required:
+            if any(record[column] is None for record in records):
+                raise ValueError(f"{self.table.name}.{column} cannot be null")
+        return records
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_locations():
-    return _load_table(Location, "locations")
 
+_WRITE_PLANS: Dict[Any, _WritePlan] = {}
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_suppliers():
-    return _load_table(Supplier, "suppliers")
 
+def _write_plan(model_class) -> _WritePlan:
+    """Cached _WritePlan for `model_class`, built on first use."""
+    plan = _WRITE_PLANS.get(model_class)
+    if plan is not None:
+        return plan
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_shippers():
-    return _load_table(Shipper, "shippers")
+    table = model_class.__table__
+    pk_columns = list(table.primary_key.columns)
+    # Same predicate as _table_add, so single and bulk inserts agree
+    auto_increment = IdAllocator.uses_auto_increment(model_class)
+
+    def default_for(column) -> Optional[Callable[[], Any]]:
+        default = column.default
+        if default is None:
+            return None
+        if default.is_scalar:
+            return lambda: default.arg
+        if default.is_callable:
+            return lambda: default.arg(None)
+        return None
+
+    columns = list(table.columns)
+    plan = _WritePlan(
+        table=table,
+        pk=pk_columns[0].key,
+        auto_increment=auto_increment,
+        columns=tuple(c.key for c in columns),
+        coercers=tuple(_coercer_for(c) for c in columns),
+        defaults=tuple(default_for(c) for c in columns),
+        required=tuple(
+            c.key
+            for c in columns
+            if not c.nullable
+            and c.default is None
+            and not (c.primary_key and auto_increment)
+        ),
+    )
+    _WRITE_PLANS[model_class] = plan
+    return plan
 
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_brokers():
-    return _load_table(Broker, "brokers")
+# ============================================================
+# Helper: Columnar result loader
+# ============================================================
+# Loader modes for _load_table / _get_all / _get_table:
+#   "orm"      - session.query(Model).all() -> instances -> dicts (legacy)
+#   "columnar" - Core select(); rows are transposed straight into column lists
+#   "stream"   - columnar, fetched through a server-side cursor in chunks so
+#                the driver never buffers the whole result (large views)
+
+LOADER_ORM = "orm"
+LOADER_COLUMNAR = "columnar"
+LOADER_STREAM = "stream"
+
+
+def _select_to_dataframe(
+    session,
+    model_class,
+    filters: Optional[Dict] = None,
+    stream: bool = False,
+    chunk_size: Optional[int] = None,
+    where=None,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Load a mapped table/view into a DataFrame without building ORM objects.
+
+    Each fetched chunk is transposed with zip(*rows) and appended to one list
+    per column, so no per-row instance, identity-map entry or dict is created.
+    `columns` limits the SELECT to those columns (a projection profile).
+    """
+    table = model_class.__table__
+    selected = [table.c[c] for c in columns] if columns else list(table.columns)
+    keys = [c.key for c in selected]
+    stmt = select(*selected)
+    if filters:
+        for column, value in filters.items():
+            stmt = stmt.where(table.c[column] == value)
+    if where is not None:
+        stmt = stmt.where(where)
+
+    values: List[List[Any]] = [[] for _ in keys]
+    if stream:
+        result = session.execute(
+            stmt,
+            execution_options={
+                "stream_results": True,
+                "yield_per": chunk_size or config.STREAM_CHUNK_SIZE,
+            },
+        )
+        partitions = result.partitions()
+    else:
+        partitions = [session.execute(stmt).all()]
 
+    for rows in partitions:
+        if not rows:
+            continue
+        for column, chunk in zip(values, zip(*rows)):
+            column.extend(chunk)
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_growing_seasons():
-    return _load_table(GrowingSeason, "growing seasons")
+    return pd.DataFrame(dict(zip(keys, values)), columns=keys)
 
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_order_item_types():
-    return _load_table(OrderItemType, "order item types")
+def _align_dtypes(fresh: pd.DataFrame, like: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give all-null columns of a few refetched/patched rows the dtype of the
+    cached frame, so concatenating them doesn't degrade numeric and date
+    columns to object.
+    """
+    for column in fresh.columns.intersection(like.columns):
+        target = like[column].dtype
+        if (
+            fresh[column].dtype == target
+            or target == bool  # numpy bool can't hold the nulls
+            or not fresh[column].isna().all()
+        ):
+            continue
+        if isinstance(target, np.dtype) and target.kind in "iu":
+            target = "float64"
+        try:
+            fresh[column] = fresh[column].astype(target)
+        except (TypeError, ValueError):
+            pass
+    return fresh
 
 
-@st.cache_data(ttl=600, show_spinner=False)
-def _cached_load_order_notes():
-    return _load_table(OrderNote, "order notes")
+# ============================================================
+# Helper: Generic table loader (used by the Tier-1 lookup store)
+# ============================================================
 
 
-# Lookup for programmatic cache-clearing
-_CACHED_LOADERS = [
-    _cached_load_items,
-    _cached_load_item_types,
-    _cached_load_units,
-    _cached_load_unit_categories,
-    _cached_load_locations,
-    _cached_load_suppliers,
-    _cached_load_shippers,
-    _cached_load_brokers,
-    _cached_load_growing_seasons,
-    _cached_load_order_item_types,
-    _cached_load_order_notes,
-]
+@track_operation
+def _load_table(
+    model_class,
+    label: str,
+    loader: str = LOADER_COLUMNAR,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Shared implementation for all Tier-1 lookup loads (and the benchmarks).
+    Runs on a lookup-store miss: first use, TTL expiry, or after a write.
+    `columns` loads a projection (see EdgewaterAPI._PROFILES).
+    """
+    try:
+        with get_db_session() as session:
+            if loader == LOADER_ORM:
+                df = _rows_to_dataframe(session.query(model_class).all())
+            else:
+                df = _select_to_dataframe(
+                    session,
+                    model_class,
+                    stream=loader == LOADER_STREAM,
+                    columns=columns,
+                )
+            if config.COMPACT_DTYPES:
+                # memory_report() tracks full loads only
+                df = (
+                    apply_dtypes(df, model_class)
+                    if columns
+                    else compact(df, model_class)
+                )
+            logger.info(f"Loaded {len(df)} {label} (cached)")
+            return df
+    except Exception as e:
+        logger.error(f"Error loading {label}: {e}")
+        return pd.DataFrame()
+
+
+# ============================================================
+# Tier 1: Lookup store
+# ============================================================
+# name -> (model, log label, ID column, display-name column). The class
+# exposes each lookup via a property (item_cache, unit_cache, ...).
+_LOOKUPS = {
+    "items": (Item, "items", "ItemID", None),
+    "item_types": (ItemType, "item types", "TypeID", "Type"),
+    "units": (Unit, "units", "UnitID", None),
+    "unit_categories": (
+        UnitCategory, "unit categories", "UnitCategoryID", "UnitCategory"
+    ),
+    "locations": (Location, "locations", "LocationID", "Location"),
+    "suppliers": (Supplier, "suppliers", "SupplierID", "Supplier"),
+    "shippers": (Shipper, "shippers", "ShipperID", "Shipper"),
+    "brokers": (Broker, "brokers", "BrokerID", "Broker"),
+    "growing_seasons": (
+        GrowingSeason, "growing seasons", "GrowingSeasonID", "GrowingSeason"
+    ),
+    "order_item_types": (
+        OrderItemType, "order item types", "OrderItemTypeID", "OrderItemType"
+    ),
+    "order_notes": (OrderNote, "order notes", "OrderNoteID", "OrderNote"),
+}
+
+# One read-only copy of each lookup per process, shared by all sessions
+_LOOKUP_STORE = LookupStore(ttl_seconds=config.LOOKUP_TTL_SECONDS)
+for _name, (_model, _label, _id_column, _name_column) in _LOOKUPS.items():
+    _LOOKUP_STORE.register(
+        _name, partial(_load_table, _model, _label), _id_column, _name_column
+    )
+
+# Base table -> lookup name, invalidated by write-through after writes
+_LOOKUP_BY_TABLE = {
+    model.__tablename__: name for name, (model, *_) in _LOOKUPS.items()
+}
+
+
+# Search results are cached per (query, type, active_only, limit) so reruns
+# with an unchanged search box don't query again; item writes clear them
+@st.cache_data(ttl=600, show_spinner=False, max_entries=256)
+def _cached_search_items(query, item_type, active_only, limit):
+    df = _search_items(query, item_type, active_only, limit)
+    if config.COMPACT_DTYPES:
+        apply_dtypes(df, Item)
+    return df
+
+
+# Sidebar metrics per (view, metrics, filters): a handful of numbers per
+# filter combination. Cleared by every write-through and view refresh.
+@st.cache_data(ttl=600, show_spinner=False, max_entries=512)
+def _cached_aggregate_view(
+    view: str, metrics: Tuple[Tuple[str, Metric], ...], filters: Tuple
+) -> Dict[str, Any]:
+    spec = EdgewaterAPI._VIEW_QUERIES[view]
+    metrics = dict(metrics)
+    with get_db_session() as session:
+        dialect = session.get_bind().dialect.name
+        stmt = filtered_statement(spec, dialect=dialect, **dict(filters))
+        row = session.execute(aggregate_statement(stmt, metrics)).one()
+    return aggregate_values(metrics, row)
+
+
+# Base table -> caches derived from it, also cleared by write-through
+_DERIVED_CACHES_BY_TABLE = {
+    "T_Items": [_cached_search_items],
+    "T_ItemType": [_cached_search_items],
+}
+
+
+class _PatchNotApplicable(Exception):
+    """A write can't be patched into a cached view; the cache is invalidated."""
+
+
+def _same(*columns: str) -> Dict[str, str]:
+    """Identity column mapping for _VIEW_PATCHES resolvers."""
+    return {c: c for c in columns}
+
+
+# Shared by every session in the process so block reservations are reused
+_ID_ALLOCATOR = IdAllocator(block_size=config.ID_ALLOCATION_BLOCK_SIZE)
+
+
+@track_operation
+def _journal_head() -> int:
+    """Latest T_ChangeJournal.ChangeID (0 when the journal is empty)."""
+    with get_db_session() as session:
+        return session.execute(select(func.max(ChangeJournal.ChangeID))).scalar() or 0
+
+
+# Tier-2 view/table caches, one copy per process shared by all sessions
+_VIEW_STORE = ViewStore(watermark=_journal_head)
+
+# Parent-ID indexes over child datasets: cache key -> (indexed frame,
+# {parent ID: row positions}). Rebuilt when the store publishes a new frame.
+_CHILD_INDEXES: Dict[str, Tuple[pd.DataFrame, Dict[Any, np.ndarray]]] = {}
+
+# Journal entries applied within the replay window of each cache:
+# store key -> (watermark, ChangeIDs). Valid while the entry's watermark
+# still matches; otherwise the whole window is replayed once.
+_JOURNAL_APPLIED: Dict[str, Tuple[int, FrozenSet[int]]] = {}
+
+# EdgewaterAPI.derived() memo: name -> (source versions, value)
+_DERIVED: Dict[str, Tuple[Tuple[int, ...], Any]] = {}
+
+# Process-wide SQL instrumentation (admin landing page "Query Performance")
+QUERY_STATS = QueryStats(
+    max_entries=config.QUERY_STATS_BUFFER_SIZE, slow_query_ms=config.SLOW_QUERY_MS
+)
+if config.QUERY_STATS_ENABLED:
+    instrument_engine(engine, QUERY_STATS, log_file=config.LOG_FILE)
 
 
 class EdgewaterAPI:
@@ -290,14 +617,16 @@ class EdgewaterAPI:
     # ================================================================
     # Cache Management — Two-tier system
     #
-    # Tier 1: Lookup tables (@st.cache_data with TTL)
+    # Tier 1: Lookup tables (process-wide LookupStore with TTL)
     #     Small, rarely-changing reference data (items, units, types, etc.)
-    #     Auto-expires after TTL, shared across sessions.
+    #     One read-only frame per process with ID/name indexes; auto-expires
+    #     after TTL, invalidated by writes.
     #
-    # Tier 2: View caches (st.session_state)
+    # Tier 2: View caches (process-wide ViewStore)
     #     Large view data (inventory, plantings, orders). Loaded once per
-    #     session, explicit refresh via refresh button. Pages derive
-    #     filtered working sets from these.
+    #     process and shared read-only by every session; explicit refresh
+    #     via refresh button bumps the view's version. Pages derive
+    #     filtered working sets (kept in st.session_state) from these.
     # ================================================================
 
     # ===== TIER 1: PROPERTY ACCESSORS =====
@@ -305,137 +634,219 @@ class EdgewaterAPI:
 
     @property
     def item_cache(self):
-        return _cached_load_items()
+        return _LOOKUP_STORE.get("items")
 
     @property
     def item_type_cache(self):
-        return _cached_load_item_types()
+        return _LOOKUP_STORE.get("item_types")
 
     @property
     def unit_cache(self):
-        return _cached_load_units()
+        return _LOOKUP_STORE.get("units")
 
     @property
     def unit_category_cache(self):
-        return _cached_load_unit_categories()
+        return _LOOKUP_STORE.get("unit_categories")
 
     @property
     def location_cache(self):
-        return _cached_load_locations()
+        return _LOOKUP_STORE.get("locations")
 
     @property
     def supplier_cache(self):
-        return _cached_load_suppliers()
+        return _LOOKUP_STORE.get("suppliers")
 
     @property
     def shipper_cache(self):
-        return _cached_load_shippers()
+        return _LOOKUP_STORE.get("shippers")
 
     @property
     def broker_cache(self):
-        return _cached_load_brokers()
+        return _LOOKUP_STORE.get("brokers")
 
     @property
     def growing_season_cache(self):
-        return _cached_load_growing_seasons()
+        return _LOOKUP_STORE.get("growing_seasons")
 
     @property
     def order_item_type_cache(self):
-        return _cached_load_order_item_types()
+        return _LOOKUP_STORE.get("order_item_types")
 
     @property
     def order_note_cache(self):
-        return _cached_load_order_notes()
+        return _LOOKUP_STORE.get("order_notes")
 
-    # ===== TIER 2: SESSION-STATE VIEW CACHES =====
+    @property
+    def item_typeahead(self) -> ItemTypeahead:
+        """Shared prefix index and picker labels over the employee_lookup items."""
+        items = self._lookup_key("items", "employee_lookup")
+        return self.derived(
+            "item_typeahead", lambda: ItemTypeahead(_LOOKUP_STORE.get(items)), [items]
+        )
 
-    def _get_session_cache(self, key: str, loader: Callable) -> pd.DataFrame:
-        """Get a view cache from session_state, loading if not present."""
-        if key not in st.session_state or st.session_state[key] is None:
-            try:
-                result = loader()
-                st.session_state[key] = result
-                logger.info(f"Loaded {key} into session_state ({len(result)} rows)")
-            except Exception as e:
-                logger.error(f"Failed to load {key}: {e}")
-                st.session_state[key] = pd.DataFrame()
-        return st.session_state[key]
+    @classmethod
+    def lookup(cls, name: str, profile: str = "admin_full") -> pd.DataFrame:
+        """Tier-1 lookup `name` with the columns of `profile`. Read-only."""
+        return _LOOKUP_STORE.get(cls._lookup_key(name, profile))
 
-    def _refresh_session_cache(self, key: str, loader: Callable) -> pd.DataFrame:
-        """Force refresh a view cache in session_state."""
+    @classmethod
+    def lookup_row(
+        cls, lookup: str, id_value: Any, profile: str = "admin_full"
+    ) -> Optional[pd.Series]:
+        """Row of a Tier-1 lookup by its ID ("units", 3), or None. Read-only."""
+        return _LOOKUP_STORE.row(cls._lookup_key(lookup, profile), id_value)
+
+    @staticmethod
+    def lookup_id(lookup: str, display_name: Any) -> Optional[Any]:
+        """ID for a display name in a Tier-1 lookup ("locations", "Barn")."""
+        return _LOOKUP_STORE.id_for(lookup, display_name)
+
+    # ===== TIER 2: SHARED VIEW CACHES =====
+
+    def _get_shared_cache(self, key: str, loader: Callable) -> pd.DataFrame:
+        """Get a view cache from the process-wide store, loading if not present."""
         try:
-            result = loader()
-            st.session_state[key] = result
-            logger.info(f"Refreshed {key} ({len(result)} rows)")
-            return result
+            return _VIEW_STORE.get(key, loader)
         except Exception as e:
-            logger.error(f"Failed to refresh {key}: {e}")
-            st.session_state[key] = pd.DataFrame()
+            logger.error(f"Failed to load {key}: {e}")
             return pd.DataFrame()
 
+    def _refresh_shared_cache(self, key: str, loader: Callable) -> pd.DataFrame:
+        """Force refresh a view cache for every session."""
+        try:
+            result = _VIEW_STORE.refresh(key, loader)
+            logger.info(
+                f"Refreshed {key} ({len(result)} rows, v{_VIEW_STORE.version(key)})"
+            )
+            return result
+        except Exception as e:
+            # Keep serving the previous frame: every session reads this entry,
+            # so publishing an empty one would blank the view for all of them
+            logger.error(f"Failed to refresh {key}, keeping current data: {e}")
+            entry = _VIEW_STORE.entry(key)
+            return entry.df if entry is not None else pd.DataFrame()
+
+    def view(self, name: str, profile: str = "admin_full") -> pd.DataFrame:
+        """
+        Tier-2 view cache `name` with the columns of `profile`. Read-only.
+
+        A projection is its own shared cache, loaded with a narrow SELECT.
+        Writes and refresh_view_cache() invalidate it rather than patch it.
+        """
+        key, method_name = self._VIEW_MAP[name]
+        columns = self._profile_columns(name, profile)
+        if columns is None:
+            return self._get_shared_cache(key, getattr(self, method_name))
+        return self._get_shared_cache(
+            f"{key}:{profile}", partial(self._load_projection, name, profile)
+        )
+
+    def _load_projection(self, name: str, profile: str) -> pd.DataFrame:
+        model, key_column, sort_by, _ = self._VIEW_DELTAS[name]
+        required = [key_column, *(sort_by or [])]
+        columns = self._profile_columns(name, profile)
+        return self._get_table(
+            model,
+            f"{model.__tablename__} ({profile})",
+            sort_by=sort_by,
+            loader=LOADER_STREAM,
+            columns=[*columns, *(c for c in required if c not in columns)],
+        )
+
+    def _invalidate_projections(self, name: str) -> None:
+        """Drop the loaded column projections of view `name`."""
+        key, _ = self._VIEW_MAP[name]
+        for profile, sources in self._PROFILES.items():
+            if name in sources and _VIEW_STORE.entry(f"{key}:{profile}") is not None:
+                _VIEW_STORE.invalidate(f"{key}:{profile}")
+
     # -- View caches --
 
     @property
     def inventory_view_cache(self):
-        return self._get_session_cache("_inv_view", self.get_inventory_view_full)
+        return self._get_shared_cache("_inv_view", self.get_inventory_view_full)
 
     @property
     def planting_view_cache(self):
-        return self._get_session_cache("_plant_view", self.get_plantings_view_full)
+        return self._get_shared_cache("_plant_view", self.get_plantings_view_full)
 
     @property
     def order_view_cache(self):
-        return self._get_session_cache("_order_view", self.get_orders_view_full)
+        return self._get_shared_cache("_order_view", self.get_orders_view_full)
+
+    @property
+    def order_summary_view_cache(self):
+        return self._get_shared_cache(
+            "_order_summary_view", self.get_orders_summary_view
+        )
 
     @property
     def label_view_cache(self):
-        return self._get_session_cache("_label_view", self.get_label_view_full)
+        return self._get_shared_cache("_label_view", self.get_label_view_full)
 
     @property
     def pitch_view_cache(self):
-        return self._get_session_cache("_pitch_view", self.get_pitch_view)
+        return self._get_shared_cache("_pitch_view", self.get_pitch_view)
+
+    # -- Child datasets (one row per child, keyed to a parent view row) --
+
+    @property
+    def order_destination_view_cache(self):
+        return self._get_shared_cache(
+            "_order_dest_view", self.get_order_destinations_view
+        )
+
+    @property
+    def planting_destination_view_cache(self):
+        return self._get_shared_cache(
+            "_plant_dest_view", self.get_planting_destinations_view
+        )
+
+    @property
+    def item_price_view_cache(self):
+        return self._get_shared_cache("_price_view", self.get_item_prices_view)
 
     # -- Single-table caches (admin pages) --
 
     @property
     def inventory_cache(self):
-        return self._get_session_cache("_inv_table", self.get_inventory_full)
+        return self._get_shared_cache("_inv_table", self.get_inventory_full)
 
     @property
     def planting_cache(self):
-        return self._get_session_cache("_plant_table", self.get_planting_full)
+        return self._get_shared_cache("_plant_table", self.get_planting_full)
 
     @property
     def pitch_cache(self):
-        return self._get_session_cache("_pitch_table", self.get_pitch_full)
+        return self._get_shared_cache("_pitch_table", self.get_pitch_full)
 
     @property
     def order_cache(self):
-        return self._get_session_cache("_order_table", self.get_order_full)
+        return self._get_shared_cache("_order_table", self.get_order_full)
 
     @property
     def order_item_cache(self):
-        return self._get_session_cache("_order_item_table", self.get_order_item_full)
+        return self._get_shared_cache("_order_item_table", self.get_order_item_full)
 
     @property
     def price_cache(self):
-        return self._get_session_cache("_price_table", self.get_price_full)
+        return self._get_shared_cache("_price_table", self.get_price_full)
 
     @property
     def seasonal_notes_cache(self):
-        return self._get_session_cache(
+        return self._get_shared_cache(
             "_seasonal_notes_table", self.get_seasonal_notes_full
         )
 
     @property
     def order_item_destination_cache(self):
-        return self._get_session_cache(
+        return self._get_shared_cache(
             "_oid_table", self.get_order_item_destination_full
         )
 
     @property
     def user_cache(self):
-        return self._get_session_cache("_user_table", self.get_user_full)
+        return self._get_shared_cache("_user_table", self.get_user_full)
 
     # -- Cache management --
 
@@ -443,8 +854,12 @@ class EdgewaterAPI:
         "inventory": ("_inv_view", "get_inventory_view_full"),
         "plantings": ("_plant_view", "get_plantings_view_full"),
         "orders": ("_order_view", "get_orders_view_full"),
+        "orders_summary": ("_order_summary_view", "get_orders_summary_view"),
         "labels": ("_label_view", "get_label_view_full"),
         "pitch": ("_pitch_view", "get_pitch_view"),
+        "order_destinations": ("_order_dest_view", "get_order_destinations_view"),
+        "planting_destinations": ("_plant_dest_view", "get_planting_destinations_view"),
+        "item_prices": ("_price_view", "get_item_prices_view"),
         "inventory_table": ("_inv_table", "get_inventory_full"),
         "planting_table": ("_plant_table", "get_planting_full"),
         "pitch_table": ("_pitch_table", "get_pitch_full"),
@@ -456,29 +871,915 @@ class EdgewaterAPI:
         "user_table": ("_user_table", "get_user_full"),
     }
 
+    # Delta-refresh metadata per cache:
+    #   (model, entity key column, sort_by,
+    #    {source table: [cache columns holding that table's row IDs]})
+    # Sort specs mirror the get_*_full methods. A source table with no key
+    # column in the cache (e.g. T_ItemType in the orders view, which only
+    # carries the type name) maps to [] and forces a full reload.
+    _VIEW_DELTAS = {
+        "inventory": (
+            InventoryFullView,
+            "InventoryID",
+            ["DateCounted"],
+            {
+                "T_Inventory": ["InventoryID"],
+                "T_Items": ["ItemID"],
+                "T_ItemType": ["TypeID"],
+                "T_Units": ["UnitID"],
+                "T_UnitCategory": ["UnitCategoryID"],
+                "T_Locations": ["LocationID"],
+            },
+        ),
+        "plantings": (
+            PlantingsFullView,
+            "PlantingID",
+            ["DatePlanted", "PlantingID"],
+            {
+                "T_Plantings": ["PlantingID"],
+                "T_Items": ["ItemID"],
+                "T_ItemType": ["TypeID"],
+                "T_Units": ["UnitID"],
+                "T_UnitCategory": ["UnitCategoryID"],
+                "T_Locations": ["PlantingLocationID"],
+            },
+        ),
+        "orders": (
+            OrdersFullView,
+            "OrderItemID",
+            ["DatePlaced", "DateDue"],
+            {
+                "T_OrderItems": ["OrderItemID"],
+                "T_Orders": ["OrderID"],
+                "T_Items": ["ItemID"],
+                "T_ItemType": [],
+                "T_GrowingSeason": ["GrowingSeasonID"],
+                "T_OrderItemTypes": ["OrderItemTypeID"],
+                "T_OrderNotes": ["OrderNoteCode"],
+                "T_Brokers": ["BrokerID"],
+                "T_Shippers": ["ShipperID"],
+                "T_Suppliers": ["SupplierID"],
+            },
+        ),
+        # Line-item rollups aren't keyed by OrderItemID: item changes reload
+        # the (order-sized) summary instead of patching it
+        "orders_summary": (
+            OrdersSummaryView,
+            "OrderID",
+            ["DatePlaced"],
+            {
+                "T_Orders": ["OrderID"],
+                "T_OrderItems": [],
+                "T_Brokers": ["BrokerID"],
+                "T_Shippers": ["ShipperID"],
+                "T_Suppliers": ["SupplierID"],
+            },
+        ),
+        "labels": (
+            LabelDataFullView,
+            "ItemID",
+            None,
+            {
+                "T_Items": ["ItemID"],
+                "T_ItemType": ["TypeID"],
+            },
+        ),
+        "pitch": (
+            PitchFullView,
+            "PitchID",
+            None,
+            {
+                "T_Pitch": ["PitchID"],
+                "T_Items": ["ItemID"],
+                "T_ItemType": [],
+                "T_Units": ["UnitID"],
+                "T_UnitCategory": [],
+            },
+        ),
+        "order_destinations": (
+            OrderItemDestinationsView,
+            "OrderItemDestinationID",
+            None,
+            {
+                "T_OrderItemDestination": ["OrderItemDestinationID"],
+                "T_Units": ["DestinationUnitID"],
+                "T_Locations": ["LocationID"],
+            },
+        ),
+        "planting_destinations": (
+            PlantingDestinationsView,
+            "PlantingDestinationID",
+            None,
+            {
+                "T_PlantingDestinations": ["PlantingDestinationID"],
+                "T_Locations": ["DestinationLocationID"],
+            },
+        ),
+        "item_prices": (
+            ItemPricesView,
+            "PriceID",
+            None,
+            {
+                "T_Prices": ["PriceID"],
+                "T_Units": ["UnitID"],
+                "T_UnitCategory": ["UnitCategoryID"],
+            },
+        ),
+        "inventory_table": (
+            Inventory,
+            "InventoryID",
+            ["DateCounted"],
+            {"T_Inventory": ["InventoryID"]},
+        ),
+        "planting_table": (Planting, "PlantingID", None, {"T_Plantings": ["PlantingID"]}),
+        "pitch_table": (Pitch, "PitchID", None, {"T_Pitch": ["PitchID"]}),
+        "order_table": (Order, "OrderID", None, {"T_Orders": ["OrderID"]}),
+        "order_item_table": (
+            OrderItem,
+            "OrderItemID",
+            None,
+            {"T_OrderItems": ["OrderItemID"]},
+        ),
+        "price_table": (Price, "PriceID", None, {"T_Prices": ["PriceID"]}),
+        "seasonal_notes_table": (
+            SeasonalNotes,
+            "NoteID",
+            None,
+            {"T_SeasonalNotes": ["NoteID"]},
+        ),
+        "oid_table": (
+            OrderItemDestination,
+            "OrderItemDestinationID",
+            None,
+            {"T_OrderItemDestination": ["OrderItemDestinationID"]},
+        ),
+        "user_table": (Users, "UserID", None, {"T_Users": ["UserID"]}),
+    }
+
+    # Write-through metadata for views keyed by a base table's rows:
+    #   (base model,
+    #    {base column: view column} for renamed columns,
+    #    [(FK column, Tier-1 lookup name, {lookup col: view col})],
+    #    base columns whose change alters fanned-out joins -> refetch instead)
+    # Resolvers run in order against the patched row, so a later resolver can
+    # use a value an earlier one filled in (Item -> TypeID -> Type).
+    _VIEW_PATCHES = {
+        "inventory": (
+            Inventory,
+            {},
+            [
+                (
+                    "ItemID",
+                    "items",
+                    _same(
+                        "Item", "Variety", "Color", "Inactive", "ShouldStock",
+                        "LabelDescription", "Definition", "PictureLink",
+                        "PictureLayout", "SunConditions", "TypeID",
+                    ),
+                ),
+                ("TypeID", "item_types", _same("Type")),
+                (
+                    "UnitID",
+                    "units",
+                    _same("UnitType", "UnitSize", "UnitCategoryID"),
+                ),
+                (
+                    "UnitCategoryID",
+                    "unit_categories",
+                    _same("UnitCategory"),
+                ),
+                ("LocationID", "locations", _same("Location")),
+            ],
+            set(),
+        ),
+        "plantings": (
+            Planting,
+            {"LocationID": "PlantingLocationID"},
+            [
+                (
+                    "ItemID",
+                    "items",
+                    _same(
+                        "Item", "Variety", "Color", "Inactive", "ShouldStock",
+                        "SunConditions", "TypeID", "Definition", "LabelDescription",
+                    ),
+                ),
+                ("TypeID", "item_types", _same("Type")),
+                (
+                    "UnitID",
+                    "units",
+                    _same("UnitType", "UnitSize", "UnitCategoryID"),
+                ),
+                (
+                    "UnitCategoryID",
+                    "unit_categories",
+                    _same("UnitCategory"),
+                ),
+                (
+                    "PlantingLocationID",
+                    "locations",
+                    {"Location": "PlantingLocation"},
+                ),
+            ],
+            set(),
+        ),
+        "orders": (
+            OrderItem,
+            {"OrderNote": "OrderNoteCode", "OrderComments": "OrderItemComments"},
+            [
+                ("ItemID", "items", _same("Item", "Variety", "Color", "TypeID")),
+                ("TypeID", "item_types", {"Type": "ItemTypeName"}),
+                (
+                    "OrderItemTypeID",
+                    "order_item_types",
+                    _same("OrderItemType"),
+                ),
+                (
+                    "OrderNoteCode",
+                    "order_notes",
+                    {"OrderNoteID": "OrderNoteID", "OrderNote": "OrderNoteDecode"},
+                ),
+            ],
+            {"OrderID"},  # order header, supplier, broker, shipper columns
+        ),
+        "labels": (
+            Item,
+            {},
+            [("TypeID", "item_types", _same("Type"))],
+            set(),
+        ),
+        "pitch": (
+            Pitch,
+            {},
+            [
+                (
+                    "ItemID",
+                    "items",
+                    _same("Item", "Variety", "Color", "ShouldStock", "TypeID"),
+                ),
+                ("TypeID", "item_types", {"Type": "ItemTypeName"}),
+                ("UnitID", "units", _same("UnitType", "UnitSize", "UnitCategoryID")),
+                (
+                    "UnitCategoryID",
+                    "unit_categories",
+                    _same("UnitCategory"),
+                ),
+            ],
+            set(),
+        ),
+    }
+
+    # Filter pushdown (query_view / count_view / fetch_page): sidebar filters
+    # per view. Filter names are shared across pages, so one page state dict
+    # works for its view whether it filters in pandas or in SQL. The *_table
+    # entries back the admin pages' paged grids (paged_grid.py).
+    _VIEW_QUERIES = {
+        "inventory": ViewQuery(
+            InventoryFullView,
+            isin={"types": "Type", "locations": "Location"},
+            date_column="DateCounted",
+            search=ITEM_SEARCH,
+            statuses={
+                "Active": lambda c: c.Inactive == false(),
+                "Inactive": lambda c: c.Inactive == true(),
+                "Should Stock": lambda c: c.ShouldStock == true(),
+            },
+            order_by=("-DateCounted",),
+            sort_columns=("DateCounted",),
+        ),
+        "plantings": ViewQuery(
+            PlantingsFullView,
+            isin={"types": "Type", "locations": "PlantingLocation"},
+            date_column="DatePlanted",
+            search=ITEM_SEARCH,
+            order_by=("-DatePlanted",),
+            sort_columns=("DatePlanted",),
+        ),
+        "orders_summary": ViewQuery(
+            OrdersSummaryView,
+            isin={"suppliers": "Supplier", "seasons": "GrowingSeason"},
+            date_column="DatePlaced",
+            search=("Supplier", "OrderNumber", "OrderComments"),
+            statuses={
+                "Pending": lambda c: c.DateReceived.is_(None),
+                "Received": lambda c: c.DateReceived.isnot(None),
+                "Overdue": lambda c: and_(
+                    c.DateReceived.is_(None), c.DateDue < datetime.now()
+                ),
+            },
+            order_by=("-DatePlaced",),
+            sort_columns=("DatePlaced",),
+        ),
+        "pitch": ViewQuery(
+            PitchFullView,
+            isin={"reasons": "PitchReason"},
+            date_column="DatePitched",
+            search=ITEM_SEARCH,
+            order_by=("-DatePitched",),
+            sort_columns=("DatePitched",),
+        ),
+        # Order tracking's All Items tab: one row per order item
+        "orders": ViewQuery(
+            OrdersFullView,
+            isin={"orders": "OrderID"},
+            search=("Item", "Variety", "ItemCode"),
+            order_by=("-DatePlaced",),
+            sort_columns=("DatePlaced", "OrderID"),
+        ),
+        "item_table": ViewQuery(
+            Item,
+            isin={
+                "types": "TypeID",
+                "inactive": "Inactive",
+                "should_stock": "ShouldStock",
+            },
+            search=("Item", "Variety", "Color"),
+            sort_columns=("TypeID",),
+        ),
+        "inventory_table": ViewQuery(
+            Inventory,
+            isin={"items": "ItemID"},
+            date_column="DateCounted",
+            order_by=("-DateCounted",),
+            sort_columns=("DateCounted", "ItemID", "LocationID"),
+        ),
+        "planting_table": ViewQuery(
+            Planting,
+            isin={"items": "ItemID"},
+            date_column="DatePlanted",
+            order_by=("-DatePlanted",),
+            sort_columns=("DatePlanted", "ItemID", "LocationID"),
+        ),
+        "pitch_table": ViewQuery(
+            Pitch,
+            isin={"items": "ItemID"},
+            date_column="DatePitched",
+            order_by=("-DatePitched",),
+            sort_columns=("DatePitched", "ItemID"),
+        ),
+        "price_table": ViewQuery(
+            Price,
+            isin={"items": "ItemID", "years": "Year"},
+            at_least={"min_price": "UnitPrice"},
+            sort_columns=("ItemID",),
+        ),
+        "order_item_table": ViewQuery(
+            OrderItem,
+            isin={"orders": "OrderID", "items": "ItemID", "received": "Received"},
+            sort_columns=("OrderID", "ItemID"),
+        ),
+    }
+
     def refresh_view_cache(self, view_name: str) -> None:
         """Refresh a specific view or table cache. Call from page refresh buttons.
 
+        Caches with change-journal metadata (_VIEW_DELTAS) only refetch rows
+        touched since they were loaded; everything else reloads in full.
+
         Args:
-            view_name: One of 'inventory', 'plantings', 'orders', 'labels', 'pitch',
-                       'inventory_table', 'planting_table', 'pitch_table', 'order_table',
+            view_name: One of 'inventory', 'plantings', 'orders', 'orders_summary',
+                       'labels', 'pitch',
+                       'order_destinations', 'planting_destinations',
+                       'item_prices', 'inventory_table', 'planting_table', 'pitch_table', 'order_table',
                        'order_item_table', 'price_table', 'seasonal_notes_table',
                        'oid_table', 'user_table', 'all'
         """
+        # Metrics may cover rows written by another process: recompute them
+        _cached_aggregate_view.clear()
         if view_name == "all":
-            for key, method_name in self._VIEW_MAP.values():
-                self._refresh_session_cache(key, getattr(self, method_name))
+            for name in self._VIEW_MAP:
+                self._refresh_view(name)
         elif view_name in self._VIEW_MAP:
-            key, method_name = self._VIEW_MAP[view_name]
-            self._refresh_session_cache(key, getattr(self, method_name))
+            self._refresh_view(view_name)
         else:
             logger.warning(f"Unknown view cache: {view_name}")
 
+    def _refresh_view(self, view_name: str) -> None:
+        """Delta-refresh a cache from the change journal, or reload it in full."""
+        key, method_name = self._VIEW_MAP[view_name]
+        self._invalidate_projections(view_name)
+        loader = getattr(self, method_name)
+        entry = _VIEW_STORE.entry(key)
+        if entry is None or entry.watermark is None or view_name not in self._VIEW_DELTAS:
+            self._refresh_shared_cache(key, loader)
+            return
+        try:
+            _VIEW_STORE.update(
+                key, lambda current: self._apply_journal(view_name, current, loader)
+            )
+        except Exception as e:
+            logger.error(f"Delta refresh of {key} failed, reloading: {e}")
+            self._refresh_shared_cache(key, loader)
+
+    @track_operation
+    def _apply_journal(
+        self, view_name: str, entry: ViewEntry, loader: Callable
+    ) -> Tuple[pd.DataFrame, int, Optional[Set[Any]]]:
+        """
+        Merge rows changed since entry.watermark into a copy of entry.df.
+
+        1. Read the journal entries past watermark - JOURNAL_REPLAY_WINDOW
+           and skip those already applied (by ChangeID). Writers in other
+           processes can commit out of ChangeID order, so an entry may appear
+           below a watermark that was taken after a higher ID committed.
+        2. Map the new entries' distinct (table, row ID) to affected entity
+           keys and refetch just those rows (_refetch_affected).
+
+        Falls back to a full load when the journal was pruned past the
+        watermark, a changed table has no key column in the view, or the
+        delta exceeds DELTA_REFRESH_MAX_ROWS.
+        """
+        key, _ = self._VIEW_MAP[view_name]
+        _, _, _, sources = self._VIEW_DELTAS[view_name]
+        limit = config.DELTA_REFRESH_MAX_ROWS
+        window = config.JOURNAL_REPLAY_WINDOW
+        journal = ChangeJournal.__table__
+        df = entry.df
+        recorded_mark, applied = _JOURNAL_APPLIED.get(key, (None, frozenset()))
+        if recorded_mark != entry.watermark:
+            applied = frozenset()  # e.g. after a full load: replay the window
+
+        with get_db_session() as session:
+            head = session.execute(select(func.max(journal.c.ChangeID))).scalar() or 0
+            head = max(head, entry.watermark)
+
+            oldest = session.execute(select(func.min(journal.c.ChangeID))).scalar()
+            if oldest is not None and oldest > entry.watermark + 1:
+                logger.info(f"Change journal pruned past {view_name}; full reload")
+                return loader(), head, None
+
+            entries = session.execute(
+                select(journal.c.ChangeID, journal.c.TableName, journal.c.RowID)
+                .where(
+                    journal.c.ChangeID > entry.watermark - window,
+                    journal.c.ChangeID <= head,
+                    journal.c.TableName.in_(list(sources)),
+                )
+                .limit(limit + len(applied) + 1)
+            ).all()
+            if len(entries) > limit + len(applied):
+                logger.info(f"{len(entries)}+ changes for {view_name}; full reload")
+                return loader(), head, None
+            _JOURNAL_APPLIED[key] = (
+                head,
+                frozenset(c for c, _, _ in entries if c > head - window),
+            )
+
+            changes = {(t, r) for c, t, r in entries if c not in applied}
+            if not changes:
+                return df, head, set()
+            if len(changes) > limit:
+                logger.info(f"{len(changes)} changes for {view_name}; full reload")
+                return loader(), head, None
+
+            changed: DefaultDict[str, Set[int]] = defaultdict(set)
+            for table_name, row_id in changes:
+                changed[table_name].add(row_id)
+
+            refetched = self._refetch_affected(session, view_name, df, changed)
+            if refetched is None:
+                return loader(), head, None
+            keys, fresh = refetched
+
+        logger.info(
+            f"Delta-refreshed {view_name}: {len(changes)} journal rows, "
+            f"{len(keys)} rows refetched"
+        )
+        return self._merge_rows(view_name, df, keys, fresh), head, keys
+
+    def _refetch_affected(
+        self,
+        session,
+        view_name: str,
+        df: pd.DataFrame,
+        changed: Dict[str, Set[int]],
+    ) -> Optional[Tuple[Set[Any], pd.DataFrame]]:
+        """
+        Find and reload the cache rows affected by changed source-table rows.
+
+        Affected entity keys come from the cached frame (rows that changed or
+        were deleted) and from the view (rows that appeared). Returns
+        (keys, fresh rows), or None when the change cannot be applied
+        incrementally (unmapped source table, too many rows).
+        """
+        model_class, key_col, _, sources = self._VIEW_DELTAS[view_name]
+        table = model_class.__table__
+        if any(not sources.get(t) for t in changed):
+            logger.info(f"Unmapped source change for {view_name}; full reload")
+            return None
+
+        keys: Set[Any] = set()
+        conditions = []
+        for table_name, ids in changed.items():
+            for column in sources[table_name]:
+                if column in df.columns:
+                    keys.update(df.loc[df[column].isin(ids), key_col].tolist())
+                conditions.append(table.c[column].in_(list(ids)))
+        keys.update(
+            session.execute(
+                select(table.c[key_col]).where(or_(*conditions)).distinct()
+            ).scalars()
+        )
+        if len(keys) > config.DELTA_REFRESH_MAX_ROWS:
+            logger.info(f"{len(keys)} rows affected in {view_name}; full reload")
+            return None
+
+        fresh = (
+            _select_to_dataframe(
+                session, model_class, where=table.c[key_col].in_(list(keys))
+            )
+            if keys
+            else pd.DataFrame()
+        )
+        if config.COMPACT_DTYPES:
+            apply_dtypes(fresh, model_class)
+        return keys, fresh
+
+    def _merge_rows(
+        self,
+        view_name: str,
+        df: pd.DataFrame,
+        keys: Set[Any],
+        fresh: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """Return a new frame with rows for `keys` replaced by `fresh`."""
+        model_class, key_col, sort_by, _ = self._VIEW_DELTAS[view_name]
+        if not keys and fresh.empty:
+            return df
+        merged = df[~df[key_col].isin(keys)] if key_col in df.columns else df
+        if not fresh.empty:
+            # Nothing left to align with: take the fresh rows' own dtypes
+            if merged.empty:
+                merged = fresh.reindex(columns=df.columns)
+            else:
+                fresh = _align_dtypes(fresh, df)
+                # Dtypes already match; pandas still warns about all-NA
+                # extension columns (e.g. string[pyarrow]) in the fresh rows
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", FutureWarning)
+                    merged = pd.concat([merged, fresh], ignore_index=True)
+            if config.COMPACT_DTYPES:
+                # Categories with different value sets concatenate to object
+                apply_dtypes(merged, model_class)
+        if sort_by:
+            merged = merged.sort_values(by=sort_by, ascending=False)
+        elif key_col in merged.columns:
+            merged = merged.sort_values(by=key_col)
+        return merged
+
+    # ===== WRITE-THROUGH PATCHING =====
+
+    def _write_through(
+        self,
+        model_class,
+        rows: List[Dict[str, Any]],
+        operation: str,
+        changed_columns: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        Patch cached data after a committed write to `model_class`.
+
+        Tier-1 lookups for the table are invalidated (they are small and
+        reload on next read). Loaded Tier-2 caches that depend on
+        the table get a patched copy published as a new version, so pages
+        don't need refresh_data() after saving. Anything that can't be patched
+        (and every column projection of a lookup or view) is invalidated and
+        reloads on next read; the change journal keeps
+        later delta refreshes correct either way.
+
+        Args:
+            rows: Full base-table rows after the write (before it, for deletes)
+            operation: "I", "U" or "D", as in T_ChangeJournal
+            changed_columns: Columns an update touched (None = unknown)
+        """
+        if not rows:
+            return
+        table_name = model_class.__tablename__
+        lookup = _LOOKUP_BY_TABLE.get(table_name)
+        if lookup is not None:
+            _LOOKUP_STORE.invalidate(lookup)
+        for derived in _DERIVED_CACHES_BY_TABLE.get(table_name, []):
+            derived.clear()
+        _cached_aggregate_view.clear()
+
+        for view_name, (_, _, _, sources) in self._VIEW_DELTAS.items():
+            if table_name not in sources:
+                continue
+            self._invalidate_projections(view_name)
+            cache_key, _ = self._VIEW_MAP[view_name]
+            if _VIEW_STORE.entry(cache_key) is None:
+                continue
+            try:
+                _VIEW_STORE.update(
+                    cache_key,
+                    lambda entry: self._patch_view(
+                        view_name, entry, model_class, rows, operation, changed_columns
+                    ),
+                )
+            except (_PatchNotApplicable, KeyError) as e:
+                logger.info(f"Invalidating {cache_key} after write: {e}")
+                _VIEW_STORE.invalidate(cache_key)
+            except Exception as e:
+                logger.warning(f"Write-through to {cache_key} failed: {e}")
+                _VIEW_STORE.invalidate(cache_key)
+
+    @track_operation
+    def _patch_view(
+        self,
+        view_name: str,
+        entry: ViewEntry,
+        model_class,
+        rows: List[Dict[str, Any]],
+        operation: str,
+        changed_columns: Optional[Set[str]],
+    ) -> Tuple[pd.DataFrame, Optional[int], Optional[Set[Any]]]:
+        """Build the patched copy of one cache for _write_through."""
+        view_model, key_col, _, sources = self._VIEW_DELTAS[view_name]
+        table_name = model_class.__tablename__
+        df = entry.df
+        if not sources[table_name]:
+            raise _PatchNotApplicable(f"{table_name} has no key column in {view_name}")
+
+        pk = model_class.__table__.primary_key.columns.keys()[0]
+        row_ids = {row[pk] for row in rows}
+
+        if view_model is model_class:
+            # Single-table cache: inserts carry full rows; updates may only
+            # carry the changed columns, so they overlay the cached rows.
+            if operation == "I":
+                fresh = pd.DataFrame(rows).reindex(columns=df.columns)
+                return self._merge_rows(view_name, df, row_ids, fresh), entry.watermark, row_ids
+            base_model, renames, resolvers, refetch_on = model_class, {}, [], set()
+        else:
+            base_model, renames, resolvers, refetch_on = self._VIEW_PATCHES.get(
+                view_name, (None, {}, [], set())
+            )
+        keys: Set[Any] = set()
+        patched: List[pd.DataFrame] = []
+        refetch_ids = row_ids
+        if base_model is model_class:
+            if operation == "D":
+                return self._merge_rows(view_name, df, row_ids, pd.DataFrame()), entry.watermark, row_ids
+
+            refetch_ids = set()
+            for row in rows:
+                row_id = row[pk]
+                cached = df[df[key_col] == row_id]
+                touched = changed_columns if changed_columns is not None else set(row)
+                if operation == "U" and not cached.empty and not (touched & refetch_on):
+                    patched.append(self._resolve_row(cached, row, renames, resolvers))
+                    keys.add(row_id)
+                else:
+                    refetch_ids.add(row_id)
+
+        # Inserts and joined-table writes: refetch just the affected rows
+        if refetch_ids:
+            with get_db_session() as session:
+                refetched = self._refetch_affected(
+                    session, view_name, df, {table_name: refetch_ids}
+                )
+            if refetched is None:
+                raise _PatchNotApplicable(f"{table_name} change too wide for {view_name}")
+            refetched_keys, fresh = refetched
+            keys |= refetched_keys
+            if not fresh.empty:
+                patched.append(fresh)
+
+        fresh = pd.concat(patched, ignore_index=True) if patched else pd.DataFrame()
+        return self._merge_rows(view_name, df, keys, fresh), entry.watermark, keys
+
+    def _resolve_row(
+        self,
+        cached: pd.DataFrame,
+        row: Dict[str, Any],
+        renames: Dict[str, str],
+        resolvers: List[Tuple[str, str, Dict[str, str]]],
+    ) -> pd.DataFrame:
+        """
+        Apply a base-table row to its cached view rows, re-resolving joined
+        display columns (item names, unit sizes, ...) from Tier-1 lookups.
+        """
+        values = {renames.get(column, column): value for column, value in row.items()}
+        for fk_column, lookup, mapping in resolvers:
+            if fk_column not in values:
+                continue  # partial row: this FK wasn't written
+            match = _LOOKUP_STORE.row(lookup, values.get(fk_column))
+            for source, target in mapping.items():
+                values[target] = (
+                    match[source]
+                    if match is not None and source in match.index
+                    else None
+                )
+
+        patched = cached.copy()
+        for column, value in values.items():
+            if column in patched.columns:
+                patched[column] = [value] * len(patched)
+        return patched
+
+    @track_operation
+    def prune_change_journal(self, older_than_days: int = 7) -> int:
+        """
+        Delete change-journal entries older than `older_than_days`.
+
+        The database also prunes nightly (evt_prune_change_journal). Caches
+        whose watermark predates the pruned range reload in full.
+        """
+        journal = ChangeJournal.__table__
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+        try:
+            with get_db_session() as session:
+                result = session.execute(
+                    journal.delete().where(journal.c.ChangedAt < cutoff)
+                )
+                logger.info(f"Pruned {result.rowcount} change-journal entries")
+                return result.rowcount
+        except SQLAlchemyError as e:
+            logger.error(f"Error pruning change journal: {e}")
+            raise
+
+    def view_changes_since(self, view_name: str, version: int) -> Optional[Set[Any]]:
+        """
+        Entity keys (e.g. PlantingIDs) changed in a Tier-2 cache since `version`.
+
+        Pages use this to patch derived structures for just those keys.
+        Returns None when they must be rebuilt (full reload in between).
+        """
+        if view_name not in self._VIEW_MAP:
+            logger.warning(f"Unknown view cache: {view_name}")
+            return None
+        key, _ = self._VIEW_MAP[view_name]
+        return _VIEW_STORE.changes_since(key, version)
+
+    def view_version(self, view_name: str) -> int:
+        """
+        Current version of a Tier-2 cache (same names as refresh_view_cache).
+
+        Pages key derived structures (summaries, per-ID indexes) on this so
+        they rebuild when any session refreshes the shared view.
+        """
+        if view_name not in self._VIEW_MAP:
+            logger.warning(f"Unknown view cache: {view_name}")
+            return 0
+        key, _ = self._VIEW_MAP[view_name]
+        return _VIEW_STORE.version(key)
+
+    # Child datasets kept out of the views so each view has one row per
+    # entity: cache name -> (model, parent key column)
+    _CHILD_PARENTS = {
+        "order_destinations": (OrderItemDestinationsView, "OrderItemID"),
+        "planting_destinations": (PlantingDestinationsView, "PlantingID"),
+        "item_prices": (ItemPricesView, "ItemID"),
+        "seasonal_notes_table": (SeasonalNotes, "ItemID"),
+    }
+
+    def get_children(self, view_name: str, parent_ids: Any) -> pd.DataFrame:
+        """
+        Rows of a child dataset for one parent ID or a list of them.
+
+        e.g. get_children("order_destinations", order_item_id) or
+        get_children("item_prices", item_ids). Lookups go through a
+        {parent ID: row positions} index built once per cache version.
+        """
+        if view_name not in self._CHILD_PARENTS:
+            logger.warning(f"Unknown child dataset: {view_name}")
+            return pd.DataFrame()
+        df, index = self._child_index(view_name)
+        ids = parent_ids if pd.api.types.is_list_like(parent_ids) else [parent_ids]
+        positions = [index[i] for i in ids if i in index]
+        if not positions:
+            return self._empty_children(view_name)
+        return df.iloc[np.sort(np.concatenate(positions))]
+
+    def _empty_children(self, view_name: str) -> pd.DataFrame:
+        """No rows, but the child model's columns (and dtypes) like a real result."""
+        model_class, _ = self._CHILD_PARENTS[view_name]
+        df = pd.DataFrame(columns=[c.key for c in model_class.__table__.columns])
+        if config.COMPACT_DTYPES:
+            apply_dtypes(df, model_class)
+        return df
+
+    def _child_index(
+        self, view_name: str
+    ) -> Tuple[pd.DataFrame, Dict[Any, np.ndarray]]:
+        key, method_name = self._VIEW_MAP[view_name]
+        self._get_shared_cache(key, getattr(self, method_name))
+        entry = _VIEW_STORE.entry(key)
+        if entry is None:
+            return self._empty_children(view_name), {}
+        cached = _CHILD_INDEXES.get(key)
+        if cached is None or cached[0] is not entry.df:
+            _, parent_col = self._CHILD_PARENTS[view_name]
+            index = (
+                entry.df.groupby(parent_col, sort=False).indices
+                if parent_col in entry.df.columns
+                else {}
+            )
+            cached = (entry.df, index)
+            _CHILD_INDEXES[key] = cached
+        return cached
+
+    def derived(
+        self,
+        name: str,
+        builder: Callable[[], Any],
+        depends_on: List[str],
+        patch: Optional[Callable[[Any, Set[Any]], Any]] = None,
+    ) -> Any:
+        """
+        Process-wide memo of a structure built from cached data.
+
+        `builder()` runs only when a cache in `depends_on` has a new version
+        since the stored value was built, so label maps, decode dicts and
+        per-ID indexes are built once per data change rather than once per
+        session rerun. Values are shared by every session: read-only.
+
+        Args:
+            name: Unique key, e.g. "order_tracking.unit_labels"
+            depends_on: Tier-2 cache names (as in refresh_view_cache) and/or
+                        Tier-1 lookup names ("units", "locations", ...; see
+                        _LOOKUPS), or a projection's _lookup_key()
+            patch: Optional (value, changed keys) -> new value, used instead
+                   of a rebuild when only one Tier-2 cache changed and the
+                   store knows which entity keys did (view_changes_since).
+                   Must return a new object, not modify `value`.
+        """
+        versions = tuple(self._derived_version(dep) for dep in depends_on)
+        memo = _DERIVED.get(name)
+        if memo is not None and memo[0] == versions:
+            return memo[1]
+
+        value = None
+        if memo is not None and patch is not None:
+            stale = [
+                (dep, before)
+                for dep, before, now in zip(depends_on, memo[0], versions)
+                if before != now
+            ]
+            if len(stale) == 1 and stale[0][0] in self._VIEW_MAP:
+                changed = self.view_changes_since(*stale[0])
+                if changed is not None:
+                    value = patch(memo[1], changed)
+        if value is None:
+            value = builder()
+        _DERIVED[name] = (versions, value)
+        return value
+
+    def _derived_version(self, cache_name: str) -> int:
+        """Load `cache_name` if needed and return its current version."""
+        if cache_name in _LOOKUP_STORE:
+            # Reloads (bumping the version) if invalidated or past its TTL
+            return _LOOKUP_STORE.entry(cache_name).version
+        if cache_name in self._VIEW_MAP:
+            key, method_name = self._VIEW_MAP[cache_name]
+            self._get_shared_cache(key, getattr(self, method_name))
+            return _VIEW_STORE.version(key)
+        raise KeyError(f"Unknown cache for derived(): {cache_name}")
+
+    def cache_memory_report(self) -> pd.DataFrame:
+        """
+        Memory of each loaded Tier-1/Tier-2 cache, as loaded and compacted.
+
+        Sizes come from the table's latest full load (rest.dtypes.compact);
+        caches that haven't loaded in this process are not listed.
+        """
+        loads = {load["table"]: load for load in memory_report()}
+        caches = [
+            ("Tier 1", stats["lookup"], _LOOKUPS[stats["lookup"]][0].__tablename__)
+            for stats in _LOOKUP_STORE.stats()
+            if stats["lookup"] in _LOOKUPS  # projections aren't full loads
+        ]
+        loaded_keys = {stats["key"] for stats in _VIEW_STORE.stats()}
+        caches += [
+            ("Tier 2", key, self._VIEW_DELTAS[view_name][0].__tablename__)
+            for view_name, (key, _) in self._VIEW_MAP.items()
+            if key in loaded_keys
+        ]
+        report = pd.DataFrame(
+            [
+                {
+                    "Tier": tier,
+                    "Cache": cache,
+                    "Table": table_name,
+                    "Rows": loads[table_name]["rows"],
+                    "Loaded (MB)": loads[table_name]["before_bytes"] / 1024 / 1024,
+                    "Compact (MB)": loads[table_name]["after_bytes"] / 1024 / 1024,
+                    "Loaded at": loads[table_name]["loaded_at"],
+                }
+                for tier, cache, table_name in caches
+                if table_name in loads
+            ]
+        )
+        if report.empty:
+            return report
+        report["Saved (%)"] = (1 - report["Compact (MB)"] / report["Loaded (MB)"]) * 100
+        return report.round(2)
+
     @staticmethod
     def clear_lookup_caches():
-        """Force clear all @st.cache_data lookup caches."""
-        for loader in _CACHED_LOADERS:
-            loader.clear()
+        """Force reload of all Tier-1 lookups and cached item searches."""
+        _LOOKUP_STORE.invalidate()
+        _cached_search_items.clear()
         logger.info("All lookup caches cleared")
 
     # ===== TIER 2.5: FILTERED WORKING SETS =====
@@ -521,23 +1822,54 @@ class EdgewaterAPI:
     # Generic CRUD
     # ================================================================
 
-    def _get_all(self, model_class, filters: Optional[Dict] = None) -> pd.DataFrame:
-        """Generic method to get all records from a table."""
+    @track_operation
+    def _get_all(
+        self,
+        model_class,
+        filters: Optional[Dict] = None,
+        loader: str = LOADER_COLUMNAR,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Generic method to get all records from a table.
+
+        Args:
+            loader: LOADER_COLUMNAR (default), LOADER_STREAM for large views,
+                    or LOADER_ORM for the legacy instance-per-row path.
+            columns: Load only these columns (columnar loaders)
+        """
         try:
             with get_db_session() as session:
-                query = session.query(model_class)
-                if filters:
-                    for column, value in filters.items():
-                        query = query.filter(getattr(model_class, column) == value)
-                results = query.all()
+                if loader == LOADER_ORM:
+                    query = session.query(model_class)
+                    if filters:
+                        for column, value in filters.items():
+                            query = query.filter(getattr(model_class, column) == value)
+                    df = _rows_to_dataframe(query.all())
+                else:
+                    df = _select_to_dataframe(
+                        session,
+                        model_class,
+                        filters=filters,
+                        stream=loader == LOADER_STREAM,
+                        columns=columns,
+                    )
+                if config.COMPACT_DTYPES:
+                    # memory_report() tracks full loads only
+                    df = (
+                        apply_dtypes(df, model_class)
+                        if columns
+                        else compact(df, model_class)
+                    )
                 logger.info(
-                    f"Retrieved {len(results)} records from {model_class.__tablename__}"
+                    f"Retrieved {len(df)} records from {model_class.__tablename__}"
                 )
-                return _rows_to_dataframe(results)
+                return df
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving records: {e}")
             raise
 
+    @track_operation
     def _get_by_id(
         self, model_class, id_column: str, id_value: Any
     ) -> Optional[Dict[str, Any]]:
@@ -561,86 +1893,224 @@ class EdgewaterAPI:
             raise
 
     def _create(self, model_class, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generic method to create a new record with proper type conversion."""
-        try:
-            from sqlalchemy import Text, String, Integer, Float, Boolean, DateTime
-
-            with get_db_session() as session:
-                new_record = model_class()
-
-                _TYPE_COERCIONS = {
-                    (Text, String): str,
-                    (Integer,): int,
-                    (Float,): float,
-                    (Boolean,): bool,
-                }
+        """
+        Generic method to create a new record with proper type conversion.
 
-                for key, value in data.items():
-                    if not hasattr(new_record, key):
-                        continue
-                    if value is None:
-                        setattr(new_record, key, None)
-                        continue
+        Coerces through the model's cached write plan and inserts with a Core
+        INSERT: no ORM unit of work and no refresh round trip afterwards.
+        """
+        return self._create_many(model_class, [data])[0]
 
-                    column = getattr(model_class, key)
-                    column_type = column.property.columns[0].type
+    @track_operation
+    def _create_many(
+        self, model_class, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Insert many records in one transaction, with _create's type coercion.
 
-                    coerced = False
-                    for type_group, coerce_fn in _TYPE_COERCIONS.items():
-                        if isinstance(column_type, type_group):
-                            setattr(new_record, key, coerce_fn(value))
-                            coerced = True
-                            break
-                    if not coerced:
-                        # DateTime and anything else — pass through
-                        setattr(new_record, key, value)
+        Rows go out as one executemany, which PyMySQL rewrites into a
+        multi-row INSERT. AUTO_INCREMENT tables insert row by row (still one
+        transaction), since MySQL only reports the first generated ID of a
+        multi-row insert.
+        """
+        plan = _write_plan(model_class)
+        records = plan.records(rows)
+        generate_ids = plan.auto_increment and any(
+            record[plan.pk] is None for record in records
+        )
 
-                session.add(new_record)
+        try:
+            with get_db_session() as session:
+                if generate_ids:
+                    for record in records:
+                        values = {k: v for k, v in record.items() if v is not None}
+                        result = session.execute(insert(plan.table).values(values))
+                        record[plan.pk] = result.inserted_primary_key[0]
+                elif len(records) == 1:
+                    session.execute(insert(plan.table).values(records[0]))
+                else:
+                    session.execute(insert(plan.table), records)
                 session.commit()
-                session.refresh(new_record)
-
-                result_dict = _row_to_dict(new_record)
-                logger.info(f"Created new record in {model_class.__tablename__}")
-                return result_dict
-
+                logger.info(
+                    f"Created {len(records)} record(s) in {model_class.__tablename__}"
+                )
         except SQLAlchemyError as e:
             logger.error(f"Error creating record: {e}")
             raise
 
+        self._write_through(model_class, records, "I")
+        return records
+
+    @track_operation
     def _update(
-        self, model_class, id_column: str, id_value: Any, updates: Dict[str, Any]
+        self,
+        model_class,
+        id_column: str,
+        id_value: Any,
+        updates: Dict[str, Any],
+        read_back: bool = True,
+        expected: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Generic method to update a record."""
+        """
+        Generic method to update a record with one UPDATE ... WHERE pk = :id.
+
+        There is no pre-read: "not found" comes from the matched-row count
+        (the MySQL dialect connects with CLIENT_FOUND_ROWS, so unchanged
+        rows still count as matched).
+
+        Args:
+            read_back: Re-select the changed columns after the UPDATE to return
+                       stored values (DB-side conversions). False returns the
+                       values as sent, saving a round trip.
+            expected: Optional optimistic-concurrency guard, {column: value}
+                      added to the WHERE clause (e.g. a version or UpdatedAt
+                      column, or the original values of the edited fields)
+
+        Returns:
+            {id_column: id_value, **changed columns}, or None if not found
+
+        Raises:
+            ConcurrentUpdateError: The row exists but no longer matches `expected`
+        """
+        table = model_class.__table__
+        id_col = table.c[id_column]
+        unknown = [c for c in updates if c not in table.c]
+        if unknown:
+            logger.warning(f"Columns {unknown} do not exist on {model_class.__name__}")
+        values = {c: v for c, v in updates.items() if c in table.c}
+        if not values:
+            return self._get_by_id(model_class, id_column, id_value)
+
+        stmt = update(table).where(id_col == id_value)
+        for column, value in (expected or {}).items():
+            value = _db_value(value)
+            stmt = stmt.where(
+                table.c[column].is_(None) if value is None else table.c[column] == value
+            )
+
         try:
             with get_db_session() as session:
-                record = (
-                    session.query(model_class)
-                    .filter(getattr(model_class, id_column) == id_value)
-                    .first()
-                )
-                if not record:
+                matched = session.execute(stmt.values(values)).rowcount
+                if not matched:
+                    if expected and session.execute(
+                        select(id_col).where(id_col == id_value)
+                    ).first():
+                        raise ConcurrentUpdateError(
+                            f"{model_class.__tablename__} {id_column}={id_value} "
+                            f"changed since it was read"
+                        )
                     logger.warning(f"Record with {id_column}={id_value} not found")
                     return None
 
-                for column, value in updates.items():
-                    if hasattr(record, column):
-                        setattr(record, column, value)
-                    else:
+                result_dict = {id_column: id_value, **values}
+                if read_back:
+                    stored = session.execute(
+                        select(*(table.c[c] for c in values)).where(id_col == id_value)
+                    ).one()
+                    result_dict.update(stored._mapping)
+                session.commit()
+                logger.info(
+                    f"Updated record {id_column}={id_value} in {model_class.__tablename__}"
+                )
+
+        except SQLAlchemyError as e:
+            logger.error(f"Error updating record: {e}")
+            raise
+
+        self._write_through(model_class, [result_dict], "U", changed_columns=set(values))
+        return result_dict
+
+    @track_operation
+    def _update_many(
+        self, model_class, id_column: str, updates_by_id: Dict[Any, Dict[str, Any]]
+    ) -> BatchUpdateResults:
+        """
+        Update many records in one transaction.
+
+        Rows changing the same set of columns share one
+        UPDATE ... SET col = CASE id WHEN ... END WHERE id IN (...) per
+        BULK_WRITE_CHUNK_SIZE rows, instead of a SELECT + UPDATE + commit each.
+        Rows that don't exist map to None, with the reason in `.errors`.
+        """
+        table = model_class.__table__
+        id_col = table.c[id_column]
+        results = BatchUpdateResults({i: None for i in updates_by_id})
+        if not updates_by_id:
+            return results
+
+        try:
+            with get_db_session() as session:
+                existing = set(
+                    session.execute(
+                        select(id_col).where(id_col.in_(list(updates_by_id)))
+                    ).scalars()
+                )
+                missing = [i for i in updates_by_id if i not in existing]
+                if missing:
+                    logger.warning(f"Records with {id_column} in {missing} not found")
+                for id_value in missing:
+                    results.fail(id_value, f"{id_column} {id_value} not found")
+
+                groups: Dict[Tuple[str, ...], List[Any]] = defaultdict(list)
+                for id_value, changes in updates_by_id.items():
+                    if id_value not in existing:
+                        continue
+                    unknown = [c for c in changes if c not in table.c]
+                    if unknown:
                         logger.warning(
-                            f"Column '{column}' does not exist on {model_class.__name__}"
+                            f"Columns {unknown} do not exist on {model_class.__name__}"
+                        )
+                    columns = tuple(sorted(c for c in changes if c in table.c))
+                    groups[columns].append(id_value)
+
+                chunk = config.BULK_WRITE_CHUNK_SIZE
+                for columns, ids in groups.items():
+                    if not columns:
+                        continue
+                    for start in range(0, len(ids), chunk):
+                        batch = ids[start : start + chunk]
+                        session.execute(
+                            update(table)
+                            .where(id_col.in_(batch))
+                            .values(
+                                {
+                                    column: case(
+                                        {i: updates_by_id[i][column] for i in batch},
+                                        value=id_col,
+                                        else_=table.c[column],
+                                    )
+                                    for column in columns
+                                }
+                            )
                         )
 
                 session.commit()
-                result_dict = _row_to_dict(record)
+                rows = session.execute(
+                    select(model_class).where(
+                        getattr(model_class, id_column).in_(list(existing))
+                    )
+                ).scalars()
+                for record in rows:
+                    results[getattr(record, id_column)] = _row_to_dict(record)
                 logger.info(
-                    f"Updated record {id_column}={id_value} in {model_class.__tablename__}"
+                    f"Updated {len(existing)} records in {model_class.__tablename__} "
+                    f"({len(groups)} column set(s))"
                 )
-                return result_dict
 
         except SQLAlchemyError as e:
-            logger.error(f"Error updating record: {e}")
+            logger.error(f"Error updating records: {e}")
             raise
 
+        changed_columns = {c for changes in updates_by_id.values() for c in changes}
+        self._write_through(
+            model_class,
+            [row for row in results.values() if row is not None],
+            "U",
+            changed_columns=changed_columns,
+        )
+        return results
+
+    @track_operation
     def _delete(self, model_class, id_column: str, id_value: Any) -> bool:
         """Generic method to delete a record."""
         try:
@@ -654,35 +2124,43 @@ class EdgewaterAPI:
                     logger.warning(f"Record with {id_column}={id_value} not found")
                     return False
 
+                deleted_row = _row_to_dict(record)
                 session.delete(record)
                 session.commit()
                 logger.info(
                     f"Deleted record {id_column}={id_value} from {model_class.__tablename__}"
                 )
-                return True
 
         except SQLAlchemyError as e:
             logger.error(f"Error deleting record: {e}")
             raise
 
+        self._write_through(model_class, [deleted_row], "D")
+        return True
+
     # ================================================================
     # Table getters (GET)
     # ================================================================
     # These all follow the same pattern, consolidated via _get_table.
 
+    @track_operation
     def _get_table(
         self,
         model_class,
         label: str,
         sort_by: Optional[List[str]] = None,
         ascending: bool = False,
+        loader: str = LOADER_COLUMNAR,
+        columns: Optional[Sequence[str]] = None,
     ) -> pd.DataFrame:
         """
         Generic single-table getter. Replaces all the individual get_*_full methods
         that had identical structure.
         """
         try:
-            result = self._get_all(model_class=model_class)
+            result = self._get_all(
+                model_class=model_class, loader=loader, columns=columns
+            )
             if sort_by and not result.empty:
                 result = result.sort_values(by=sort_by, ascending=ascending)
             return result
@@ -755,37 +2233,58 @@ class EdgewaterAPI:
     # ================================================================
 
     def get_inventory_view_full(self) -> pd.DataFrame:
-        from models import InventoryFullView
-
         return self._get_table(
-            InventoryFullView, "Inventory View", sort_by=["DateCounted"]
+            InventoryFullView,
+            "Inventory View",
+            sort_by=["DateCounted"],
+            loader=LOADER_STREAM,
         )
 
     def get_plantings_view_full(self) -> pd.DataFrame:
-        from models import PlantingsFullView
-
         return self._get_table(
             PlantingsFullView,
             "Plantings View",
             sort_by=["DatePlanted", "PlantingID"],
+            loader=LOADER_STREAM,
         )
 
     def get_orders_view_full(self) -> pd.DataFrame:
-        from models import OrdersFullView
+        return self._get_table(
+            OrdersFullView,
+            "Orders View",
+            sort_by=["DatePlaced", "DateDue"],
+            loader=LOADER_STREAM,
+        )
 
+    def get_orders_summary_view(self) -> pd.DataFrame:
         return self._get_table(
-            OrdersFullView, "Orders View", sort_by=["DatePlaced", "DateDue"]
+            OrdersSummaryView, "Orders Summary View", sort_by=["DatePlaced"]
         )
 
     def get_label_view_full(self) -> pd.DataFrame:
-        from models import LabelDataFullView
-
-        return self._get_table(LabelDataFullView, "Label Data View")
+        return self._get_table(
+            LabelDataFullView, "Label Data View", loader=LOADER_STREAM
+        )
 
     def get_pitch_view(self) -> pd.DataFrame:
-        from models import PitchFullView
+        return self._get_table(PitchFullView, "Pitch View", loader=LOADER_STREAM)
 
-        return self._get_table(PitchFullView, "Pitch View")
+    def get_order_destinations_view(self) -> pd.DataFrame:
+        return self._get_table(
+            OrderItemDestinationsView, "Order Destinations View", loader=LOADER_STREAM
+        )
+
+    def get_planting_destinations_view(self) -> pd.DataFrame:
+        return self._get_table(
+            PlantingDestinationsView,
+            "Planting Destinations View",
+            loader=LOADER_STREAM,
+        )
+
+    def get_item_prices_view(self) -> pd.DataFrame:
+        return self._get_table(
+            ItemPricesView, "Item Prices View", loader=LOADER_STREAM
+        )
 
     # ================================================================
     # Misc toolbox
@@ -794,14 +2293,217 @@ class EdgewaterAPI:
     def decode_type(self, type_name: str) -> int:
         """
         Retrieve the numerical TypeID for a given type name.
-        Queries the item_type_cache instead of relying on a hardcoded mapping.
+        Uses the item-types lookup's name index instead of a hardcoded mapping.
         Falls back to 0 if the type name is not found.
         """
-        cache = self.item_type_cache
-        if cache.empty:
+        type_id = _LOOKUP_STORE.id_for("item_types", type_name)
+        return int(type_id) if type_id is not None else 0
+
+    def search_items(
+        self,
+        query: str,
+        type: Optional[Any] = None,
+        active_only: bool = True,
+        limit: Optional[int] = 50,
+    ) -> pd.DataFrame:
+        """
+        Ranked items matching every word of `query` (see rest/search.py).
+
+        Runs against the FULLTEXT index on T_Items.SearchText, not the
+        cached frames. Pages filter their caches by the returned ItemIDs.
+
+        Args:
+            type: Type name or TypeID to restrict to (None = all types)
+            active_only: Skip items flagged Inactive
+            limit: Maximum rows returned (None = all matches)
+        """
+        return _cached_search_items(query.strip(), type, active_only, limit)
+
+    @track_operation
+    def query_view(
+        self,
+        view: str,
+        order_by: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        **filters: Any,
+    ) -> pd.DataFrame:
+        """
+        One page of a tracker view, filtered, ordered and limited in SQL.
+
+        Only the requested rows are transferred, unlike the cached views
+        that pages filter in pandas (see rest/view_query.py).
+
+        Args:
+            view: Name in _VIEW_QUERIES ("inventory", "plantings",
+                  "orders_summary", "pitch", ...)
+            order_by: Column names, "-Column" for descending (None = the
+                      view's default); the primary key breaks ties
+            limit / offset: Page size and start row
+            **filters: search, status, date_from, date_to and the view's
+                       list filters (types, locations, suppliers, seasons)
+
+        Example:
+            api.query_view("plantings", types=["Annual"],
+                           date_from=date(2024, 1, 1), limit=25)
+        """
+        spec = self._VIEW_QUERIES[view]
+        try:
+            with get_db_session() as session:
+                dialect = session.get_bind().dialect.name
+                stmt = ordered_statement(
+                    spec,
+                    filtered_statement(spec, dialect=dialect, **filters),
+                    order_by,
+                    limit,
+                    offset,
+                )
+                result = session.execute(stmt)
+                df = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+            if config.COMPACT_DTYPES:
+                apply_dtypes(df, spec.model)
+            return df
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error querying {view}: {e}")
+            return pd.DataFrame(columns=[c.key for c in spec.model.__table__.columns])
+
+    @track_operation
+    def count_view(
+        self, view: str, distinct: Optional[str] = None, **filters: Any
+    ) -> int:
+        """
+        Rows of `view` matching `filters` (as in query_view), counted in SQL.
+
+        Args:
+            distinct: Count distinct non-null values of this column instead
+        """
+        spec = self._VIEW_QUERIES[view]
+        try:
+            with get_db_session() as session:
+                dialect = session.get_bind().dialect.name
+                stmt = filtered_statement(spec, dialect=dialect, **filters)
+                return (
+                    session.execute(count_statement(stmt, distinct)).scalar() or 0
+                )
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error counting {view}: {e}")
             return 0
-        match = cache.loc[cache["Type"] == type_name, "TypeID"]
-        return int(match.iloc[0]) if not match.empty else 0
+
+    def aggregate_view(
+        self, view: str, metrics: Dict[str, Metric], **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        Sidebar / tile metrics over the filtered rows of a view, in SQL.
+
+        The view itself isn't loaded; results are cached per (view, metrics,
+        filters) and cleared by writes and refresh_view_cache().
+
+        Args:
+            view: Name in _VIEW_QUERIES
+            metrics: {name: "rows" | (function, column)}, functions as in
+                     rest.view_query.AGGREGATES (count, sum, nunique, min,
+                     max, null, true, false)
+            **filters: As in query_view (search, status, date_from, ...)
+
+        Example:
+            api.aggregate_view(
+                "orders_summary",
+                {"orders": "rows", "cost": ("sum", "TotalCost")},
+                suppliers=["Ball Seed"],
+            )
+        """
+        # Hashable cache key: list filters as tuples, None/empty dropped
+        signature = tuple(
+            sorted(
+                (
+                    name,
+                    tuple(sorted(value, key=str))
+                    if isinstance(value, (list, set, tuple))
+                    else value,
+                )
+                for name, value in filters.items()
+                if value is not None and value != [] and value != ""
+            )
+        )
+        try:
+            return _cached_aggregate_view(view, tuple(metrics.items()), signature)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error aggregating {view}: {e}")
+            return {name: None for name in metrics}
+
+    @track_operation
+    def fetch_page(
+        self,
+        view: str,
+        sort: Optional[str] = None,
+        descending: bool = True,
+        after: Optional[PageKey] = None,
+        before: Optional[PageKey] = None,
+        page_size: Optional[int] = None,
+        **filters: Any,
+    ) -> Page:
+        """
+        One keyset page of a filtered view, for the paged grids.
+
+        Args:
+            view: Name in _VIEW_QUERIES
+            sort: Primary key (default) or one of the view's sort_columns
+            after: Page.last_key of the current page -> the next page
+            before: Page.first_key of the current page -> the previous page
+            page_size: Rows per page (default GRID_PAGE_SIZE)
+            **filters: As in query_view
+
+        Example:
+            page = api.fetch_page("pitch_table", sort="DatePitched")
+            page = api.fetch_page("pitch_table", sort="DatePitched",
+                                  after=page.last_key)
+        """
+        spec = self._VIEW_QUERIES[view]
+        table = spec.model.__table__
+        sort = sort or list(table.primary_key.columns)[0].name
+        page_size = page_size or config.GRID_PAGE_SIZE
+        try:
+            with get_db_session() as session:
+                dialect = session.get_bind().dialect.name
+                stmt = keyset_statement(
+                    spec,
+                    filtered_statement(spec, dialect=dialect, **filters),
+                    sort,
+                    descending,
+                    after=after,
+                    before=before,
+                    limit=page_size + 1,
+                )
+                result = session.execute(stmt)
+                page = to_page(
+                    result.fetchall(),
+                    list(result.keys()),
+                    spec,
+                    sort,
+                    page_size,
+                    after=after,
+                    before=before,
+                )
+            if config.COMPACT_DTYPES:
+                apply_dtypes(page.df, spec.model)
+            return page
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error paging {view}: {e}")
+            return Page(
+                df=pd.DataFrame(columns=[c.key for c in table.columns]),
+                first_key=None,
+                last_key=None,
+                has_prev=False,
+                has_next=False,
+            )
 
     def get_sun_conditions(self) -> List:
         """Get list of sun conditions for dropdowns."""
@@ -815,14 +2517,10 @@ class EdgewaterAPI:
         """
         Get next available ID for a table.
 
-        NOTE: This is not concurrency-safe. If your database supports
-        auto-increment / IDENTITY columns, prefer letting the DB assign IDs
-        and remove this method. For single-user Streamlit apps this is fine.
+        IDs are reserved from T_IdSequences under a row lock, so concurrent
+        sessions never receive the same value and no table scan is needed.
         """
-        df = self._get_all(model_class=model_class)
-        if df.empty:
-            return 1
-        return int(df[id_column].max()) + 1
+        return _ID_ALLOCATOR.allocate(model_class, id_column)[0]
 
     def df_get_by_id(
         self, cache_data: pd.DataFrame, id_column: str, id: int
@@ -833,46 +2531,158 @@ class EdgewaterAPI:
     # Display methods (workflow layer)
     # ================================================================
 
+    # Column profiles: profile -> {source: columns its pages render}. A
+    # source is a Tier-1 lookup ("items") or a Tier-2 view ("plantings");
+    # lookup() / view() with a profile SELECT only these columns (plus the
+    # ID / sort columns) into their own shared cache. Sources a profile
+    # doesn't list, and everything under admin_full, load every column.
+    _PROFILES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+        "admin_full": {},
+        # Phone pages: item pickers and today's logs, no long text columns
+        "employee_lookup": {
+            "items": (
+                "ItemID",
+                "Item",
+                "Variety",
+                "Color",
+                "Inactive",
+                "ShouldStock",
+                "SunConditions",
+            ),
+            "plantings": (
+                "PlantingID",
+                "DatePlanted",
+                "ItemID",
+                "Item",
+                "Variety",
+                "NumberOfUnits",
+                "UnitType",
+                "PlantingLocation",
+                "PlantingComments",
+            ),
+        },
+        "label_print": {
+            "labels": (
+                "ItemID",
+                "Item",
+                "Variety",
+                "Color",
+                "Type",
+                "Inactive",
+                "SunConditions",
+                "LabelDescription",
+                "Definition",
+                "PictureLink",
+                "PictureLayout",
+            ),
+        },
+        # get_*_display() below
+        "display": {
+            "inventory": (
+                "NumberOfUnits",
+                "DateCounted",
+                "Item",
+                "Variety",
+                "Color",
+                "Type",
+                "SunConditions",
+                "UnitSize",
+                "UnitType",
+                "Inactive",
+                "ShouldStock",
+                "LabelDescription",
+                "InventoryComments",
+            ),
+            "plantings": (
+                "PlantingID",
+                "NumberOfUnits",
+                "Item",
+                "Variety",
+                "Color",
+                "DatePlanted",
+                "PlantingComments",
+                "ItemID",
+                "UnitType",
+                "UnitSize",
+                "UnitCategory",
+            ),
+            "orders": (
+                "Supplier",
+                "Broker",
+                "Shipper",
+                "DatePlaced",
+                "DateDue",
+                "DateReceived",
+                "Received",
+                "ToOrder",
+                "ItemCode",
+                "ItemID",
+                "Unit",
+                "NumberOfUnits",
+                "UnitPrice",
+                "OrderNoteCode",
+                "OrderNoteDecode",
+                "OrderItemComments",
+                "OrderComments",
+                "Leftover",
+                "OrderItemID",
+                "OrderID",
+                "GrowingSeason",
+                "OrderItemType",
+                "OrderNumber",
+                "TrackingNumber",
+                "TotalCost",
+                "BrokerComments",
+                "ShipperComments",
+                "SupplierComments",
+            ),
+        },
+    }
+
+    @classmethod
+    def _profile_columns(cls, source: str, profile: str) -> Optional[Tuple[str, ...]]:
+        """Columns `profile` loads for `source`, or None for all of them."""
+        if profile not in cls._PROFILES:
+            raise ValueError(f"Unknown column profile: {profile}")
+        return cls._PROFILES[profile].get(source)
+
+    @classmethod
+    def _lookup_key(cls, name: str, profile: str) -> str:
+        """Lookup-store name for `name` under `profile` (registered on first use)."""
+        columns = cls._profile_columns(name, profile)
+        if columns is None:
+            return name
+        key = f"{name}:{profile}"
+        if key not in _LOOKUP_STORE:
+            model, label, id_column, name_column = _LOOKUPS[name]
+            required = [c for c in (id_column, name_column) if c and c not in columns]
+            _LOOKUP_STORE.register(
+                key,
+                partial(
+                    _load_table,
+                    model,
+                    f"{label} ({profile})",
+                    columns=[*columns, *required],
+                ),
+                id_column,
+                name_column,
+            )
+        return key
+
+    def _display(self, name: str) -> pd.DataFrame:
+        """The "display" projection of view `name`, in its declared column order."""
+        return self.view(name, "display")[list(self._PROFILES["display"][name])]
+
     def get_inventory_view_display(self) -> pd.DataFrame:
         try:
-            return self.inventory_view_cache[
-                [
-                    "NumberOfUnits",
-                    "DateCounted",
-                    "Item",
-                    "Variety",
-                    "Color",
-                    "Type",
-                    "SunConditions",
-                    "UnitSize",
-                    "UnitType",
-                    "Inactive",
-                    "ShouldStock",
-                    "LabelDescription",
-                    "InventoryComments",
-                ]
-            ]
+            return self._display("inventory")
         except Exception as e:
             logger.error(f"Error Inventory Display Subset: {e}")
             return pd.DataFrame()
 
     def get_plantings_display(self) -> pd.DataFrame:
         try:
-            return self.planting_view_cache[
-                [
-                    "PlantingID",
-                    "NumberOfUnits",
-                    "Item",
-                    "Variety",
-                    "Color",
-                    "DatePlanted",
-                    "PlantingComments",
-                    "ItemID",
-                    "UnitType",
-                    "UnitSize",
-                    "UnitCategory",
-                ]
-            ]
+            return self._display("plantings")
         except Exception as e:
             logger.error(f"Error retrieving plantings subset: {e}")
             return pd.DataFrame()
@@ -881,9 +2691,14 @@ class EdgewaterAPI:
         self, item_id: Optional[int] = None
     ) -> Tuple[pd.DataFrame, pd.Series]:
         try:
-            label_data_full = self.label_view_cache
+            label_data_full = self.view("labels", "label_print")
             if item_id:
                 label_data_full = label_data_full[label_data_full["ItemID"] == item_id]
+            # One row per price, as before prices moved out of the view
+            prices = self.get_children("item_prices", label_data_full["ItemID"])
+            label_data_full = label_data_full.merge(
+                prices[["ItemID", "UnitPrice"]], on="ItemID", how="left"
+            )
             label_data = label_data_full[
                 [
                     "Item",
@@ -902,71 +2717,30 @@ class EdgewaterAPI:
 
     def get_orders_display(self) -> pd.DataFrame:
         try:
-            return self.order_view_cache[
-                [
-                    "Supplier",
-                    "Broker",
-                    "Shipper",
-                    "DatePlaced",
-                    "DateDue",
-                    "DateReceived",
-                    "Received",
-                    "ToOrder",
-                    "ItemCode",
-                    "ItemID",
-                    "Unit",
-                    "NumberOfUnits",
-                    "UnitPrice",
-                    "OrderNoteCode",
-                    "OrderNoteDecode",
-                    "OrderItemComments",
-                    "OrderComments",
-                    "Leftover",
-                    "OrderItemID",
-                    "OrderID",
-                    "GrowingSeason",
-                    "OrderItemType",
-                    "OrderNumber",
-                    "TrackingNumber",
-                    "TotalCost",
-                    "BrokerComments",
-                    "ShipperComments",
-                    "SupplierComments",
-                ]
-            ]
+            return self._display("orders")
         except Exception as e:
             logger.error(f"Error getting Order data subset: {e}")
             return pd.DataFrame()
 
     def get_orders_summary(self) -> pd.DataFrame:
+        """
+        One row per order, from v_orders_summary (no item view load).
+
+        Received is True when every line item has been received
+        (ReceivedCount == ItemCount > 0). The old grouped frame took the
+        first line item's flag instead. Order status (received / overdue /
+        pending) is not stored here; it depends on the current time, so
+        callers derive it from DateReceived and DateDue when they read.
+        """
         try:
-            full_orders = self.order_view_cache
-            summary = (
-                full_orders.groupby("OrderID")
-                .agg(
-                    {
-                        "Supplier": "first",
-                        "Broker": "first",
-                        "Shipper": "first",
-                        "DatePlaced": "first",
-                        "DateDue": "first",
-                        "DateReceived": "first",
-                        "Received": "first",
-                        "OrderNumber": "first",
-                        "TrackingNumber": "first",
-                        "TotalCost": "first",
-                        "GrowingSeason": "first",
-                        "OrderItemID": "count",
-                        "OrderComments": "first",
-                        "BrokerComments": "first",
-                        "ShipperComments": "first",
-                        "SupplierComments": "first",
-                    }
-                )
-                .reset_index()
+            summary = self.order_summary_view_cache
+            if summary.empty:
+                return summary
+            return summary.assign(
+                Received=summary["ReceivedCount"].eq(summary["ItemCount"])
+                & summary["ItemCount"].gt(0),
+                UniqueItems=summary["ItemCount"],
             )
-            summary = summary.rename(columns={"OrderItemID": "UniqueItems"})
-            return summary.sort_values(by="DatePlaced", ascending=False)
         except Exception as e:
             logger.error(f"Error getting orders summary: {e}")
             return pd.DataFrame()
@@ -986,17 +2760,83 @@ class EdgewaterAPI:
     ) -> Dict[str, Any]:
         """
         Shared create-record implementation.
-        Generates the next ID, creates the record, logs it, and returns it.
+        Assigns the ID (unless the table is AUTO_INCREMENT), creates the
+        record, logs it, and returns it.
         """
+        auto_increment = _ID_ALLOCATOR.uses_auto_increment(model_class)
         try:
-            payload[id_column] = self._get_next_id(model_class, id_column)
-            result = self._create(model_class=model_class, data=payload)
+            if auto_increment:
+                payload.pop(id_column, None)
+            else:
+                payload[id_column] = self._get_next_id(model_class, id_column)
+            try:
+                result = self._create(model_class=model_class, data=payload)
+            except IntegrityError as e:
+                # Rows inserted outside the API can leave the counter behind
+                # MAX(id); move it forward and retry once with a fresh ID.
+                if auto_increment or "Duplicate entry" not in str(e.orig):
+                    raise
+                logger.warning(f"{label} ID {payload[id_column]} taken, resyncing")
+                _ID_ALLOCATOR.resync(model_class, id_column)
+                payload[id_column] = self._get_next_id(model_class, id_column)
+                result = self._create(model_class=model_class, data=payload)
             logger.info(f"Added {label} record {result[id_column]}")
             return result
         except Exception as e:
             logger.error(f"Error adding {label}: {e}")
             raise
 
+    def table_add_many(
+        self,
+        model_class,
+        rows: List[Dict[str, Any]],
+        label: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Bulk counterpart of _table_add: create many records in one transaction.
+
+        IDs for the whole batch are reserved from T_IdSequences in a single
+        block (AUTO_INCREMENT tables let the database assign them), so a
+        50-line order costs one counter update plus one INSERT.
+
+        Returns:
+            Created record dicts, in the order of `rows`
+        """
+        if not rows:
+            return []
+        label = label or model_class.__tablename__
+        plan = _write_plan(model_class)
+        id_column = plan.pk
+        auto_increment = _ID_ALLOCATOR.uses_auto_increment(model_class)
+        rows = [dict(row) for row in rows]
+
+        def assign_ids():
+            ids = _ID_ALLOCATOR.allocate(model_class, id_column, count=len(rows))
+            for row, new_id in zip(rows, ids):
+                row[id_column] = new_id
+
+        try:
+            if auto_increment:
+                for row in rows:
+                    row.pop(id_column, None)
+            else:
+                assign_ids()
+            try:
+                created = self._create_many(model_class, rows)
+            except IntegrityError as e:
+                # Same recovery as _table_add: counter behind MAX(id)
+                if auto_increment or "Duplicate entry" not in str(e.orig):
+                    raise
+                logger.warning(f"{label} IDs already taken, resyncing")
+                _ID_ALLOCATOR.resync(model_class, id_column)
+                assign_ids()
+                created = self._create_many(model_class, rows)
+            logger.info(f"Added {len(created)} {label} records")
+            return created
+        except Exception as e:
+            logger.error(f"Error adding {label} records: {e}")
+            raise
+
     def table_add_inventory(
         self,
         ItemID: int,
@@ -1359,10 +3199,95 @@ class EdgewaterAPI:
             "order item destination",
         )
 
+    # Bulk variants: one transaction per call, same defaults as the
+    # single-record methods above.
+
+    def table_add_order_items(
+        self, items: List[OrderItemPayload]
+    ) -> List[Dict[str, Any]]:
+        """Add many order item records (e.g. every line of a new order)."""
+        rows = [{"Received": False, **item} for item in items]
+        return self.table_add_many(OrderItem, rows, "order item")
+
+    def table_add_order_item_destinations(
+        self, destinations: List[OrderItemDestinationPayload]
+    ) -> List[Dict[str, Any]]:
+        """Add many order item destination records (receiving allocations)."""
+        return self.table_add_many(
+            OrderItemDestination, list(destinations), "order item destination"
+        )
+
+    def table_add_plantings(
+        self, plantings: List[PlantingPayload]
+    ) -> List[Dict[str, Any]]:
+        """Add many planting records."""
+        now = datetime.now()
+        rows = [{**p, "DatePlanted": p.get("DatePlanted") or now} for p in plantings]
+        return self.table_add_many(Planting, rows, "planting")
+
+    def table_add_inventory_counts(
+        self, counts: List[InventoryPayload]
+    ) -> List[Dict[str, Any]]:
+        """Add many inventory records."""
+        now = datetime.now()
+        rows = [{**c, "DateCounted": c.get("DateCounted") or now} for c in counts]
+        return self.table_add_many(Inventory, rows, "inventory")
+
+    def table_add_pitches(self, pitches: List[PitchPayload]) -> List[Dict[str, Any]]:
+        """Add many pitch records."""
+        now = datetime.now()
+        rows = [{**p, "DatePitched": p.get("DatePitched") or now} for p in pitches]
+        return self.table_add_many(Pitch, rows, "pitch")
+
     # ================================================================
     # UPDATE
     # ================================================================
 
+    @staticmethod
+    def _prepare_updates(
+        updates: Dict[str, Any],
+        allowed_fields: Optional[Set[str]] = None,
+        preprocessors: Optional[Dict[str, Callable]] = None,
+        strict: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Filter updates to allowed fields, then apply preprocessors.
+
+        Raises:
+            ValueError: Disallowed field with strict=True, or a value a
+                        preprocessor rejected
+        """
+        filtered_updates = {}
+        rejected_fields = []
+
+        for column, value in updates.items():
+            if allowed_fields is not None and column not in allowed_fields:
+                rejected_fields.append(column)
+                if strict:
+                    raise ValueError(
+                        f"Cannot update field '{column}' — it's read-only or from a joined table"
+                    )
+                continue
+            filtered_updates[column] = value
+
+        if rejected_fields:
+            logger.warning(f"Filtered out read-only fields: {rejected_fields}")
+
+        processed_updates = {}
+        for column, value in filtered_updates.items():
+            if preprocessors and column in preprocessors:
+                try:
+                    processed_updates[column] = preprocessors[column](value)
+                    logger.debug(
+                        f"Preprocessed {column}: {value} -> {processed_updates[column]}"
+                    )
+                except Exception as e:
+                    logger.error(f"Error preprocessing {column}: {e}")
+                    raise ValueError(f"Invalid value for {column}: {value}")
+            else:
+                processed_updates[column] = value
+        return {column: _db_value(v) for column, v in processed_updates.items()}
+
     def generic_update(
         self,
         model_class,
@@ -1372,6 +3297,8 @@ class EdgewaterAPI:
         allowed_fields: Optional[Set[str]] = None,
         preprocessors: Optional[Dict[str, Callable]] = None,
         strict: bool = False,
+        read_back: bool = True,
+        expected: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Generic update with field filtering and preprocessing.
@@ -1387,62 +3314,94 @@ class EdgewaterAPI:
             allowed_fields: Set of column names that can be updated (None = allow all)
             preprocessors: Dict mapping column names to preprocessing functions
             strict: If True, raise error on disallowed fields. If False, just filter them out.
+            read_back: Re-select the changed columns after writing (see _update)
+            expected: Optional {column: value} concurrency guard (see _update)
 
         Returns:
-            Updated record dict or None if not found
+            A partial record, {id_column: id_value, **changed columns}; other
+            columns are not included. The full record when nothing was left
+            to update, or None if not found / failed
+
+        Raises:
+            ConcurrentUpdateError: `expected` no longer matches the stored row
         """
         try:
-            existing = self._get_by_id(model_class, id_column, id_value)
-            if not existing:
-                logger.warning(f"Record not found: {id_column}={id_value}")
-                return None
-
-            # Filter to allowed fields
-            filtered_updates = {}
-            rejected_fields = []
-
-            for column, value in updates.items():
-                if allowed_fields is not None and column not in allowed_fields:
-                    rejected_fields.append(column)
-                    if strict:
-                        raise ValueError(
-                            f"Cannot update field '{column}' — it's read-only or from a joined table"
-                        )
-                    continue
-                filtered_updates[column] = value
-
-            if rejected_fields:
-                logger.warning(f"Filtered out read-only fields: {rejected_fields}")
-
-            if not filtered_updates:
+            processed_updates = self._prepare_updates(
+                updates, allowed_fields, preprocessors, strict
+            )
+            if not processed_updates:
                 logger.warning("No valid fields to update after filtering")
-                return existing
-
-            # Apply preprocessors
-            processed_updates = {}
-            for column, value in filtered_updates.items():
-                if preprocessors and column in preprocessors:
-                    try:
-                        processed_updates[column] = preprocessors[column](value)
-                        logger.debug(
-                            f"Preprocessed {column}: {value} -> {processed_updates[column]}"
-                        )
-                    except Exception as e:
-                        logger.error(f"Error preprocessing {column}: {e}")
-                        raise ValueError(f"Invalid value for {column}: {value}")
-                else:
-                    processed_updates[column] = value
+                return self._get_by_id(model_class, id_column, id_value)
 
             return self._update(
                 model_class=model_class,
                 id_column=id_column,
                 id_value=id_value,
                 updates=processed_updates,
+                read_back=read_back,
+                expected=expected,
             )
 
+        except ConcurrentUpdateError:
+            raise
         except Exception as e:
             logger.error(
                 f"generic_update failed for {id_column}={id_value}: {e} | "
                 f"updates={updates}, allowed_fields={allowed_fields}"
             )
             return None
+
+    def generic_update_many(
+        self,
+        model_class,
+        id_column: str,
+        updates_by_id: Dict[Any, Dict[str, Any]],
+        allowed_fields: Optional[Set[str]] = None,
+        preprocessors: Optional[Dict[str, Callable]] = None,
+        strict: bool = False,
+    ) -> BatchUpdateResults:
+        """
+        Batched generic_update: apply {id: changes} in one transaction.
+
+        Same allowed_fields / preprocessors / strict semantics as
+        generic_update, applied per row. Use this for Save buttons that loop
+        over edited rows.
+
+        Returns:
+            {id: updated record dict, or None if not found / invalid}, with
+            `.errors` giving the reason for each None (validation message,
+            "not found", or the database error). Rows with nothing left to
+            update after filtering are returned unchanged. If the batch
+            itself fails, every row maps to None with the batch's error.
+        """
+        results = BatchUpdateResults()
+        prepared: Dict[Any, Dict[str, Any]] = {}
+        for id_value, updates in updates_by_id.items():
+            try:
+                prepared[id_value] = self._prepare_updates(
+                    updates, allowed_fields, preprocessors, strict
+                )
+            except ValueError as e:
+                logger.error(f"generic_update_many skipped {id_column}={id_value}: {e}")
+                results.fail(id_value, str(e))
+
+        unchanged = [i for i, changes in prepared.items() if not changes]
+        for id_value in unchanged:
+            del prepared[id_value]
+            results[id_value] = self._get_by_id(model_class, id_column, id_value)
+            if results[id_value] is None:
+                results.fail(id_value, f"{id_column} {id_value} not found")
+
+        try:
+            updated = self._update_many(model_class, id_column, prepared)
+            results.update(updated)
+            results.errors.update(updated.errors)
+        except Exception as e:
+            logger.error(
+                f"generic_update_many failed for {len(prepared)} "
+                f"{model_class.__tablename__} rows: {e}"
+            )
+            reason = _error_text(e)
+            for id_value in prepared:
+                results.fail(id_value, reason)
+        return results
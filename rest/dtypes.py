@@ -0,0 +1,166 @@
+"""
+Compact dtypes for cached DataFrames
+
+Loaded frames come back with object dtype for every text column and
+float64 for any integer column containing NULLs. dtype_map() derives a
+per-model schema from models.py instead:
+
+- ID columns (primary keys, *ID integers) -> nullable Int32
+- Boolean columns                         -> nullable boolean
+- Repeated lookup text in views (Supplier, UnitSize, Location, ...)
+                                          -> category
+- Other text                              -> Arrow-backed strings
+  (plain "string" when pyarrow isn't installed)
+
+Categories are only used in the joined views, where a supplier or
+location name repeats on thousands of rows. In the single-table caches
+those names are unique per row and the frames feed st.data_editor, which
+can't add a value that isn't already a category.
+
+Missing values become pd.NA: compare with pd.isna(), not `x != y`.
+
+compact() applies the map at load time and records the memory before and
+after per table, for the admin landing page's cache memory report.
+"""
+
+import functools
+import importlib.util
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import Boolean, Integer, String, Text
+
+ID = "Int32"
+BOOLEAN = "boolean"
+CATEGORY = "category"
+TEXT = (
+    "string[pyarrow]" if importlib.util.find_spec("pyarrow") is not None else "string"
+)
+
+# Lookup-derived text that repeats across the rows of a view
+CATEGORY_COLUMNS = frozenset(
+    {
+        "Broker",
+        "Color",
+        "DestinationLocation",
+        "DestinationUnitSize",
+        "DestinationUnitType",
+        "GrowingSeason",
+        "ItemTypeName",
+        "Location",
+        "LocationName",
+        "OrderItemType",
+        "OrderNoteDecode",
+        "PitchReason",
+        "PlantingLocation",
+        "Shipper",
+        "Supplier",
+        "SupplierType",
+        "SunConditions",
+        "Type",
+        "UnitCategory",
+        "UnitSize",
+        "UnitType",
+    }
+)
+
+# Per-table exceptions: {table: {column: dtype, or None to keep as loaded}}
+DTYPE_OVERRIDES: Dict[str, Dict[str, Optional[str]]] = {
+    # Order-header and party details repeat on every line item of an order
+    "v_orders_full": {
+        column: CATEGORY
+        for column in (
+            "OrderNumber",
+            "TrackingNumber",
+            "OrderComments",
+            "BrokerComments",
+            "ShipperAccountNumber",
+            "ShipperContactPerson",
+            "ShipperAddress1",
+            "ShipperAddress2",
+            "ShipperCity",
+            "ShipperState",
+            "ShipperZip",
+            "ShipperPhone",
+            "ShipperComments",
+            "SupplierAccountNumber",
+            "SupplierPhone",
+            "SupplierFax",
+            "WebSite",
+            "Email",
+            "SupplierContactPerson",
+            "SupplierAddress1",
+            "SupplierAddress2",
+            "SupplierCity",
+            "SupplierState",
+            "SupplierZip",
+            "SupplierComments",
+        )
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def dtype_map(model_class) -> Dict[str, str]:
+    """Target dtype per column of `model_class` (columns not listed are left alone)."""
+    table = model_class.__table__
+    is_view = table.name.startswith("v_")
+    dtypes = {}
+    for column in table.columns:
+        if isinstance(column.type, Boolean):
+            dtypes[column.key] = BOOLEAN
+        elif isinstance(column.type, Integer):
+            if column.primary_key or column.key.endswith("ID"):
+                dtypes[column.key] = ID
+        elif isinstance(column.type, (String, Text)):
+            dtypes[column.key] = (
+                CATEGORY if is_view and column.key in CATEGORY_COLUMNS else TEXT
+            )
+    for column, dtype in DTYPE_OVERRIDES.get(table.name, {}).items():
+        if dtype is None:
+            dtypes.pop(column, None)
+        else:
+            dtypes[column] = dtype
+    return dtypes
+
+
+def apply_dtypes(df: pd.DataFrame, model_class) -> pd.DataFrame:
+    """Cast the columns of `df` that aren't in their dtype_map dtype yet (in place)."""
+    for column, dtype in dtype_map(model_class).items():
+        if column not in df.columns or str(df[column].dtype) == dtype:
+            continue
+        try:
+            df[column] = df[column].astype(dtype)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Keeping {column} as {df[column].dtype}: {e}")
+    return df
+
+
+_memory: Dict[str, Dict] = {}
+_memory_lock = threading.Lock()
+
+
+def compact(df: pd.DataFrame, model_class) -> pd.DataFrame:
+    """apply_dtypes() for a full load, recording the memory saved."""
+    if df.empty:
+        return df
+    before = df.memory_usage(deep=True).sum()
+    apply_dtypes(df, model_class)
+    after = df.memory_usage(deep=True).sum()
+    with _memory_lock:
+        _memory[model_class.__tablename__] = {
+            "rows": len(df),
+            "before_bytes": int(before),
+            "after_bytes": int(after),
+            "loaded_at": datetime.now(),
+        }
+    return df
+
+
+def memory_report() -> List[Dict]:
+    """Latest full load per table: rows and memory before/after compaction."""
+    with _memory_lock:
+        return [dict(table=table, **stats) for table, stats in sorted(_memory.items())]
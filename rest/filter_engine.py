@@ -0,0 +1,226 @@
+"""
+Filter engine for the cached views
+
+The tracker pages used to filter their view from scratch on every rerun:
+isin() per categorical filter, lower().contains() over several string
+columns, and date comparisons over the whole frame. A FilterEngine is built
+once per view version (see EdgewaterAPI.derived) and answers the same
+filters from precomputed structures:
+
+- categorical columns: factorized codes plus one boolean mask per value,
+  so an "is one of" filter is an OR of ready-made masks
+- date columns: row positions sorted by date, so a range is two binary
+  searches and a slice (NaT rows are kept aside as the "missing" mask)
+- text: the search columns lower-cased and joined once per row into one
+  string array (Arrow-backed when pyarrow is installed), so a search is one
+  substring pass
+
+query() ANDs the active filters into one mask and returns the matching rows
+with facet counts per categorical column: the count for each value under
+every *other* active filter, i.e. what selecting it would return.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from rest.dtypes import TEXT
+
+DateBound = Optional[Union[date, datetime, pd.Timestamp]]
+
+# Joins the text columns of a row; can't occur in a lower-cased search term
+_TEXT_SEPARATOR = "\x1f"
+
+
+@dataclass(frozen=True)
+class FilterResult:
+    df: pd.DataFrame
+    mask: np.ndarray
+    count: int
+    facets: Dict[str, Dict[Any, int]]  # column -> {value: count}
+
+
+class FilterEngine:
+    """Precomputed masks and indexes over one (read-only) frame."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        categorical: Sequence[str] = (),
+        dates: Sequence[str] = (),
+        text: Sequence[str] = (),
+    ):
+        self.df = df
+        self._codes: Dict[str, np.ndarray] = {}
+        self._values: Dict[str, List[Any]] = {}
+        self._masks: Dict[str, Dict[Any, np.ndarray]] = {}
+        for column in categorical:
+            if column not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[column], sort=True)  # NA -> -1
+            values = uniques.tolist()
+            self._codes[column] = codes
+            self._values[column] = values
+            self._masks[column] = {
+                value: codes == code for code, value in enumerate(values)
+            }
+
+        self._date_order: Dict[str, np.ndarray] = {}
+        self._date_sorted: Dict[str, np.ndarray] = {}
+        self._missing: Dict[str, np.ndarray] = {}
+        for column in dates:
+            if column not in df.columns:
+                continue
+            values = pd.to_datetime(df[column], errors="coerce").to_numpy(
+                "datetime64[ns]"
+            )
+            missing = np.isnat(values)
+            present = np.flatnonzero(~missing)
+            order = present[np.argsort(values[present], kind="stable")]
+            self._date_order[column] = order
+            self._date_sorted[column] = values[order]
+            self._missing[column] = missing
+
+        self._text: Optional[pd.Series] = None
+        text_columns = [c for c in text if c in df.columns]
+        if text_columns:
+            joined = None
+            for column in text_columns:
+                part = df[column].astype("string").str.lower().fillna("")
+                joined = part if joined is None else joined + _TEXT_SEPARATOR + part
+            self._text = joined.astype(TEXT).reset_index(drop=True)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def values(self, column: str) -> List[Any]:
+        """Sorted distinct non-null values of a categorical column."""
+        return list(self._values.get(column, []))
+
+    # ------------------------------------------------------------------
+    # Single-filter masks
+    # ------------------------------------------------------------------
+
+    def isin_mask(self, column: str, values: Iterable[Any]) -> np.ndarray:
+        """Rows whose `column` is one of `values`."""
+        masks = self._masks.get(column)
+        if masks is None:
+            # Not precomputed (e.g. ItemID from a search): one isin() pass
+            return self.df[column].isin(list(values)).to_numpy(
+                dtype=bool, na_value=False
+            )
+        mask = np.zeros(len(self.df), dtype=bool)
+        for value in values:
+            selected = masks.get(value)
+            if selected is not None:
+                mask |= selected
+        return mask
+
+    def between_mask(
+        self, column: str, start: DateBound, end: DateBound
+    ) -> np.ndarray:
+        """Rows with start <= `column` <= end (either bound may be None)."""
+        ordered = self._date_sorted[column]
+        lo = (
+            np.searchsorted(ordered, np.datetime64(pd.Timestamp(start), "ns"), "left")
+            if start is not None
+            else 0
+        )
+        hi = (
+            np.searchsorted(ordered, np.datetime64(pd.Timestamp(end), "ns"), "right")
+            if end is not None
+            else len(ordered)
+        )
+        mask = np.zeros(len(self.df), dtype=bool)
+        mask[self._date_order[column][lo:hi]] = True
+        return mask
+
+    def missing_mask(self, column: str, missing: bool = True) -> np.ndarray:
+        """Rows where `column` is null (or, with missing=False, not null)."""
+        mask = self._missing.get(column)
+        if mask is None:
+            mask = self.df[column].isna().to_numpy(dtype=bool)
+        return mask if missing else ~mask
+
+    def contains_mask(self, term: str) -> np.ndarray:
+        """Rows where any text column contains `term` (case-insensitive)."""
+        if self._text is None:
+            return np.zeros(len(self.df), dtype=bool)
+        return self._text.str.contains(term.lower(), regex=False).to_numpy(
+            dtype=bool, na_value=False
+        )
+
+    # ------------------------------------------------------------------
+    # Combined query
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        isin: Optional[Mapping[str, Iterable[Any]]] = None,
+        between: Optional[Mapping[str, Tuple[DateBound, DateBound]]] = None,
+        missing: Optional[Mapping[str, bool]] = None,
+        contains: Optional[str] = None,
+        where: Optional[np.ndarray] = None,
+    ) -> FilterResult:
+        """
+        Rows matching every active filter, plus facet counts.
+
+        Args:
+            isin: column -> accepted values; empty or None = no filter
+            between: date column -> (start, end), inclusive, None = open
+            missing: column -> True (must be null) / False (must not be)
+            contains: Substring searched in the text columns
+            where: Extra boolean row mask (e.g. isin_mask("ItemID", ids)
+                   from a server-side search), ANDed like the others
+        """
+        # (column the filter is on, or None) -> mask
+        filters: List[Tuple[Optional[str], np.ndarray]] = []
+        for column, values in (isin or {}).items():
+            values = list(values)
+            if values:
+                filters.append((column, self.isin_mask(column, values)))
+        for column, (start, end) in (between or {}).items():
+            if start is not None or end is not None:
+                filters.append((column, self.between_mask(column, start, end)))
+        for column, is_missing in (missing or {}).items():
+            filters.append((column, self.missing_mask(column, is_missing)))
+        if contains:
+            filters.append((None, self.contains_mask(contains)))
+        if where is not None:
+            filters.append((None, np.asarray(where, dtype=bool)))
+
+        mask = np.ones(len(self.df), dtype=bool)
+        for _, selected in filters:
+            mask &= selected
+
+        facets = {}
+        for column, codes in self._codes.items():
+            others = [m for on, m in filters if on != column]
+            if len(others) == len(filters):
+                scope = mask
+            else:
+                scope = np.ones(len(self.df), dtype=bool)
+                for selected in others:
+                    scope &= selected
+            scoped = codes[scope]
+            counts = np.bincount(
+                scoped[scoped >= 0], minlength=len(self._values[column])
+            )
+            facets[column] = dict(zip(self._values[column], counts.tolist()))
+
+        return FilterResult(
+            df=self.df[mask], mask=mask, count=int(mask.sum()), facets=facets
+        )
@@ -0,0 +1,149 @@
+"""
+ID allocation for Edgewater tables
+
+Most legacy tables (imported from Access) use plain INTEGER primary keys
+without AUTO_INCREMENT, so the API has to hand out IDs itself. Instead of
+scanning the table for MAX(id), IDs are reserved from a counter row in
+T_IdSequences inside a short transaction:
+
+    SELECT NextID FROM T_IdSequences WHERE TableName = :t FOR UPDATE
+    UPDATE T_IdSequences SET NextID = NextID + :n WHERE TableName = :t
+
+The row lock serializes concurrent sessions (and processes), so every caller
+gets a disjoint range. Batch inserts reserve a whole block in one round trip.
+Tables whose key is AUTO_INCREMENT in the schema bypass the allocator and
+let the database assign the ID. Their models mark the key
+autoincrement=True: T_SeasonalNotes, T_Users, T_Passwords,
+T_OrderItemDestination and T_Locations. T_Sun and T_PlantingDestinations are
+AUTO_INCREMENT too but have no table model, so the API never inserts into
+them. None of these have a T_IdSequences counter, and allocate() refuses
+them so the two ID sources can't collide.
+"""
+
+import threading
+from typing import Dict, List, Tuple
+
+from loguru import logger
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from database import get_db_session
+from models import IdSequence
+from rest.query_stats import track_operation
+
+# Deadlocks / lock wait timeouts while two sessions seed the same counter
+_MAX_ATTEMPTS = 3
+
+
+class IdAllocator:
+    """Process-wide allocator that reserves primary key ranges per table."""
+
+    def __init__(self, block_size: int = 1):
+        """
+        Args:
+            block_size: Minimum number of IDs reserved per database round trip.
+                        Values > 1 keep a local block per table so consecutive
+                        single inserts skip the counter update (IDs left unused
+                        when the process exits become gaps, like AUTO_INCREMENT).
+        """
+        self.block_size = max(1, int(block_size))
+        self._blocks: Dict[str, Tuple[int, int]] = {}  # table -> (next, end)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def uses_auto_increment(model_class) -> bool:
+        """True when the model's single-column PK is AUTO_INCREMENT in the schema."""
+        pk_columns = list(model_class.__table__.primary_key.columns)
+        return len(pk_columns) == 1 and pk_columns[0].autoincrement is True
+
+    @track_operation
+    def allocate(self, model_class, id_column: str, count: int = 1) -> List[int]:
+        """Reserve `count` consecutive IDs for `model_class`."""
+        if count < 1:
+            return []
+        table = model_class.__tablename__
+        if self.uses_auto_increment(model_class):
+            raise ValueError(f"{table} IDs are assigned by AUTO_INCREMENT")
+        with self._lock:
+            start, end = self._blocks.get(table, (0, 0))
+            if end - start < count:
+                size = max(count, self.block_size)
+                start = self._reserve(model_class, id_column, size)
+                end = start + size
+            self._blocks[table] = (start + count, end)
+        return list(range(start, start + count))
+
+    @track_operation
+    def resync(self, model_class, id_column: str) -> None:
+        """
+        Move the counter past the table's current MAX(id).
+
+        Needed only when rows were inserted without the allocator (CSV loads,
+        phpMyAdmin). MAX on the primary key is an index lookup, not a scan.
+        """
+        table = model_class.__tablename__
+        seq = IdSequence.__table__
+        with self._lock:
+            self._blocks.pop(table, None)
+            with get_db_session() as session:
+                next_id = self._table_next_id(session, model_class, id_column)
+                current = session.execute(
+                    select(seq.c.NextID)
+                    .where(seq.c.TableName == table)
+                    .with_for_update()
+                ).scalar()
+                if current is None:
+                    session.execute(
+                        insert(seq).values(TableName=table, NextID=next_id)
+                    )
+                elif current < next_id:
+                    session.execute(
+                        update(seq)
+                        .where(seq.c.TableName == table)
+                        .values(NextID=next_id)
+                    )
+        logger.info(f"Resynced ID sequence for {table}")
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _table_next_id(session, model_class, id_column: str) -> int:
+        pk = getattr(model_class, id_column)
+        return int(session.execute(select(func.coalesce(func.max(pk), 0))).scalar()) + 1
+
+    def _reserve(self, model_class, id_column: str, size: int) -> int:
+        """Reserve `size` IDs from T_IdSequences and return the first one."""
+        table = model_class.__tablename__
+        seq = IdSequence.__table__
+
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                with get_db_session() as session:
+                    start = session.execute(
+                        select(seq.c.NextID)
+                        .where(seq.c.TableName == table)
+                        .with_for_update()
+                    ).scalar()
+
+                    if start is None:
+                        # First use of this table: seed from the PK index
+                        start = self._table_next_id(session, model_class, id_column)
+                        session.execute(
+                            insert(seq).values(TableName=table, NextID=start + size)
+                        )
+                    else:
+                        session.execute(
+                            update(seq)
+                            .where(seq.c.TableName == table)
+                            .values(NextID=seq.c.NextID + size)
+                        )
+                return int(start)
+            except (IntegrityError, DBAPIError) as e:
+                # Another session seeded the counter first, or we lost a
+                # deadlock on the gap lock; the retry sees the committed row.
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                logger.warning(
+                    f"Retrying ID reservation for {table} (attempt {attempt}): {e}"
+                )
+        raise RuntimeError(f"Could not reserve IDs for {table}")
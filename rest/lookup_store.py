@@ -0,0 +1,179 @@
+"""
+Process-wide lookup store for Edgewater (Tier 1)
+
+The lookup tables (items, units, locations, ...) used to live in
+@st.cache_data, which pickles the frame once and unpickles a fresh copy on
+every access: a page reading item_type_cache four times per rerun paid for
+four deserializations. The LookupStore hands out the same frame instead:
+
+- One entry per lookup, loaded on first use (single-flight, like the
+  ViewStore) and reloaded on the next access after `ttl_seconds`.
+- Each entry precomputes {id: row position} and {name: id} indexes, so
+  decode/resolve paths don't scan the frame.
+- Frames are shared, so their numpy buffers are made read-only: in-place
+  writes (df.loc[...] = x, df[col].values[...] = x) raise instead of
+  changing every session's data. Adding or replacing columns can't be
+  blocked this way; pages copy() before editing, as with Tier-2 frames.
+- Versions bump on every load and invalidate(), so structures derived from
+  a lookup (EdgewaterAPI.derived) rebuild only when its data changed.
+- A column projection of a lookup is registered as "name:profile" (see
+  EdgewaterAPI._PROFILES) and is invalidated together with "name".
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class LookupEntry:
+    """One immutable snapshot of a lookup table plus its indexes."""
+
+    df: pd.DataFrame
+    version: int
+    loaded_at: datetime
+    expires: float  # time.monotonic() deadline
+    row_of: Dict[Any, int]  # id -> row position
+    id_of: Dict[Any, Any]  # name -> id (first row wins)
+
+
+@dataclass(frozen=True)
+class _Lookup:
+    loader: Callable[[], pd.DataFrame]
+    id_column: str
+    name_column: Optional[str]
+
+
+def freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """Mark the numpy buffers behind `df`'s columns read-only (in place)."""
+    for column in df.columns:
+        array = df[column].array
+        if isinstance(array, pd.arrays.ArrowExtensionArray):
+            continue  # Arrow buffers are immutable already
+        # numpy-backed, masked (Int32/boolean) and categorical arrays
+        for buffer in (
+            getattr(array, "_ndarray", None),
+            getattr(array, "_data", None),
+            getattr(array, "_mask", None),
+            getattr(array, "codes", None),
+        ):
+            # Columns of a consolidated block are views: lock the block
+            while isinstance(buffer, np.ndarray):
+                buffer.flags.writeable = False
+                buffer = buffer.base
+    return df
+
+
+class LookupStore:
+    """Shared, read-only lookup frames with id/name indexes and a TTL."""
+
+    def __init__(self, ttl_seconds: float = 600):
+        self._ttl = ttl_seconds
+        self._lookups: Dict[str, _Lookup] = {}
+        self._entries: Dict[str, LookupEntry] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def register(
+        self,
+        name: str,
+        loader: Callable[[], pd.DataFrame],
+        id_column: str,
+        name_column: Optional[str] = None,
+    ) -> None:
+        self._lookups[name] = _Lookup(loader, id_column, name_column)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._lookups
+
+    def entry(self, name: str) -> LookupEntry:
+        """Current snapshot for `name`, (re)loading it if missing or expired."""
+        entry = self._entries.get(name)
+        if entry is not None and time.monotonic() < entry.expires:
+            return entry
+        with self._load_lock(name):
+            entry = self._entries.get(name)
+            if entry is not None and time.monotonic() < entry.expires:
+                return entry
+            return self._load(name)
+
+    def get(self, name: str) -> pd.DataFrame:
+        return self.entry(name).df
+
+    def row(self, name: str, id_value: Any) -> Optional[pd.Series]:
+        """The row with `id_value` in its id column, or None."""
+        entry = self.entry(name)
+        position = entry.row_of.get(id_value) if id_value is not None else None
+        return entry.df.iloc[position] if position is not None else None
+
+    def id_for(self, name: str, display_name: Any) -> Optional[Any]:
+        """ID of the row whose name column equals `display_name`, or None."""
+        return self.entry(name).id_of.get(display_name)
+
+    def version(self, name: str) -> int:
+        """Current version of `name` (0 = never loaded)."""
+        return self._versions.get(name, 0)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one lookup and its projections (or all); the next access reloads."""
+        with self._lock:
+            names = [
+                n
+                for n in self._entries
+                if name is None or n == name or n.startswith(f"{name}:")
+            ]
+            for n in names:
+                if self._entries.pop(n, None) is not None:
+                    self._versions[n] = self._versions.get(n, 0) + 1
+        logger.info(f"Invalidated lookup store: {name or 'all'}")
+
+    def stats(self) -> List[Dict]:
+        """Rows, version and load time per loaded lookup."""
+        return [
+            {
+                "lookup": name,
+                "rows": len(entry.df),
+                "version": entry.version,
+                "loaded_at": entry.loaded_at,
+            }
+            for name, entry in sorted(self._entries.items())
+        ]
+
+    # ------------------------------------------------------------------
+
+    def _load_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._load_locks.setdefault(name, threading.Lock())
+
+    def _load(self, name: str) -> LookupEntry:
+        lookup = self._lookups[name]
+        df = freeze(lookup.loader())
+        row_of: Dict[Any, int] = {}
+        id_of: Dict[Any, Any] = {}
+        if lookup.id_column in df.columns:
+            ids = df[lookup.id_column].tolist()
+            row_of = {id_value: i for i, id_value in reversed(list(enumerate(ids)))}
+            if lookup.name_column in df.columns:
+                for display_name, id_value in zip(df[lookup.name_column], ids):
+                    if pd.notna(display_name):
+                        id_of.setdefault(display_name, id_value)
+        with self._lock:
+            version = self._versions.get(name, 0) + 1
+            entry = LookupEntry(
+                df=df,
+                version=version,
+                loaded_at=datetime.now(),
+                expires=time.monotonic() + self._ttl,
+                row_of=row_of,
+                id_of=id_of,
+            )
+            self._entries[name] = entry
+            self._versions[name] = version
+        return entry
@@ -0,0 +1,131 @@
+"""
+Keyset paging for the admin grids
+
+The admin CRUD pages and the order tracker's All Items tab used to hand a
+whole table (up to tens of thousands of rows) to st.dataframe /
+st.data_editor, which serializes all of it to Arrow and sends it over the
+websocket on every rerun. EdgewaterAPI.fetch_page() returns one page of a
+filtered view (the same ViewQuery filters as query_view) instead.
+
+Pages are addressed by key, not by OFFSET: the grid remembers the
+(sort value, primary key) of the first and last row it shows, and the next
+page is "rows after the last key" in the sort order, the previous page
+"rows before the first key". With an index on the sort column (which
+implicitly ends in the primary key) every page is a short index range scan,
+however deep into the table it is; OFFSET would read and discard every
+earlier row. That is why only a view's `sort_columns` (indexed) and its
+primary key are accepted as sort keys.
+
+NULL sort values come first ascending and last descending, as MySQL and
+SQLite order them, and the predicates below follow that order.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import Select, and_, or_
+
+from rest.view_query import ViewQuery
+
+# (sort value, primary key) of a row
+PageKey = Tuple[Any, Any]
+
+
+@dataclass(frozen=True)
+class Page:
+    """One page of rows plus the keys to continue from either end."""
+
+    df: pd.DataFrame
+    first_key: Optional[PageKey]
+    last_key: Optional[PageKey]
+    has_prev: bool
+    has_next: bool
+
+
+def sort_keys(spec: ViewQuery) -> List[str]:
+    """Columns a view can be paged by: primary key first, then indexed ones."""
+    table = spec.model.__table__
+    keys = [c.name for c in table.primary_key.columns]
+    return keys + [c for c in spec.sort_columns if c not in keys]
+
+
+def _beyond(column, pk, key: PageKey, descending: bool):
+    """Rows strictly after `key` in (column, pk) order."""
+    value, key_id = key
+    if column is pk:
+        return pk < key_id if descending else pk > key_id
+    if descending:  # values high -> low, then NULLs
+        if value is None:
+            return and_(column.is_(None), pk < key_id)
+        return or_(
+            column < value, and_(column == value, pk < key_id), column.is_(None)
+        )
+    # NULLs, then values low -> high
+    if value is None:
+        return or_(and_(column.is_(None), pk > key_id), column.isnot(None))
+    return or_(column > value, and_(column == value, pk > key_id))
+
+
+def keyset_statement(
+    spec: ViewQuery,
+    stmt: Select,
+    sort: str,
+    descending: bool,
+    after: Optional[PageKey] = None,
+    before: Optional[PageKey] = None,
+    limit: int = 50,
+) -> Select:
+    """
+    `stmt` narrowed to the `limit` rows after `after` (or, with `before`,
+    the `limit` rows preceding it, returned in reverse order).
+    """
+    table = spec.model.__table__
+    if sort not in sort_keys(spec):
+        raise ValueError(f"{table.name} can't be paged by {sort}")
+    column = table.c[sort]
+    pk = list(table.primary_key.columns)[0]
+
+    backwards = before is not None
+    reverse = descending != backwards
+    key = before if backwards else after
+    if key is not None:
+        stmt = stmt.where(_beyond(column, pk, key, reverse))
+    keys = [pk] if column is pk else [column, pk]
+    stmt = stmt.order_by(*(k.desc() if reverse else k.asc() for k in keys))
+    return stmt.limit(limit)
+
+
+def to_page(
+    rows: Sequence[Any],
+    columns: Sequence[str],
+    spec: ViewQuery,
+    sort: str,
+    page_size: int,
+    after: Optional[PageKey] = None,
+    before: Optional[PageKey] = None,
+) -> Page:
+    """
+    Page from the result of keyset_statement(limit=page_size + 1).
+
+    The extra row only tells whether there is more in the direction of
+    travel; the other direction is known from the key we came from.
+    """
+    backwards = before is not None
+    more = len(rows) > page_size
+    rows = list(rows[:page_size])
+    if backwards:
+        rows.reverse()
+
+    pk_name = list(spec.model.__table__.primary_key.columns)[0].name
+    sort_at, pk_at = columns.index(sort), columns.index(pk_name)
+    first_key = (rows[0][sort_at], rows[0][pk_at]) if rows else None
+    last_key = (rows[-1][sort_at], rows[-1][pk_at]) if rows else None
+
+    return Page(
+        df=pd.DataFrame(rows, columns=list(columns)),
+        first_key=first_key,
+        last_key=last_key,
+        has_prev=more if backwards else after is not None,
+        has_next=True if backwards else more,
+    )
@@ -0,0 +1,216 @@
+"""
+SQL query instrumentation for Edgewater
+
+SQLAlchemy engine events time every statement and record it in a bounded,
+process-wide ring buffer:
+
+- statement text normalized (literals, placeholders and IN-lists collapsed)
+  so repeated queries aggregate under one key,
+- duration, row count,
+- the API operation that issued it (set by @track_operation on EdgewaterAPI
+  methods such as _get_table, _get_by_id, _update),
+- the Streamlit page whose rerun triggered it.
+
+QueryStats.summary() turns the buffer into per-statement aggregates
+(count, total, p50/p95/max) for the admin landing page. Statements slower
+than SLOW_QUERY_MS are also written to LOG_FILE.
+"""
+
+import functools
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import event
+
+_operation: ContextVar[str] = ContextVar("edgewater_query_operation", default="-")
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(r"'(?:[^'\\]|\\.|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDERS = re.compile(r"%\(\w+\)s|%s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_ROWS = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_statement(statement: str) -> str:
+    """Collapse a SQL statement to its shape: values and list lengths removed."""
+    text = _WHITESPACE.sub(" ", statement).strip()
+    text = _LITERALS.sub("?", text)
+    text = _PLACEHOLDERS.sub("?", text)
+    text = _PLACEHOLDER_LIST.sub("(?)", text)
+    return _REPEATED_ROWS.sub(r"\1, ...", text)
+
+
+def track_operation(func: Callable) -> Callable:
+    """Attribute queries run inside `func` to it (innermost decorated call wins)."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _operation.set(func.__name__)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _operation.reset(token)
+
+    return wrapper
+
+
+_page_names: Dict[str, str] = {}
+
+
+def _current_page() -> str:
+    """Name of the Streamlit page being rerun on this thread, or "-"."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is None:
+            return "-"
+        page_hash = ctx.page_script_hash
+        name = _page_names.get(page_hash)
+        if name is None:
+            info = ctx.pages_manager.get_pages().get(page_hash) or {}
+            name = info.get("page_name") or Path(ctx.main_script_path).stem
+            _page_names[page_hash] = name
+        return name
+    except Exception:
+        return "-"
+
+
+class QueryStats:
+    """Ring buffer of executed statements plus aggregate views over it."""
+
+    def __init__(self, max_entries: int = 5000, slow_query_ms: float = 250.0):
+        self.slow_query_ms = slow_query_ms
+        # (time, normalized sql, ms, rows, operation, page)
+        self._entries: Deque[Tuple[datetime, str, float, Optional[int], str, str]] = (
+            deque(maxlen=max_entries)
+        )
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        statement: str,
+        duration_ms: float,
+        rows: Optional[int],
+        operation: str,
+        page: str,
+    ) -> None:
+        """Add one executed statement; log it if it was slow."""
+        normalized = normalize_statement(statement)
+        with self._lock:
+            self._entries.append(
+                (datetime.now(), normalized, duration_ms, rows, operation, page)
+            )
+        if duration_ms >= self.slow_query_ms:
+            logger.bind(slow_query=True).warning(
+                f"Slow query {duration_ms:.0f} ms [{operation} @ {page}] "
+                f"rows={rows}: {normalized[:500]}"
+            )
+
+    def entries(self) -> pd.DataFrame:
+        """Raw buffer contents, oldest first."""
+        with self._lock:
+            entries = list(self._entries)
+        return pd.DataFrame(
+            entries,
+            columns=["Time", "Statement", "Duration (ms)", "Rows", "Operation", "Page"],
+        )
+
+    def summary(self, top_n: int = 20, sort_by: str = "p95 (ms)") -> pd.DataFrame:
+        """
+        Per-statement aggregates over the buffer.
+
+        Args:
+            sort_by: Any output column, e.g. "p95 (ms)", "Total (ms)", "Count"
+        """
+        df = self.entries()
+        if df.empty:
+            return pd.DataFrame()
+        durations = df.groupby("Statement")["Duration (ms)"]
+        summary = pd.DataFrame(
+            {
+                "Count": durations.size(),
+                "Total (ms)": durations.sum(),
+                "Mean (ms)": durations.mean(),
+                "p50 (ms)": durations.quantile(0.5),
+                "p95 (ms)": durations.quantile(0.95),
+                "Max (ms)": durations.max(),
+                "Rows (avg)": df.groupby("Statement")["Rows"].mean(),
+                "Operations": df.groupby("Statement")["Operation"].agg(_joined),
+                "Pages": df.groupby("Statement")["Page"].agg(_joined),
+            }
+        ).reset_index()
+        return (
+            summary.sort_values(sort_by, ascending=False)
+            .head(top_n)
+            .round(1)
+            .reset_index(drop=True)
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _joined(values: pd.Series) -> str:
+    return ", ".join(values.value_counts().index[:3])
+
+
+_installed: set = set()
+
+
+def instrument_engine(
+    engine, stats: QueryStats, log_file: Optional[Path] = None
+) -> None:
+    """Hook `stats` into `engine` (idempotent) and route slow queries to log_file."""
+    if id(engine) in _installed:
+        return
+    _installed.add(id(engine))
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        if context is not None:
+            context._edgewater_query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        start = getattr(context, "_edgewater_query_start", None)
+        if start is None:
+            return
+        rowcount = getattr(cursor, "rowcount", -1)
+        stats.record(
+            statement,
+            (time.perf_counter() - start) * 1000,
+            rowcount if rowcount is not None and rowcount >= 0 else None,
+            _operation.get(),
+            _current_page(),
+        )
+
+    if log_file is not None:
+        try:
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+            logger.add(
+                str(log_file),
+                filter=lambda record: "slow_query" in record["extra"],
+                rotation="10 MB",
+                retention=5,
+            )
+        except Exception as e:
+            logger.warning(f"Could not open slow-query log {log_file}: {e}")
+    logger.info(f"Query instrumentation enabled (slow >= {stats.slow_query_ms} ms)")
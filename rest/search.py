@@ -0,0 +1,150 @@
+"""
+Server-side item search
+
+Item search used to scan the cached item/label frames in pandas on every
+rerun. search_items() asks the database instead, so its cost depends on
+the index, not on how much a session has cached:
+
+- MySQL: T_Items.SearchText is a stored generated column (Item, Variety,
+  Color and LabelDescription) with an n-gram FULLTEXT index
+  (ft_Items_SearchText, see CreateSchema.sql / Relationships.sql). Each
+  search word becomes a required phrase in BOOLEAN MODE, which with the
+  n-gram parser behaves like a substring match, and MATCH() is the rank.
+- Other dialects (the SQLite benchmark databases), and words shorter than
+  an n-gram: a case-insensitive LIKE per word over the same columns,
+  ordered by name.
+
+SearchText isn't mapped on the Item model, so it never reaches the cached
+item frames or the write plans; the database maintains it.
+"""
+
+import re
+from typing import List, Optional, Union
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import desc, false, func, literal, literal_column, or_, select
+from sqlalchemy.dialects.mysql import match
+
+from database import get_db_session
+from models import Item, ItemType
+from rest.query_stats import track_operation
+
+# MySQL's default ngram_token_size: shorter words can't hit the FULLTEXT index
+NGRAM_TOKEN_SIZE = 2
+
+RESULT_COLUMNS = [
+    "ItemID",
+    "Item",
+    "Variety",
+    "Color",
+    "TypeID",
+    "Type",
+    "SunConditions",
+    "LabelDescription",
+    "Inactive",
+    "ShouldStock",
+    "Score",
+]
+
+_WORD = re.compile(r"\w+")
+_SEARCH_TEXT = literal_column("`T_Items`.`SearchText`")
+
+
+def search_terms(query: str) -> List[str]:
+    """Lower-cased words of `query`; FULLTEXT operators and quotes are dropped."""
+    return _WORD.findall((query or "").lower())
+
+
+def search_statement(
+    terms: List[str],
+    item_type: Optional[Union[str, int]] = None,
+    active_only: bool = True,
+    limit: Optional[int] = 50,
+    dialect: str = "mysql",
+):
+    """SELECT for items matching every term, best match first."""
+    items = Item.__table__
+    types = ItemType.__table__
+    stmt = select(
+        items.c.ItemID,
+        items.c.Item,
+        items.c.Variety,
+        items.c.Color,
+        items.c.TypeID,
+        types.c.Type,
+        items.c.SunConditions,
+        items.c.LabelDescription,
+        items.c.Inactive,
+        items.c.ShouldStock,
+    ).select_from(items.outerjoin(types, types.c.TypeID == items.c.TypeID))
+
+    if dialect == "mysql" and min(map(len, terms)) >= NGRAM_TOKEN_SIZE:
+        score = match(
+            _SEARCH_TEXT, against=" ".join(f'+"{term}"' for term in terms)
+        ).in_boolean_mode()
+        stmt = (
+            stmt.add_columns(score.label("Score"))
+            .where(score)
+            .order_by(desc("Score"), items.c.Item, items.c.Variety)
+        )
+    else:
+        text = func.lower(
+            func.coalesce(items.c.Item, "")
+            + " "
+            + func.coalesce(items.c.Variety, "")
+            + " "
+            + func.coalesce(items.c.Color, "")
+            + " "
+            + func.coalesce(items.c.LabelDescription, "")
+        )
+        for term in terms:
+            stmt = stmt.where(text.contains(term, autoescape=True))
+        stmt = stmt.add_columns(literal(0.0).label("Score")).order_by(
+            items.c.Item, items.c.Variety
+        )
+
+    if item_type is not None:
+        if isinstance(item_type, str):
+            stmt = stmt.where(types.c.Type == item_type)
+        else:
+            stmt = stmt.where(items.c.TypeID == int(item_type))
+    if active_only:
+        stmt = stmt.where(
+            or_(items.c.Inactive.is_(None), items.c.Inactive == false())
+        )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+@track_operation
+def search_items(
+    query: str,
+    item_type: Optional[Union[str, int]] = None,
+    active_only: bool = True,
+    limit: Optional[int] = 50,
+) -> pd.DataFrame:
+    """
+    Items matching every word of `query`, ranked (RESULT_COLUMNS).
+
+    Args:
+        item_type: Type name or TypeID to restrict to (None = all types)
+        active_only: Skip items flagged Inactive
+        limit: Maximum rows returned (None = all matches)
+    """
+    terms = search_terms(query)
+    if not terms:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    try:
+        with get_db_session() as session:
+            dialect = session.get_bind().dialect.name
+            result = session.execute(
+                search_statement(terms, item_type, active_only, limit, dialect)
+            )
+            df = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+        logger.debug(f"Item search {terms!r}: {len(df)} matches")
+        return df
+    except Exception as e:
+        logger.error(f"Error searching items for {query!r}: {e}")
+        return pd.DataFrame(columns=RESULT_COLUMNS)
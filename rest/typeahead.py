@@ -0,0 +1,154 @@
+"""
+Typeahead index for the item pickers
+
+Built once from the item cache and shared by every session (see
+EdgewaterAPI.item_typeahead), so pickers neither scan the item frame
+nor rebuild their labels on each rerun:
+
+- labels: "Item - Variety (Color)" per item, precomputed and sorted; the
+  form selectboxes use `options` / `id_for()` (or `item_ids` with
+  `label_for()` as format_func) directly
+- tokens: normalized words (lower-case, accents stripped) of Item, Variety
+  and Color in a sorted vocabulary. Postings are stored flat per token, in
+  vocabulary order, so all tokens sharing a prefix are one contiguous slice
+  (a flattened prefix trie): a query word is two bisects and a slice.
+
+search() requires every query word to prefix some token of the item
+("tom che" -> Tomato - Cherry ...); items whose name starts with the first
+word rank first, then alphabetical by label.
+"""
+
+import bisect
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+_TOKEN = re.compile(r"\w+")
+_MAX_CHAR = "\U0010ffff"
+
+
+def normalize(text: str) -> str:
+    """Lower-case `text` with accents stripped ("Rosé" -> "rose")."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(normalize(text))
+
+
+def item_label(item: str, variety: Optional[str], color: Optional[str]) -> str:
+    """Picker label used across pages: "Item - Variety (Color)"."""
+    label = str(item)
+    if pd.notna(variety) and variety:
+        label += f" - {variety}"
+    if pd.notna(color) and color:
+        label += f" ({color})"
+    return label
+
+
+class ItemTypeahead:
+    """Immutable prefix index over the items that have a name."""
+
+    def __init__(self, items: pd.DataFrame):
+        rows = []
+        if not items.empty:
+            for item_id, item, variety, color, inactive in zip(
+                items["ItemID"],
+                items["Item"],
+                items["Variety"],
+                items["Color"],
+                items["Inactive"],
+            ):
+                if pd.isna(item) or not item:
+                    continue
+                rows.append(
+                    (
+                        item_label(item, variety, color),
+                        int(item_id),
+                        pd.notna(inactive) and bool(inactive),
+                        str(item),
+                        " ".join(str(v) for v in (variety, color) if pd.notna(v)),
+                    )
+                )
+        # Stable: among equal labels the last row wins in id_for(), as the
+        # old label -> ID dicts did
+        rows.sort(key=lambda row: row[0])
+
+        self._labels: List[str] = [row[0] for row in rows]
+        self._ids = np.array([row[1] for row in rows], dtype=np.int64)
+        self._active = ~np.array([row[2] for row in rows], dtype=bool)
+        ids = self._ids.tolist()
+        self.item_ids: List[int] = ids
+        self._id_by_label: Dict[str, int] = dict(zip(self._labels, ids))
+        self._label_by_id: Dict[int, str] = dict(zip(ids, self._labels))
+        self.options: List[str] = list(self._id_by_label)
+
+        postings: Dict[str, set] = {}
+        name_tokens = []
+        for position, (_, _, _, name, rest) in enumerate(rows):
+            tokens = tokenize(name)
+            name_tokens.append(tokens[0] if tokens else None)
+            for token in tokens + tokenize(rest):
+                postings.setdefault(token, set()).add(position)
+
+        self._vocab: List[str] = sorted(postings)
+        lengths = [len(postings[token]) for token in self._vocab]
+        self._offsets = np.zeros(len(self._vocab) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self._offsets[1:])
+        self._postings = np.fromiter(
+            (p for token in self._vocab for p in sorted(postings[token])),
+            dtype=np.int64,
+            count=int(self._offsets[-1]),
+        )
+        token_index = {token: i for i, token in enumerate(self._vocab)}
+        # Vocabulary index of each item's first name token (-1: none)
+        self._first_token = np.array(
+            [token_index.get(token, -1) for token in name_tokens], dtype=np.int64
+        )
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def id_for(self, label: str) -> Optional[int]:
+        return self._id_by_label.get(label)
+
+    def label_for(self, item_id: int) -> Optional[str]:
+        return self._label_by_id.get(int(item_id))
+
+    def _prefix_range(self, word: str) -> Tuple[int, int]:
+        return (
+            bisect.bisect_left(self._vocab, word),
+            bisect.bisect_left(self._vocab, word + _MAX_CHAR),
+        )
+
+    def search(
+        self, query: str, k: int = 20, active_only: bool = False
+    ) -> List[Tuple[int, str]]:
+        """Top `k` (ItemID, label) pairs whose tokens prefix-match every word."""
+        words = tokenize(query or "")
+        if not words:
+            return []
+        candidates = None
+        first_range = None
+        for word in words:
+            lo, hi = self._prefix_range(word)
+            if lo == hi:
+                return []
+            first_range = first_range or (lo, hi)
+            hits = np.unique(self._postings[self._offsets[lo] : self._offsets[hi]])
+            candidates = (
+                hits
+                if candidates is None
+                else np.intersect1d(candidates, hits, assume_unique=True)
+            )
+        if active_only:
+            candidates = candidates[self._active[candidates]]
+
+        first = self._first_token[candidates]
+        starts = (first >= first_range[0]) & (first < first_range[1])
+        ranked = np.concatenate([candidates[starts], candidates[~starts]])[:k]
+        return [(int(self._ids[p]), self._labels[p]) for p in ranked]
@@ -0,0 +1,224 @@
+"""
+Filter pushdown for the tracker views
+
+The tracker pages load a whole view and filter it in pandas (see
+rest/filter_engine.py), which is the right trade-off while the view fits
+comfortably in the process. EdgewaterAPI.query_view() is the alternative
+for when it doesn't: the page's sidebar state becomes one parameterized
+SELECT with WHERE / ORDER BY / LIMIT / OFFSET, so only the visible page of
+rows leaves the database.
+
+Each view's filters are declared once as a ViewQuery (EdgewaterAPI
+._VIEW_QUERIES):
+
+- isin: filter argument -> view column ("types" -> Type); an empty list is
+  no filter, as with the sidebar multiselects
+- at_least: filter argument -> column it is a lower bound for
+  ("min_price" -> UnitPrice); None is no filter
+- date_column: the column date_from / date_to bound (inclusive)
+- search: "items" runs the item search (rest/search.py) as an ItemID
+  subquery, so the FULLTEXT index does the matching; a tuple of columns is
+  a case-insensitive substring match on any of them
+- statuses: status name -> predicate, for the sidebar status selectbox
+- order_by: default ordering; the primary key is always appended so LIMIT /
+  OFFSET pages are stable
+- sort_columns: indexed columns the paged grids may sort on (keyset paging,
+  rest/paging.py); the primary key always can
+
+aggregate_statement() evaluates sidebar metrics (row counts, sums, distinct
+counts, null / flag counts) over the same filtered SELECT, so metric tiles
+don't need the view loaded either (EdgewaterAPI.aggregate_view).
+
+Supporting indexes on the date columns are in Relationships.sql.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from sqlalchemy import Select, case, false, func, or_, select, true
+
+from rest.search import search_statement, search_terms
+
+ITEM_SEARCH = "items"
+
+
+@dataclass(frozen=True)
+class ViewQuery:
+    """Pushdown filters available on one view."""
+
+    model: Any
+    isin: Dict[str, str] = field(default_factory=dict)
+    at_least: Dict[str, str] = field(default_factory=dict)
+    date_column: Optional[str] = None
+    search: Union[str, Tuple[str, ...], None] = None
+    # status name -> f(view columns) -> WHERE clause
+    statuses: Dict[str, Callable[[Any], Any]] = field(default_factory=dict)
+    order_by: Tuple[str, ...] = ()  # "-Column" = descending
+    sort_columns: Tuple[str, ...] = ()
+
+
+def _order_clause(columns, name: str):
+    descending = name.startswith("-")
+    column_name = name.lstrip("-")
+    if column_name not in columns:
+        raise ValueError(f"Unknown order_by column: {column_name}")
+    column = columns[column_name]
+    return column.desc() if descending else column.asc()
+
+
+def filtered_statement(
+    spec: ViewQuery,
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[Union[date, datetime]] = None,
+    date_to: Optional[Union[date, datetime]] = None,
+    dialect: str = "mysql",
+    **filters: Any,
+) -> Select:
+    """SELECT of the view's columns with every active filter as WHERE."""
+    table = spec.model.__table__
+    columns = table.c
+    stmt = select(*table.columns)
+
+    for name, value in filters.items():
+        if name in spec.isin:
+            values = list(value or [])
+            if values:
+                stmt = stmt.where(columns[spec.isin[name]].in_(values))
+        elif name in spec.at_least:
+            if value is not None:
+                stmt = stmt.where(columns[spec.at_least[name]] >= value)
+        else:
+            raise ValueError(f"{table.name} has no '{name}' filter")
+
+    if date_from is not None or date_to is not None:
+        if spec.date_column is None:
+            raise ValueError(f"{table.name} has no date filter")
+        date_column = columns[spec.date_column]
+        if date_from is not None:
+            stmt = stmt.where(date_column >= _as_datetime(date_from))
+        if date_to is not None:
+            stmt = stmt.where(date_column <= _as_datetime(date_to))
+
+    if status:
+        if status not in spec.statuses:
+            raise ValueError(f"{table.name} has no status '{status}'")
+        stmt = stmt.where(spec.statuses[status](columns))
+
+    terms = search_terms(search) if search else []
+    if terms:
+        if not spec.search:
+            raise ValueError(f"{table.name} has no search")
+        if spec.search == ITEM_SEARCH:
+            matches = search_statement(
+                terms, active_only=False, limit=None, dialect=dialect
+            ).subquery()
+            stmt = stmt.where(columns.ItemID.in_(select(matches.c.ItemID)))
+        else:
+            # Whole search string, as the page's pandas filter matched it
+            needle = search.lower()
+            stmt = stmt.where(
+                or_(
+                    *(
+                        func.lower(func.coalesce(columns[c], "")).contains(
+                            needle, autoescape=True
+                        )
+                        for c in spec.search
+                    )
+                )
+            )
+    return stmt
+
+
+def ordered_statement(
+    spec: ViewQuery,
+    stmt: Select,
+    order_by: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Select:
+    """`stmt` with ORDER BY (plus primary-key tie-break), LIMIT and OFFSET."""
+    table = spec.model.__table__
+    names = list(order_by) if order_by is not None else list(spec.order_by)
+    key_names = [c.name for c in table.primary_key.columns]
+    names += [k for k in key_names if k not in {n.lstrip("-") for n in names}]
+    stmt = stmt.order_by(*(_order_clause(table.c, name) for name in names))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    if offset:
+        stmt = stmt.offset(offset)
+    return stmt
+
+
+def count_statement(stmt: Select, distinct: Optional[str] = None) -> Select:
+    """COUNT(*) of `stmt`'s rows, or COUNT(DISTINCT column) if given."""
+    rows = stmt.subquery()
+    if distinct is None:
+        return select(func.count()).select_from(rows)
+    return select(func.count(rows.c[distinct].distinct()))
+
+
+# Metric functions for aggregate_statement(): name -> f(column) -> SQL
+AGGREGATES: Dict[str, Callable[[Any], Any]] = {
+    "count": lambda c: func.count(c),  # non-null values
+    "sum": lambda c: func.sum(c),
+    "nunique": lambda c: func.count(c.distinct()),
+    "min": lambda c: func.min(c),
+    "max": lambda c: func.max(c),
+    "null": lambda c: func.sum(case((c.is_(None), 1), else_=0)),
+    "true": lambda c: func.sum(case((c == true(), 1), else_=0)),
+    "false": lambda c: func.sum(case((c == false(), 1), else_=0)),
+}
+
+# Metrics that count rows: 0 rather than NULL when nothing matches
+_COUNTING = {"count", "sum", "nunique", "null", "true", "false"}
+
+Metric = Union[str, Tuple[str, str]]
+
+
+def aggregate_statement(stmt: Select, metrics: Mapping[str, Metric]) -> Select:
+    """
+    One-row SELECT of `metrics` over `stmt`'s rows.
+
+    A metric is "rows" (COUNT(*)) or (function, column) with a function
+    from AGGREGATES, e.g. {"pending": ("null", "DateReceived")}.
+    """
+    rows = stmt.subquery()
+    columns = []
+    for name, metric in metrics.items():
+        if metric == "rows":
+            columns.append(func.count().label(name))
+            continue
+        function, column = metric
+        if function not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {function}")
+        if column not in rows.c:
+            raise ValueError(f"Unknown aggregate column: {column}")
+        columns.append(AGGREGATES[function](rows.c[column]).label(name))
+    return select(*columns).select_from(rows)
+
+
+def aggregate_values(metrics: Mapping[str, Metric], row) -> Dict[str, Any]:
+    """Result row of aggregate_statement() as {metric: value}."""
+    values = {}
+    for name, metric in metrics.items():
+        value = row._mapping[name]
+        counting = metric == "rows" or metric[0] in _COUNTING
+        values[name] = value if value is not None or not counting else 0
+    return values
+
+
+def _as_datetime(value: Union[date, datetime]) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, datetime.min.time())
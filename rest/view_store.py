@@ -0,0 +1,217 @@
+"""
+Process-wide view store for Edgewater
+
+Tier-2 view and table caches used to be loaded into each user's
+st.session_state, so ten logged-in sessions meant ten copies of the orders
+view and ten database loads. The ViewStore keeps one copy per process that
+every session reads from:
+
+- Entries are versioned. Each load or refresh bumps the key's version so a
+  session can tell when structures it derived (summaries, indexes) are stale.
+- Loads are single-flight: when several sessions ask for a cold key at once,
+  one runs the query and the others wait for its result.
+- Stored frames are shared and must be treated as read-only. Pages copy
+  before modifying (they already do for working sets and editors).
+- Each entry records the change-journal watermark it reflects, so a refresh
+  can merge only the rows changed since (see EdgewaterAPI.refresh_view_cache).
+- Partial updates (delta refreshes, write-through patches) publish a patched
+  copy plus the entity keys they touched. changes_since() lets a session
+  update its derived structures for just those keys instead of rebuilding.
+
+Sessions keep only their own filter state and working sets.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
+
+import pandas as pd
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class ViewEntry:
+    """One immutable snapshot of a cached view or table."""
+
+    df: pd.DataFrame
+    version: int
+    loaded_at: datetime
+    watermark: Optional[int] = None  # last T_ChangeJournal.ChangeID included
+    changed_keys: Optional[FrozenSet[Any]] = None  # None = full (re)load
+
+
+# Per-key version history kept for changes_since()
+_HISTORY_LENGTH = 64
+
+
+class ViewStore:
+    """Versioned, read-only DataFrame cache shared by every session."""
+
+    def __init__(self, watermark: Optional[Callable[[], Optional[int]]] = None):
+        """
+        Args:
+            watermark: Returns the current change-journal position. Read just
+                       before every full load, so changes committed while the
+                       load runs are replayed by the next delta refresh.
+        """
+        self._watermark = watermark
+        self._entries: Dict[str, ViewEntry] = {}
+        self._versions: Dict[str, int] = {}
+        self._history: Dict[str, Deque[Tuple[int, Optional[FrozenSet[Any]]]]] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, key: str, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the shared frame for `key`, loading it once if missing."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry.df
+        with self._load_lock(key):
+            # Another session may have finished the load while we waited
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry.df
+            mark = self._current_watermark()
+            entry = self._store(key, loader(), mark)
+            logger.info(
+                f"Loaded {key} into view store ({len(entry.df)} rows, v{entry.version})"
+            )
+            return entry.df
+
+    def refresh(self, key: str, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Reload `key` for every session and bump its version."""
+        with self._load_lock(key):
+            mark = self._current_watermark()
+            return self._store(key, loader(), mark).df
+
+    def update(
+        self,
+        key: str,
+        fn: Callable[
+            [ViewEntry], Tuple[pd.DataFrame, Optional[int], Optional[Set[Any]]]
+        ],
+    ) -> pd.DataFrame:
+        """
+        Replace `key` with fn(current_entry) while holding its load lock.
+
+        fn returns (df, watermark, changed_keys) and must not modify the
+        current frame (copy, patch, return the copy). Returning the current
+        frame unchanged only advances the watermark; a new frame is published
+        as a new version. changed_keys=None marks a full reload.
+        """
+        with self._load_lock(key):
+            entry = self._entries.get(key)
+            if entry is None:
+                raise KeyError(key)
+            df, mark, changed = fn(entry)
+            if df is entry.df:
+                with self._lock:
+                    self._entries[key] = ViewEntry(
+                        df=entry.df,
+                        version=entry.version,
+                        loaded_at=entry.loaded_at,
+                        watermark=mark,
+                        changed_keys=entry.changed_keys,
+                    )
+                return df
+            return self._store(key, df, mark, changed).df
+
+    def put(self, key: str, df: pd.DataFrame, watermark: Optional[int] = None) -> int:
+        """Publish a replacement frame for `key`. Returns the new version."""
+        return self._store(key, df, watermark).version
+
+    def entry(self, key: str) -> Optional[ViewEntry]:
+        """Current snapshot for `key`, or None if it has not been loaded."""
+        return self._entries.get(key)
+
+    def version(self, key: str) -> int:
+        """Current version of `key` (0 = never loaded)."""
+        return self._versions.get(key, 0)
+
+    def changes_since(self, key: str, version: int) -> Optional[Set[Any]]:
+        """
+        Entity keys changed between `version` and the current version.
+
+        Returns an empty set when nothing changed, and None when the caller
+        must rebuild from scratch (a full reload happened in between, or the
+        version is older than the retained history).
+        """
+        with self._lock:
+            current = self._versions.get(key, 0)
+            if version == current:
+                return set()
+            history = {v: keys for v, keys in self._history.get(key, ())}
+        changed: Set[Any] = set()
+        for v in range(version + 1, current + 1):
+            if v not in history or history[v] is None:
+                return None
+            changed.update(history[v])
+        return changed
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one key (or all keys); the next reader reloads it."""
+        with self._lock:
+            keys = [key] if key is not None else list(self._entries)
+            for k in keys:
+                if self._entries.pop(k, None) is not None:
+                    version = self._versions.get(k, 0) + 1
+                    self._versions[k] = version
+                    self._history.setdefault(
+                        k, deque(maxlen=_HISTORY_LENGTH)
+                    ).append((version, None))
+        logger.info(f"Invalidated view store: {key or 'all'}")
+
+    def stats(self) -> List[Dict]:
+        """Rows, version and memory footprint per loaded key."""
+        return [
+            {
+                "key": key,
+                "rows": len(entry.df),
+                "version": entry.version,
+                "loaded_at": entry.loaded_at,
+                "memory_mb": entry.df.memory_usage(deep=True).sum() / 1024 / 1024,
+            }
+            for key, entry in sorted(self._entries.items())
+        ]
+
+    # ------------------------------------------------------------------
+
+    def _load_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._load_locks.setdefault(key, threading.Lock())
+
+    def _current_watermark(self) -> Optional[int]:
+        if self._watermark is None:
+            return None
+        try:
+            return self._watermark()
+        except Exception as e:
+            # No journal (older schema): entries just always reload in full
+            logger.warning(f"Could not read change-journal watermark: {e}")
+            return None
+
+    def _store(
+        self,
+        key: str,
+        df: pd.DataFrame,
+        watermark: Optional[int] = None,
+        changed_keys: Optional[Set[Any]] = None,
+    ) -> ViewEntry:
+        changed = frozenset(changed_keys) if changed_keys is not None else None
+        with self._lock:
+            version = self._versions.get(key, 0) + 1
+            entry = ViewEntry(
+                df=df,
+                version=version,
+                loaded_at=datetime.now(),
+                watermark=watermark,
+                changed_keys=changed,
+            )
+            self._entries[key] = entry
+            self._versions[key] = version
+            self._history.setdefault(key, deque(maxlen=_HISTORY_LENGTH)).append(
+                (version, changed)
+            )
+        return entry